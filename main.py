@@ -7,7 +7,9 @@ Main entry point for the game
 import pygame
 import asyncio
 import sys
+import time
 from src.core.game import Game
+from src.utils.event_log import event_log
 
 # Variable global para el juego
 game = None
@@ -16,11 +18,8 @@ game = None
 waiting_for_start = True
 audio_initialized = False
 
-async def show_start_screen(screen, clock, config):
-    """Muestra la pantalla de inicio y espera a que el usuario presione espacio"""
-    global waiting_for_start, audio_initialized
-    
-    # Cargar imagen de fondo
+def load_start_background(config):
+    """Carga la imagen de fondo de la pantalla de inicio, o None si no está disponible"""
     try:
         background_image = pygame.image.load("assets/images/start_screen.png")
         background_image = pygame.transform.scale(background_image, (config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
@@ -28,15 +27,14 @@ async def show_start_screen(screen, clock, config):
     except Exception as e:
         print(f"Error loading background image: {e}")
         background_image = None
+    return background_image
+
+async def show_start_screen(screen, clock, config, background_image):
+    """Muestra la pantalla de inicio y espera a que el usuario presione espacio"""
+    global waiting_for_start, audio_initialized
     
-    # Crear fuente para el texto
-    try:
-        font_medium = pygame.font.Font(None, 36)
-    except:
-        font_medium = pygame.font.SysFont("Arial", 36)
-    
-    # Texto de inicio
-    start_text = font_medium.render("Presiona ESPACIO para comenzar", True, (255, 255, 255))
+    # Texto de inicio, con la fuente compartida de la configuración
+    start_text = config.TEXT_CACHE.render(config.FONT_SCREEN, "Presiona ESPACIO para comenzar", (255, 255, 255))
     
     # Posición del texto
     start_pos = ((config.SCREEN_WIDTH - start_text.get_width()) // 2, config.SCREEN_HEIGHT * 2 // 3)
@@ -96,6 +94,79 @@ async def show_start_screen(screen, clock, config):
     
     return True
 
+async def show_loading_screen(screen, clock, config, background_image, batch):
+    """Muestra el progreso real de carga de los recursos sobre la pantalla de inicio"""
+    # Barra de progreso centrada donde estaba el texto de inicio
+    bar_rect = pygame.Rect(0, 0, config.SCREEN_WIDTH // 2, 16)
+    bar_rect.center = (config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT * 2 // 3)
+    frame_budget = 1.0 / 60
+    
+    while True:
+        frame_start = time.perf_counter()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return False
+        
+        # Guardar las decodificaciones terminadas (sin hilos, cargar hasta agotar el frame)
+        done = batch is None or batch.poll(frame_start + frame_budget)
+        progress = 1.0 if batch is None else batch.progress
+        
+        # Dibujar fondo, barra y porcentaje
+        if background_image:
+            screen.blit(background_image, (0, 0))
+        else:
+            screen.fill((40, 40, 40))
+        pygame.draw.rect(screen, config.UI_BORDER_COLOR, bar_rect, 2)
+        fill_rect = bar_rect.inflate(-6, -6)
+        fill_rect.width = int(fill_rect.width * progress)
+        pygame.draw.rect(screen, config.TEXT_COLOR, fill_rect)
+        loading_text = config.TEXT_CACHE.render(config.FONT_SCREEN, f"Cargando... {int(progress * 100)}%", (255, 255, 255))
+        screen.blit(loading_text, loading_text.get_rect(midbottom=(bar_rect.centerx, bar_rect.top - 10)))
+        pygame.display.flip()
+        
+        if done:
+            return True
+        
+        # Mantener tasa de frames y ceder control al navegador
+        clock.tick(60)
+        await asyncio.sleep(0)
+
+def get_idle_timeout(game, accumulator, tick_time):
+    """Milisegundos reales que el bucle puede dormir hasta el próximo cambio visible, o None si debe dibujar cada frame"""
+    if not game.config.IDLE_RENDERING or game.frame_overlay.visible:
+        return None
+    idle = game.scene_manager.get_idle_timeout()
+    if idle is None:
+        return None
+    
+    # Despertar con tiempo para el tick que cruza el cambio, descontando el tiempo ya acumulado
+    timeout = ((idle // tick_time + 1) * tick_time - accumulator) / game.config.TIME_SCALE
+    if timeout < tick_time:
+        return None
+    return min(timeout, game.config.MAX_IDLE_WAIT)
+
+async def wait_for_events(timeout=None):
+    """Espera hasta que llegue un evento o pase el timeout (None: sin límite) y devuelve los eventos pendientes"""
+    deadline = None if timeout is None else time.perf_counter() + timeout / 1000
+    received = []
+    while True:
+        remaining = None if deadline is None else deadline - time.perf_counter()
+        if remaining is not None and remaining <= 0:
+            return received + pygame.event.get()
+        if sys.platform == "emscripten":
+            # En el navegador bloquear congelaría la pestaña: ceder el control en porciones cortas
+            await asyncio.sleep(0.05 if remaining is None else min(remaining, 0.05))
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait() if remaining is None else pygame.event.wait(max(1, int(remaining * 1000)))
+            events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+        
+        # El movimiento del ratón no cambia nada en pantalla: seguir esperando
+        received += events
+        if any(event.type != pygame.MOUSEMOTION for event in events):
+            return received
+
 async def main():
     """Main function to initialize and run the game"""
     global game, waiting_for_start, audio_initialized
@@ -115,7 +186,8 @@ async def main():
     pygame.display.set_caption("Sobrecarga de Óxido")
     
     # Mostrar pantalla de inicio y esperar a que el usuario presione espacio
-    if not await show_start_screen(screen, clock, config):
+    background_image = load_start_background(config)
+    if not await show_start_screen(screen, clock, config, background_image):
         return 0
     
     # Inicializar audio si no se ha hecho ya
@@ -126,45 +198,102 @@ async def main():
         except pygame.error:
             print("Warning: Audio device not available. Running without sound.")
     
-    # Create game
-    game = Game()
+    # Create game; its first scene is loaded below
+    game = Game(start_scene=None)
     
     # Asegurarse de que el audio esté habilitado en el juego
     game.audio_enabled = audio_initialized
     
+    # Decode the first scene's assets on the loader's threads while showing progress
+    batch = game.scene_manager.start_scene_load("workshop")
+    if not await show_loading_screen(game.screen, clock, config, background_image, batch):
+        return 0
+    game.scene_manager.set_active_scene("workshop")
+    
     # Main game loop for WebAssembly compatibility
+    profiler = game.profiler
+    frame_budget = 1.0 / game.config.FPS
+    tick_time = 1000.0 / game.config.SIMULATION_RATE
+    accumulator = 0.0
+    idle_timeout = None  # Real milliseconds to sleep before the next frame, None to run every frame
+    window_visible = True
     while game.running:
+        # Real time to simulate: the last frame, capped so a stall cannot snowball
+        frame_time = min(game.clock.get_time(), game.config.MAX_FRAME_TIME)
+        
+        # Sleep until input or the next visual change. A hidden window draws nothing but keeps
+        # simulating, waking every MAX_IDLE_WAIT to catch up, so aging runs on while minimized
+        if idle_timeout is not None or not window_visible:
+            events = await wait_for_events(idle_timeout if window_visible else game.config.MAX_IDLE_WAIT)
+            frame_time += game.clock.tick()  # Restart the clock so the wait is not counted twice
+        else:
+            events = pygame.event.get()
+        
+        frame_start = time.perf_counter()
+        profiler.begin_frame(game.scene_manager.active_scene_id)
+        
         # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                game.running = False
-            elif event.type == game.aging_event:
-                game.apply_aging()
-            else:
-                game.scene_manager.handle_event(event)
-        
-        # Update active scene
-        game.scene_manager.update()
-        
-        # Update music volume (fade in)
-        dt = game.clock.get_time()  # Time since last frame in milliseconds
-        game.update_music_volume(dt)
-        
-        # Update celebration animation if active
-        if game.celebrating:
-            current_time = pygame.time.get_ticks()
-            if current_time - game.celebration_timer > game.celebration_interval:
-                game.celebration_frame = (game.celebration_frame % 5) + 1
-                game.celebration_timer = current_time
-                
-                # End celebration after cycling through all frames
-                if game.celebration_frame == 1:
-                    game.celebrating = False
+        with profiler.section("events"):
+            for event in events:
+                if event.type == pygame.QUIT:
+                    game.running = False
+                elif event.type == game.music.end_event:
+                    game.music.handle_event(event)
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F12:
+                    # Write the recent event log for offline inspection
+                    event_log.dump(game.config.LOG_DUMP_FILE)
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    game.frame_overlay.toggle()
+                    game.scene_manager.invalidate()
+                elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+                    # Nothing can be seen: stop drawing until the window is back
+                    window_visible = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN,
+                                    pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED):
+                    # The window contents were lost, present everything again
+                    window_visible = True
+                    game.scene_manager.invalidate()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                    # Start or stop writing per-frame timings to CSV
+                    if profiler.recording:
+                        profiler.stop_recording()
+                    else:
+                        profiler.start_recording(game.config.FRAME_TIMING_FILE)
+                else:
+                    game.scene_manager.handle_event(event)
         
-        # Draw active scene
-        game.screen.fill((0, 0, 0))
-        game.scene_manager.draw(game.screen)
-        pygame.display.flip()
+        # Simulate as many fixed ticks as the elapsed, scaled time calls for
+        with profiler.section("update"):
+            accumulator += frame_time * game.config.TIME_SCALE
+            while game.running and accumulator >= tick_time:
+                game.step(tick_time)
+                accumulator -= tick_time
+            game.interpolation = accumulator / tick_time
+        
+        # Draw active scene, unless the window cannot be seen. The scene's static layer
+        # covers the whole screen, and a frame where nothing changed is not drawn at all
+        if window_visible:
+            if game.frame_overlay.visible:
+                # The overlay is translucent, so the scene under it is redrawn every frame
+                game.scene_manager.mark_dirty(game.frame_overlay.rect)
+            with profiler.section("draw"):
+                game.scene_manager.draw(game.screen)
+            with profiler.section("overlay"):
+                game.frame_overlay.draw(game.screen)
+            with profiler.section("flip"):
+                dirty_rects = game.scene_manager.take_dirty_rects()
+                if not game.config.DIRTY_RECT_RENDERING or dirty_rects is None:
+                    pygame.display.flip()
+                elif dirty_rects:
+                    # Only present the regions that changed
+                    pygame.display.update(dirty_rects)
+        profiler.end_frame()
+        
+        # Spend what is left of the frame budget preloading the next scene
+        game.scene_manager.preload(frame_start + frame_budget)
+        
+        # A static scene lets the next frame wait for input instead of running at full rate
+        idle_timeout = get_idle_timeout(game, accumulator, tick_time)
         
         # Maintain frame rate
         game.clock.tick(game.config.FPS)
@@ -173,6 +302,7 @@ async def main():
         await asyncio.sleep(0)
     
     # Clean up
+    game.shutdown()
     pygame.quit()
     return 0
 
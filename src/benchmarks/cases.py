@@ -0,0 +1,209 @@
+"""
+Benchmark Cases module - What the benchmark suite measures
+
+Every case is a (name, function, operations) tuple: calling the function
+performs `operations` operations, and the suite reports time per operation.
+Cases that need pygame share one Game created under the SDL dummy drivers.
+"""
+
+import random
+import pygame
+from src.core.resource_manager import ResourceManager
+from src.core.compact_resource_manager import CompactResourceManager
+from src.core.mfu_algorithm import MFUAlgorithm
+from src.entities.resource import Resource, roll_resource_type
+
+# Inventory sizes the inventory cases are run at
+INVENTORY_SIZES = (6, 64, 256)
+
+# Falling resources in the CollectionScene.update cases
+FALLING_COUNTS = (10, 100, 1000, 5000)
+
+# Workload of the inventory cases. This is a copy of the default
+# Config.SPAWN_PROBABILITIES, deliberately not read from Config: results are
+# compared against stored baselines, and a balance change must not show up
+# as a performance regression. Update both sides only with a new baseline.
+RESOURCE_TYPES = ("nut", "circuit", "cell", "core")
+SPAWN_PROBABILITIES = {"nut": 0.5, "circuit": 0.3, "cell": 0.15, "core": 0.05}
+
+# Operations per timed call of the inventory cases
+BATCH = 1000
+
+def random_types(count, seed=0):
+    """Deterministic sequence of spawned resource types"""
+    rng = random.Random(seed)
+    return [roll_resource_type(rng.random(), SPAWN_PROBABILITIES) for _ in range(count)]
+
+def filled_manager(factory, size):
+    """Create a manager and fill every slot with used resources"""
+    manager = factory(size)
+    for resource_type in random_types(size, seed=size):
+        manager.add_resource(resource_type)
+    for i, resource_type in enumerate(random_types(size * 4, seed=size + 1)):
+        manager.use_resource(resource_type, 1 + i % 2)
+    return manager
+
+def inventory_cases(prefix, factory):
+    """
+    Add/use/aging cases of one resource manager implementation
+    
+    Args:
+        prefix (str): Name prefix of the cases
+        factory (callable): Inventory size -> empty manager
+        
+    Returns:
+        list: Benchmark cases
+    """
+    cases = []
+    for size in INVENTORY_SIZES:
+        manager = filled_manager(factory, size)
+        types = random_types(BATCH, seed=2)
+        uses = random_types(BATCH, seed=3)
+        
+        def add(manager=manager, types=types):
+            # The inventory is full, so every add evicts
+            for resource_type in types:
+                manager.add_resource(resource_type)
+        
+        def add_batch(manager=manager, types=types):
+            # Same adds as above in one add_resources call
+            manager.add_resources(types)
+        
+        def use_then_age(manager=manager, uses=uses):
+            # Aging keeps counters below saturation for the next call
+            for resource_type in uses:
+                manager.use_resource(resource_type)
+            manager.apply_aging()
+        
+        def aging(manager=manager):
+            for _ in range(BATCH):
+                manager.apply_aging()
+        
+        cases.append((f"{prefix}.add.{size}", add, BATCH))
+        cases.append((f"{prefix}.add_batch.{size}", add_batch, BATCH))
+        cases.append((f"{prefix}.use.{size}", use_then_age, BATCH))
+        cases.append((f"{prefix}.aging.{size}", aging, BATCH))
+    return cases
+
+def mfu_cases():
+    """MFU eviction: the legacy linear scan and the indexed heap"""
+    cases = []
+    for size in INVENTORY_SIZES:
+        rng = random.Random(size)
+        resources = [Resource(RESOURCE_TYPES[i % 4]) for i in range(size)]
+        for resource in resources:
+            resource.counter = rng.randrange(256)
+        algorithm = MFUAlgorithm()
+        algorithm.reset(resources)
+        updates = [(rng.randrange(size), rng.randrange(256)) for _ in range(BATCH)]
+        
+        def scan(algorithm=algorithm, resources=resources):
+            for _ in range(BATCH):
+                algorithm.get_replacement_index(resources)
+        
+        def heap(algorithm=algorithm, updates=updates):
+            for index, counter in updates:
+                algorithm.update(index, counter)
+                algorithm.peek_victim()
+        
+        cases.append((f"mfu.scan.{size}", scan, BATCH))
+        cases.append((f"mfu.heap_update.{size}", heap, BATCH))
+    return cases
+
+def collection_update_cases(game):
+    """CollectionScene.update with many falling resources"""
+    scene = game.scene_manager.scenes["collection"]
+    cases = []
+    updates = 100
+    for count in FALLING_COUNTS:
+        rng = random.Random(count)
+        # Resources stay above the player and on screen for `updates` frames
+        template = [
+            (RESOURCE_TYPES[i % 4], rng.randint(50, game.config.SCREEN_WIDTH - 80), rng.randint(0, 300))
+            for i in range(count)
+        ]
+        
+        def update(scene=scene, template=template):
+            scene.pool.clear()
+            for resource_type, x, y in template:
+                scene.pool.spawn(resource_type, x, y)
+            scene.spawn_timer = -10 ** 9  # No spawning while measuring
+            for _ in range(updates):
+                scene.update()
+        
+        cases.append((f"collection_scene.update.{count}", update, updates))
+    return cases
+
+def draw_cases(game):
+    """Draw of every scene and UI panel onto the game screen"""
+    surface = game.screen
+    workshop = game.scene_manager.scenes["workshop"]
+    collection = game.scene_manager.scenes["collection"]
+    
+    # Panels need their per-frame state
+    workshop.update()
+    def fill_collection():
+        # The update cases leave their own resources behind
+        collection.pool.clear()
+        for i in range(50):
+            collection.pool.spawn(RESOURCE_TYPES[i % 4], 50 + (i * 37) % 900, (i * 53) % 600)
+    
+    def draws(draw, count=100, setup=None):
+        def run():
+            if setup:
+                setup()
+            for _ in range(count):
+                draw(surface)
+        return run
+    
+    overlay = game.frame_overlay
+    
+    def draw_overlay(surface):
+        overlay.visible = True
+        overlay.draw(surface)
+        overlay.visible = False
+    
+    return [
+        ("draw.workshop_scene", draws(workshop.draw), 100),
+        ("draw.collection_scene", draws(collection.draw, setup=fill_collection), 100),
+        ("draw.inventory_panel", draws(workshop.inventory_panel.draw), 100),
+        ("draw.repair_panel", draws(workshop.repair_panel.draw), 100),
+        ("draw.status_panel", draws(workshop.status_panel.draw), 100),
+        ("draw.frame_timing_overlay", draws(draw_overlay), 100)
+    ]
+
+def create_game():
+    """
+    Create a silent Game for the pygame cases
+    
+    Returns:
+        Game: Game with a full, used inventory
+    """
+    from src.core.game import Game
+    pygame.init()
+    game = Game()
+    game.audio_enabled = False
+    
+    for resource_type in random_types(game.config.INVENTORY_SIZE, seed=4):
+        game.resource_manager.add_resource(resource_type)
+    for resource_type in random_types(12, seed=5):
+        game.resource_manager.use_resource(resource_type)
+    return game
+
+def build_cases():
+    """
+    Build every benchmark case
+    
+    Returns:
+        list: (name, function, operations) tuples
+    """
+    cases = []
+    cases += inventory_cases("resource_manager", lambda size: ResourceManager(size))
+    cases += inventory_cases("resource_manager_lazy", lambda size: ResourceManager(size, lazy_aging=True))
+    cases += inventory_cases("compact_resource_manager", lambda size: CompactResourceManager(size))
+    cases += mfu_cases()
+    
+    game = create_game()
+    cases += collection_update_cases(game)
+    cases += draw_cases(game)
+    return cases
\ No newline at end of file
@@ -0,0 +1,209 @@
+"""
+Benchmark Suite module - Headless benchmarks with a stable JSON format
+
+Runs every case from src/benchmarks/cases.py under the SDL dummy video and
+audio drivers and writes the results as JSON; compare flags cases that got
+slower than a stored baseline:
+    python -m src.benchmarks.suite run --output benchmarks.json
+    python -m src.benchmarks.suite compare baseline.json benchmarks.json
+
+Result format (keys sorted, times in microseconds per operation):
+    {
+      "format": 1,
+      "environment": {"python": ..., "pygame": ..., "platform": ..., "machine": ...},
+      "benchmarks": {
+        "<name>": {"min_us": ..., "median_us": ..., "operations": ..., "loops": ..., "repeat": ...}
+      }
+    }
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+FORMAT_VERSION = 1
+
+def time_loops(func, loops):
+    """Run a function `loops` times with the garbage collector off and return the seconds taken"""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+def measure(func, operations, repeat=5, min_time=0.05):
+    """
+    Time a benchmark function
+    
+    The loop count is doubled until one sample takes at least min_time, then
+    `repeat` samples are taken.
+    
+    Args:
+        func (callable): Function performing `operations` operations per call
+        operations (int): Operations per call
+        repeat (int): Number of samples
+        min_time (float): Minimum seconds per sample
+        
+    Returns:
+        dict: min_us, median_us, operations, loops, repeat
+    """
+    func()  # Warm up caches and lazily created state
+    loops = 1
+    while time_loops(func, loops) < min_time:
+        loops *= 2
+    
+    samples = [time_loops(func, loops) / (loops * operations) * 1e6 for _ in range(repeat)]
+    return {
+        "min_us": round(min(samples), 4),
+        "median_us": round(statistics.median(samples), 4),
+        "operations": operations,
+        "loops": loops,
+        "repeat": repeat
+    }
+
+def environment():
+    """Describe the interpreter and machine the results were taken on"""
+    import pygame
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(str(part) for part in pygame.get_sdl_version()),
+        "platform": platform.platform(),
+        "machine": platform.machine()
+    }
+
+def run_suite(name_filter=None, repeat=5, min_time=0.05):
+    """
+    Run the benchmark cases
+    
+    Args:
+        name_filter (str, optional): Only run cases whose name contains this text
+        repeat (int): Samples per case
+        min_time (float): Minimum seconds per sample
+        
+    Returns:
+        dict: Results in the suite's JSON format
+    """
+    # The dummy drivers must be chosen before pygame creates a window
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from src.benchmarks.cases import build_cases
+    
+    results = {}
+    for name, func, operations in build_cases():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = measure(func, operations, repeat, min_time)
+        print(f"{name:<42} {results[name]['min_us']:>12.3f} us/op", file=sys.stderr)
+    
+    return {"format": FORMAT_VERSION, "environment": environment(), "benchmarks": results}
+
+def write_results(results, path):
+    """Write results as sorted, indented JSON"""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+def load_results(path):
+    """
+    Read a results file
+    
+    Args:
+        path (str): Results file written by run
+        
+    Returns:
+        dict: Results
+    """
+    with open(path, encoding="utf-8") as file:
+        results = json.load(file)
+    if results.get("format") != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark format {results.get('format')}")
+    return results
+
+def compare_results(baseline, current, threshold=0.10, metric="min_us"):
+    """
+    Compare two result sets case by case
+    
+    Args:
+        baseline (dict): Baseline results
+        current (dict): New results
+        threshold (float): Relative slowdown reported as a regression
+        metric (str): "min_us" or "median_us"
+        
+    Returns:
+        list: (name, baseline, current, ratio, status) per case, status being
+            "regression", "improvement", "ok", "new" or "missing"
+    """
+    old = baseline["benchmarks"]
+    new = current["benchmarks"]
+    rows = []
+    for name in sorted(set(old) | set(new)):
+        if name not in old:
+            rows.append((name, None, new[name][metric], None, "new"))
+            continue
+        if name not in new:
+            rows.append((name, old[name][metric], None, None, "missing"))
+            continue
+        before = old[name][metric]
+        after = new[name][metric]
+        ratio = after / before if before else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((name, before, after, ratio, status))
+    return rows
+
+def main():
+    """Run or compare benchmarks from the command line"""
+    parser = argparse.ArgumentParser(description="Headless benchmarks for the game and its MFU core")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    run_parser = commands.add_parser("run", help="run the benchmarks and write JSON results")
+    run_parser.add_argument("--output", default="benchmarks.json", help="results file")
+    run_parser.add_argument("--filter", help="only run cases whose name contains this text")
+    run_parser.add_argument("--repeat", type=int, default=5, help="samples per case")
+    run_parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per sample")
+    
+    compare_parser = commands.add_parser("compare", help="compare results against a baseline")
+    compare_parser.add_argument("baseline", help="baseline results file")
+    compare_parser.add_argument("current", help="new results file")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown that counts as a regression")
+    compare_parser.add_argument("--metric", choices=("min_us", "median_us"), default="min_us", help="statistic to compare")
+    args = parser.parse_args()
+    
+    if args.command == "run":
+        results = run_suite(args.filter, args.repeat, args.min_time)
+        write_results(results, args.output)
+        print(f"Wrote {len(results['benchmarks'])} results to {args.output}", file=sys.stderr)
+        return 0
+    
+    rows = compare_results(load_results(args.baseline), load_results(args.current), args.threshold, args.metric)
+    print(f"{'benchmark':<42} {'baseline':>12} {'current':>12} {'ratio':>8}  status")
+    for name, before, after, ratio, status in rows:
+        before_text = f"{before:.3f}" if before is not None else "-"
+        after_text = f"{after:.3f}" if after is not None else "-"
+        ratio_text = f"{ratio:.2f}x" if ratio is not None else "-"
+        print(f"{name:<42} {before_text:>12} {after_text:>12} {ratio_text:>8}  {status}")
+    
+    regressions = sum(status == "regression" for *_, status in rows)
+    if regressions:
+        print(f"{regressions} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
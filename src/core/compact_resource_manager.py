@@ -0,0 +1,412 @@
+"""
+Compact Resource Manager module - Array-backed inventory storage
+"""
+
+from array import array
+from src.entities.resource import Resource
+
+class ResourceView:
+    """
+    Lightweight stand-in for a Resource stored in a CompactResourceManager
+    
+    A view is bound to a slot, not to a resource, so it always reflects
+    whatever currently occupies that slot.
+    """
+    
+    __slots__ = ("manager", "index")
+    
+    def __init__(self, manager, index):
+        """
+        Initialize a slot view
+        
+        Args:
+            manager (CompactResourceManager): Manager that owns the slot
+            index (int): Slot index
+        """
+        self.manager = manager
+        self.index = index
+    
+    @property
+    def type(self):
+        """Type name of the resource in the slot"""
+        return self.manager.type_names[self.manager.types[self.index]]
+    
+    @property
+    def counter(self):
+        """Usage counter of the resource in the slot"""
+        return self.manager.counters[self.index]
+    
+    @counter.setter
+    def counter(self, value):
+        self.manager.counters[self.index] = min(max(value, 0), self.manager.counter_max)
+    
+    @property
+    def COUNTER_INCREMENT(self):
+        return self.manager.counter_increment
+    
+    @property
+    def COUNTER_MAX(self):
+        return self.manager.counter_max
+    
+    @property
+    def TOXIC_THRESHOLD(self):
+        return self.manager.toxic_threshold
+    
+    def use(self):
+        """
+        Use the resource, increasing its counter
+        
+        Returns:
+            bool: Whether the counter was successfully increased
+        """
+        return self.manager.use_slot(self.index)
+    
+    def apply_aging(self):
+        """Apply aging to the resource (divide counter by 2)"""
+        self.manager.counters[self.index] >>= 1
+
+class CompactResourceManager:
+    """
+    Manages the player's inventory with packed arrays instead of objects
+    
+    Resource types are stored as one-byte codes and counters as unsigned
+    bytes, both in bytearrays that only hold the filled slots. That keeps
+    every per-inventory operation inside a single C-level pass: aging is one
+    translate() through a halving table, counting is bytearray.count() and
+    MFU eviction is max() followed by index(), which also returns the first
+    slot among equal counters.
+    
+    Exposes the same interface as ResourceManager; inventory holds
+    ResourceView objects for code that expects Resource instances.
+    """
+    
+    # Byte -> byte halving table used for vectorized aging
+    HALVE_TABLE = bytes(value >> 1 for value in range(256))
+    
+    def __init__(self, inventory_size=6, counter_increment=Resource.COUNTER_INCREMENT,
+                 counter_max=Resource.COUNTER_MAX, toxic_threshold=Resource.TOXIC_THRESHOLD,
+                 resource_types=("nut", "circuit", "cell", "core")):
+        """
+        Initialize the compact resource manager
+        
+        Args:
+            inventory_size (int): Number of inventory slots
+            counter_increment (int): How much a counter increases when used
+            counter_max (int): Saturation value of counters, at most 255
+            toxic_threshold (int): Counter value above which removal is toxic
+            resource_types (iterable): Type names to assign the first codes to
+        """
+        if not 0 < counter_max <= 255:
+            raise ValueError(f"counter_max must fit in a byte, got {counter_max}")
+        
+        self.inventory_size = inventory_size
+        self.counter_increment = counter_increment
+        self.counter_max = counter_max
+        self.toxic_threshold = toxic_threshold
+        
+        # Type registry (code <-> name)
+        self.type_names = []
+        self.type_codes = {}
+        for resource_type in resource_types:
+            self.get_type_code(resource_type)
+        
+        # Counter -> counter after one use, saturating at counter_max
+        self.increment_table = bytes(
+            min(value + counter_increment, counter_max) if value < counter_max else value
+            for value in range(256)
+        )
+        
+        # Packed slot storage; only filled slots are present
+        self.types = bytearray()
+        self.counters = bytearray()
+        self.views = []
+        
+        # Optional operation recorder (see OperationLog)
+        self.recorder = None
+    
+    @property
+    def inventory(self):
+        """Slot views, in slot order"""
+        return self.views
+    
+    def get_type_code(self, resource_type):
+        """
+        Get the byte code of a resource type, registering it if it is new
+        
+        Args:
+            resource_type (str): Type of resource
+        
+        Returns:
+            int: Code of the resource type
+        """
+        code = self.type_codes.get(resource_type)
+        if code is None:
+            if len(self.type_names) >= 256:
+                raise ValueError("Too many resource types for a compact inventory")
+            code = len(self.type_names)
+            self.type_codes[resource_type] = code
+            self.type_names.append(resource_type)
+        return code
+    
+    def add_resource(self, resource_type):
+        """
+        Add a resource to inventory
+        If inventory is full, use MFU to replace a resource
+        
+        Args:
+            resource_type (str): Type of resource to add
+        
+        Returns:
+            tuple: (success, replaced_resource, toxic_damage)
+                - success (bool): Whether the resource was added
+                - replaced_resource (Resource or None): Snapshot of the resource that was replaced, if any
+                - toxic_damage (int): Amount of damage from toxic replacement, if any
+        """
+        if self.recorder is not None:
+            self.recorder.record_add(resource_type)
+        
+        code = self.get_type_code(resource_type)
+        
+        # If inventory has space, simply add the resource
+        if len(self.counters) < self.inventory_size:
+            self.views.append(ResourceView(self, len(self.counters)))
+            self.types.append(code)
+            self.counters.append(0)
+            return True, None, 0
+        
+        # Inventory is full, replace the first slot with the highest counter
+        replaced_index = self.get_victim_index()
+        replaced_resource = self.snapshot(replaced_index)
+        
+        # Check if replacement is toxic (high counter value)
+        toxic_damage = 0
+        if replaced_resource.counter > self.toxic_threshold:
+            toxic_damage = 1  # Player takes 1 damage
+        
+        # Replace the resource
+        self.types[replaced_index] = code
+        self.counters[replaced_index] = 0
+        
+        return True, replaced_resource, toxic_damage
+    
+    def add_resources(self, resource_types):
+        """
+        Add a sequence of resources in one pass
+        Equivalent to calling add_resource for each type in order
+        
+        Free slots are filled with one extend. Once every counter is 0 the
+        remaining adds would all replace slot 0 in turn, so they are settled
+        at once instead of one max() scan each.
+        
+        Args:
+            resource_types (iterable): Types of resources to add
+        
+        Returns:
+            tuple: (replaced_slots, replaced_counters, toxic_damage)
+                - replaced_slots (array): Per added resource, the slot it replaced, or -1 if it took a free slot
+                - replaced_counters (array): Per added resource, the counter of the replaced resource, or -1
+                - toxic_damage (int): Total damage from toxic replacements
+        """
+        resource_types = list(resource_types)
+        if self.recorder is not None:
+            for resource_type in resource_types:
+                self.recorder.record_add(resource_type)
+        
+        type_codes = self.type_codes
+        try:
+            codes = [type_codes[resource_type] for resource_type in resource_types]
+        except KeyError:
+            # A new type: register the types in order of first appearance
+            codes = [self.get_type_code(resource_type) for resource_type in resource_types]
+        types = self.types
+        counters = self.counters
+        replaced_slots = array("i")
+        replaced_counters = array("i")
+        toxic_damage = 0
+        
+        if len(counters) < self.inventory_size:
+            filled = len(counters)
+            free = min(len(codes), self.inventory_size - filled)
+            self.views.extend([ResourceView(self, index) for index in range(filled, filled + free)])
+            types.extend(codes[:free])
+            counters.extend(bytes(free))
+            replaced_slots.extend([-1] * free)
+            replaced_counters.extend([-1] * free)
+            codes = codes[free:]
+        
+        toxic_threshold = self.toxic_threshold
+        for position, code in enumerate(codes):
+            counter = max(counters)
+            if not counter:
+                # Every slot is at 0, so the first slot takes each remaining resource in turn
+                remaining = len(codes) - position
+                replaced_slots.extend([0] * remaining)
+                replaced_counters.extend([0] * remaining)
+                types[0] = codes[-1]
+                break
+            
+            replaced_index = counters.index(counter)
+            if counter > toxic_threshold:
+                toxic_damage += 1
+            types[replaced_index] = code
+            counters[replaced_index] = 0
+            replaced_slots.append(replaced_index)
+            replaced_counters.append(counter)
+        
+        return replaced_slots, replaced_counters, toxic_damage
+    
+    def use_resource(self, resource_type, amount=1):
+        """
+        Use resources of specified type from inventory
+        
+        Args:
+            resource_type (str): Type of resource to use
+            amount (int): Number of resources to use
+        
+        Returns:
+            bool: Whether the resources were successfully used
+        """
+        if self.recorder is not None:
+            self.recorder.record_use(resource_type, amount)
+        
+        # Check if we have enough
+        if self.get_resource_count(resource_type) < amount:
+            return False
+        
+        self.use_first_slots(resource_type, amount)
+        return True
+    
+    def use_resources(self, requirements):
+        """
+        Use several resource types in one call
+        Equivalent to calling use_resource for each entry in order
+        
+        Args:
+            requirements (dict): Resource type -> number of resources to use
+        
+        Returns:
+            array: Per entry, 1 if the resources were used and 0 otherwise
+        """
+        results = array("B")
+        for resource_type, amount in requirements.items():
+            results.append(self.use_resource(resource_type, amount))
+        return results
+    
+    def consume_resources(self, requirements):
+        """
+        Use every listed resource, or none of them if any is short
+        
+        Args:
+            requirements (dict): Resource type -> number of resources to use
+        
+        Returns:
+            bool: Whether all the resources were used
+        """
+        if self.recorder is not None:
+            self.recorder.record_consume(requirements)
+        
+        # Check if we have enough of every type before touching any counter
+        type_codes = self.type_codes
+        types = self.types
+        for resource_type, amount in requirements.items():
+            code = type_codes.get(resource_type)
+            if (0 if code is None else types.count(code)) < amount:
+                return False
+        
+        use_first_slots = self.use_first_slots
+        for resource_type, amount in requirements.items():
+            use_first_slots(resource_type, amount)
+        return True
+    
+    def use_first_slots(self, resource_type, amount):
+        """Use the first slots holding a resource type, in slot order"""
+        code = self.type_codes.get(resource_type)
+        index = -1
+        for _ in range(amount):
+            index = self.types.index(code, index + 1)
+            self.counters[index] = self.increment_table[self.counters[index]]
+    
+    def use_slot(self, index):
+        """
+        Use the resource in a single slot
+        
+        Args:
+            index (int): Slot index
+        
+        Returns:
+            bool: Whether the counter was successfully increased
+        """
+        counter = self.counters[index]
+        if counter >= self.counter_max:
+            return False
+        self.counters[index] = self.increment_table[counter]
+        return True
+    
+    def get_victim_index(self, resource_type=None):
+        """
+        Get the slot MFU would replace if a resource were added now
+        
+        Args:
+            resource_type (str, optional): Type of the incoming resource (unused)
+        
+        Returns:
+            int: Index of resource to replace, or -1 if the inventory is empty
+        """
+        if not self.counters:
+            return -1
+        return self.counters.index(max(self.counters))
+    
+    def snapshot(self, index):
+        """
+        Copy a slot into a standalone Resource
+        
+        Args:
+            index (int): Slot index
+        
+        Returns:
+            Resource: Resource with the slot's type and counter
+        """
+        resource = Resource(self.type_names[self.types[index]])
+        resource.counter = self.counters[index]
+        return resource
+    
+    def get_state(self):
+        """
+        Get the whole inventory packed into bytes
+        
+        Returns:
+            bytes: Type codes of the filled slots followed by their counters
+        """
+        return bytes(self.types) + bytes(self.counters)
+    
+    def set_state(self, state):
+        """
+        Restore an inventory packed by get_state
+        
+        Args:
+            state (bytes): Packed inventory of a manager with the same type codes
+        """
+        filled = len(state) // 2
+        self.types = bytearray(state[:filled])
+        self.counters = bytearray(state[filled:])
+        if len(self.views) != filled:
+            self.views = [ResourceView(self, index) for index in range(filled)]
+    
+    def apply_aging(self):
+        """Apply aging to all resources (divide counters by 2)"""
+        if self.recorder is not None:
+            self.recorder.record_aging()
+        self.counters[:] = self.counters.translate(self.HALVE_TABLE)
+    
+    def get_resource_count(self, resource_type):
+        """Get count of resources of specified type in inventory"""
+        code = self.type_codes.get(resource_type)
+        if code is None:
+            return 0
+        return self.types.count(code)
+    
+    def clear_inventory(self):
+        """Clear the inventory"""
+        self.types = bytearray()
+        self.counters = bytearray()
+        self.views = []
\ No newline at end of file
@@ -4,6 +4,9 @@ Configuration module - Game settings and constants
 
 import pygame
 import os
+import sys
+from src.utils.event_log import parse_levels
+from src.utils.text_cache import TextCache
 
 class Config:
     """Configuration class for game settings"""
@@ -13,6 +16,15 @@ class Config:
         self.SCREEN_WIDTH = 1024
         self.SCREEN_HEIGHT = 768
         self.FPS = 60
+        self.DIRTY_RECT_RENDERING = True  # Present only changed regions instead of flipping the whole screen
+        self.DIRTY_RECT_LIMIT = 256  # Above this many changed regions a frame is presented whole
+        
+        # Simulation clock: fixed ticks, with rendering interpolated between them
+        self.SIMULATION_RATE = 60  # Ticks per second; movement speeds are per tick
+        self.TIME_SCALE = float(os.environ.get("MFU_TIME_SCALE", 1.0))  # Above 1 fast-forwards the simulation
+        self.MAX_FRAME_TIME = 250  # Real milliseconds simulated per frame at most, so a stall cannot snowball
+        self.IDLE_RENDERING = True  # Sleep until input or the next visual change when the scene is static
+        self.MAX_IDLE_WAIT = 1000  # Longest sleep in milliseconds while idle
         
         # Colors
         self.BACKGROUND_COLOR = (40, 35, 30)  # Dark brown
@@ -27,6 +39,22 @@ class Config:
         self.COUNTER_INCREMENT = 8  # How much counter increases when used
         self.COUNTER_MAX = 255  # Maximum counter value (8-bit)
         self.TOXIC_THRESHOLD = 64  # Counter value above which removal is toxic
+        self.LAZY_AGING = False  # Age counters on read instead of halving them all
+        self.INVENTORY_BACKEND = "objects"  # "objects" (Resource list) or "compact" (packed arrays)
+        self.REPLACEMENT_POLICY = "mfu"  # "mfu", "lfu", "aging_lfu", "lru", "clock" or "arc" (objects backend only)
+        self.TRACE_FILE = os.environ.get("MFU_TRACE_FILE")  # Record inventory operations to this file
+        
+        # Event log (see src/utils/event_log.py)
+        self.LOG_LEVELS = {"default": "info", "mfu": "warning"}  # Subsystem -> minimum recorded level
+        if os.environ.get("MFU_LOG_LEVELS"):
+            self.LOG_LEVELS.update(parse_levels(os.environ["MFU_LOG_LEVELS"]))  # e.g. "mfu=debug,audio=debug"
+        self.LOG_CAPACITY = 2048  # Records kept in the ring buffer
+        self.LOG_ECHO = bool(os.environ.get("MFU_LOG_ECHO"))  # Also print records to stdout
+        self.LOG_DUMP_FILE = "event_log.jsonl"  # Written when F12 is pressed
+        
+        # Frame timing (F3 toggles the overlay, F4 starts/stops CSV recording)
+        self.FRAME_TIMING_WINDOW = 300  # Frames the percentiles are computed over
+        self.FRAME_TIMING_FILE = "frame_times.csv"
         
         # Player settings
         self.PLAYER_MAX_HEALTH = 5
@@ -75,6 +103,40 @@ class Config:
         # UI images
         self.CLOCK_ICON = os.path.join(self.IMAGES_DIR, "reloj_icon.png")
         
+        # Background music per scene, streamed from disk
+        self.MUSIC_TRACKS = {
+            "workshop": os.path.join(self.ASSETS_DIR, "audio", "reparar.mp3"),
+            "collection": os.path.join(self.ASSETS_DIR, "audio", "recolectar.mp3")
+        }
+        self.MUSIC_VOLUME = 0.7  # Volume once faded in
+        self.MUSIC_FADE_MS = 1000  # Fade-out of the old track, then fade-in of the new one (not a crossfade)
+        
+        # Sound effects (see src/core/voice_manager.py): mixer channels and, per sound,
+        # priority, simultaneous voices, minimum time between starts and reserved channels
+        self.SOUND_CHANNELS = 8
+        self.SOUND_EFFECTS = {
+            "lose_point": {"priority": 3, "voices": 1, "retrigger_ms": 250, "reserved": 1},
+            "point": {"priority": 2, "voices": 2, "retrigger_ms": 100},
+            "obtain_element_1": {"priority": 1, "voices": 2, "retrigger_ms": 60},
+            "obtain_element_2": {"priority": 1, "voices": 2, "retrigger_ms": 60}
+        }
+        
+        # Sprite atlas (build with: python -m src.utils.sprite_atlas)
+        self.USE_SPRITE_ATLAS = True  # Serve sprites from the atlas when it is present
+        self.ATLAS_DIR = os.path.join(self.ASSETS_DIR, "atlas")
+        self.ATLAS_MANIFEST = os.path.join(self.ATLAS_DIR, "sprites.json")
+        
+        # Decoded asset cache (see src/utils/asset_cache.py); MFU_ASSET_CACHE overrides
+        # the directory and an empty value disables the cache
+        self.ASSET_CACHE_DIR = os.environ.get(
+            "MFU_ASSET_CACHE",
+            os.path.join(os.path.dirname(self.ASSETS_DIR), ".asset_cache")
+        )
+        
+        # Threads that decode images and sounds in parallel (the web build has no threads)
+        self.ASSET_LOAD_WORKERS = 1 if sys.platform == "emscripten" else min(os.cpu_count() or 1, 8)
+        self.VARIANT_CACHE_BYTES = 4 * 1024 * 1024  # Pixel memory for flipped/rotated/scaled/tinted sprites
+        
         # Resource types
         self.RESOURCE_TYPES = {
             "nut": {"name": "Tuerca Oxidada", "rarity": 1, "color": (139, 69, 19)},
@@ -83,6 +145,21 @@ class Config:
             "core": {"name": "Núcleo Radioactivo", "rarity": 4, "color": (148, 0, 211)}
         }
         
+        # Resource spawning in the collection scene
+        self.SPAWN_INTERVAL = 1000  # Milliseconds between spawned resources
+        self.STORM_SPAWN_RATE = 2000  # Debris per second in storm mode (F6 in the collection scene)
+        self.DEBRIS_CULLING = False  # Level of detail: skip debris hidden under other debris (sprites pop)
+        self.DEBRIS_CULL_THRESHOLD = 256  # With DEBRIS_CULLING, above this many falling entities debris is culled
+        self.DEBRIS_CULL_CELL = 40  # With DEBRIS_CULLING, grid cell in pixels that draws only its topmost debris
+        
+        # Chance of each resource type being spawned in the collection scene
+        self.SPAWN_PROBABILITIES = {
+            "nut": 0.5,
+            "circuit": 0.3,
+            "cell": 0.15,
+            "core": 0.05
+        }
+        
         # Weapon types and requirements
         self.WEAPONS = {
             "pistol": {
@@ -112,8 +189,36 @@ class Config:
             }
         }
         
-        # Fonts
+        # Fonts, created once through the shared registry
         pygame.font.init()
-        self.FONT_SMALL = pygame.font.Font(None, 24)
-        self.FONT_MEDIUM = pygame.font.Font(None, 32)
-        self.FONT_LARGE = pygame.font.Font(None, 48)
\ No newline at end of file
+        self.fonts = {}  # (path, size) -> pygame.font.Font
+        self.FONT_SMALL = self.get_font(24)
+        self.FONT_MEDIUM = self.get_font(32)
+        self.FONT_SCREEN = self.get_font(36)  # Start and game over screens
+        self.FONT_LARGE = self.get_font(48)
+        
+        # Rendered text surfaces, reused across frames
+        self.TEXT_CACHE_SIZE = 256
+        self.TEXT_CACHE = TextCache(self.TEXT_CACHE_SIZE)
+    
+    def get_font(self, size, path=None):
+        """
+        Get a font from the shared registry, loading it on first use
+        
+        Args:
+            size (int): Font size
+            path (str, optional): Font file; None is pygame's default font
+            
+        Returns:
+            pygame.font.Font: The shared font object
+        """
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            try:
+                font = pygame.font.Font(path, size)
+            except (pygame.error, OSError):
+                # Fall back to a system font
+                font = pygame.font.SysFont("Arial", size)
+            self.fonts[key] = font
+        return font
\ No newline at end of file
@@ -0,0 +1,209 @@
+"""
+Frame Profiler module - Per-frame timing of the main loop's sections
+"""
+
+import csv
+import time
+from collections import deque
+
+class SectionTimer:
+    """Context manager that adds its elapsed time to a profiler section"""
+    
+    __slots__ = ("profiler", "name", "start")
+    
+    def __init__(self, profiler, name):
+        """
+        Initialize a section timer
+        
+        Args:
+            profiler (FrameProfiler): Profiler that accumulates the time
+            name (str): Section name
+        """
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.current[self.name] += (time.perf_counter() - self.start) * 1000.0
+        return False
+
+class NullTimer:
+    """Section timer used while the profiler is inactive"""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+NULL_TIMER = NullTimer()
+
+class FrameProfiler:
+    """
+    Measures where each frame's time goes
+    
+    The main loop brackets a frame with begin_frame()/end_frame() and wraps
+    each part of it in a section; scenes wrap their panel draws the same way.
+    Sections nest, so "draw" includes the draw.* panel sections. The last
+    `window` frames are kept for percentiles, and every frame can also be
+    streamed to a CSV file.
+    
+    While neither the overlay nor CSV recording is on, section() returns a
+    shared no-op timer and frames are not recorded.
+    """
+    
+    # Measured sections, in CSV column order
+    SECTIONS = (
+        "events",
+        "update",
+        "draw",
+        "draw.inventory_panel",
+        "draw.repair_panel",
+        "draw.status_panel",
+        "overlay",
+        "flip"
+    )
+    
+    def __init__(self, window=300):
+        """
+        Initialize the profiler
+        
+        Args:
+            window (int): Number of recent frames kept for percentiles
+        """
+        self.window = window
+        self.enabled = False  # Collect rolling statistics (overlay visible)
+        self.active = False   # Collect anything at all this frame
+        
+        self.timers = {name: SectionTimer(self, name) for name in self.SECTIONS}
+        self.current = dict.fromkeys(self.SECTIONS, 0.0)
+        
+        # Rolling history: "frame" is the time between frame starts, "busy"
+        # the time from begin_frame() to end_frame()
+        self.history = {name: deque(maxlen=window) for name in ("frame", "busy") + self.SECTIONS}
+        
+        self.frame_index = 0
+        self.frame_start = None
+        self.previous_start = None
+        self.scene = ""
+        
+        # CSV recording
+        self.csv_file = None
+        self.csv_writer = None
+    
+    @property
+    def recording(self):
+        """Whether frames are being written to a CSV file"""
+        return self.csv_writer is not None
+    
+    def set_enabled(self, enabled):
+        """
+        Turn rolling statistics on or off
+        
+        Args:
+            enabled (bool): Whether statistics are collected
+        """
+        self.enabled = enabled
+        if not enabled:
+            for samples in self.history.values():
+                samples.clear()
+            self.previous_start = None
+    
+    def section(self, name):
+        """
+        Get the timer of a section, for use in a with statement
+        
+        Args:
+            name (str): Section name, one of SECTIONS
+            
+        Returns:
+            SectionTimer: Timer of the section, or a no-op timer while inactive
+        """
+        if self.active:
+            return self.timers[name]
+        return NULL_TIMER
+    
+    def begin_frame(self, scene=""):
+        """
+        Start measuring a frame
+        
+        Args:
+            scene (str): Name of the active scene, stored in CSV rows
+        """
+        self.active = self.enabled or self.csv_writer is not None
+        if not self.active:
+            return
+        
+        current = self.current
+        for name in current:
+            current[name] = 0.0
+        self.scene = scene
+        self.frame_start = time.perf_counter()
+    
+    def end_frame(self):
+        """Finish the frame and record its timings"""
+        if not self.active:
+            return
+        
+        now = time.perf_counter()
+        busy = (now - self.frame_start) * 1000.0
+        frame = busy
+        if self.previous_start is not None:
+            frame = (self.frame_start - self.previous_start) * 1000.0
+        self.previous_start = self.frame_start
+        self.frame_index += 1
+        
+        if self.enabled:
+            history = self.history
+            history["frame"].append(frame)
+            history["busy"].append(busy)
+            for name, value in self.current.items():
+                history[name].append(value)
+        
+        if self.csv_writer is not None:
+            row = [self.frame_index, self.scene, round(frame, 4), round(busy, 4)]
+            row.extend(round(self.current[name], 4) for name in self.SECTIONS)
+            self.csv_writer.writerow(row)
+    
+    def percentiles(self, name, points=(50, 95, 99)):
+        """
+        Nearest-rank percentiles of a section over the rolling window
+        
+        Args:
+            name (str): "frame", "busy" or a section name
+            points (tuple): Percentiles to compute
+            
+        Returns:
+            list: One value in milliseconds per percentile (0.0 without samples)
+        """
+        samples = sorted(self.history[name])
+        if not samples:
+            return [0.0] * len(points)
+        last = len(samples) - 1
+        return [samples[min(last, max(0, -(-point * len(samples) // 100) - 1))] for point in points]
+    
+    def start_recording(self, path):
+        """
+        Start writing one CSV row per frame
+        
+        Args:
+            path (str): Destination CSV file, overwritten
+        """
+        self.stop_recording()
+        self.csv_file = open(path, "w", newline="", encoding="utf-8")
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(["frame", "scene", "frame_ms", "busy_ms"] + [f"{name}_ms" for name in self.SECTIONS])
+        self.previous_start = None
+    
+    def stop_recording(self):
+        """Stop CSV recording and close the file"""
+        if self.csv_file is not None:
+            self.csv_file.close()
+        self.csv_file = None
+        self.csv_writer = None
\ No newline at end of file
@@ -2,22 +2,42 @@
 Game module - Main game controller
 """
 
+import os
 import pygame
 import sys
 from src.core.config import Config
 from src.core.resource_manager import ResourceManager
+from src.core.compact_resource_manager import CompactResourceManager
 from src.core.scene_manager import SceneManager
 from src.core.mfu_algorithm import MFUAlgorithm
+from src.core.operation_trace import TraceWriter
+from src.core.frame_profiler import FrameProfiler
+from src.core.music_player import MusicPlayer
+from src.core.voice_manager import VoiceManager
 from src.scenes.workshop_scene import WorkshopScene
 from src.scenes.collection_scene import CollectionScene
+from src.ui.frame_timing_overlay import FrameTimingOverlay
 from src.utils.asset_loader import AssetLoader
+from src.utils.asset_cache import AssetCache
+from src.utils.sprite_atlas import sprite_specs
+from src.utils.event_log import event_log, get_logger
+
+log = get_logger("game")
+audio_log = get_logger("audio")
 
 class Game:
     """Main game class that manages the game loop and scenes"""
     
-    def __init__(self):
-        """Initialize the game"""
+    def __init__(self, start_scene="workshop"):
+        """
+        Initialize the game
+        
+        Args:
+            start_scene (str or None): Scene to activate, or None to let the caller load and
+                activate it (main.py does, to show loading progress)
+        """
         self.config = Config()
+        event_log.configure(self.config.LOG_LEVELS, self.config.LOG_CAPACITY, self.config.LOG_ECHO)
         self.screen = pygame.display.set_mode(
             (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT)
         )
@@ -26,28 +46,80 @@ class Game:
         # Initialize clock
         self.clock = pygame.time.Clock()
         
-        # Audio state
+        # Frame timing and its overlay
+        self.profiler = FrameProfiler(self.config.FRAME_TIMING_WINDOW)
+        self.frame_overlay = FrameTimingOverlay(self.profiler, self.config)
+        
+        # Audio state; background music is streamed, not loaded as an asset
         self.audio_enabled = True
+        self.music = MusicPlayer(
+            self.config.MUSIC_TRACKS,
+            volume=self.config.MUSIC_VOLUME,
+            fade_ms=self.config.MUSIC_FADE_MS
+        )
+        
+        # Initialize asset loader, backed by the decoded asset cache
+        asset_cache = AssetCache(self.config.ASSET_CACHE_DIR) if self.config.ASSET_CACHE_DIR else None
+        self.asset_loader = AssetLoader(
+            asset_cache,
+            self.config.ASSET_LOAD_WORKERS,
+            self.config.VARIANT_CACHE_BYTES
+        )
         
-        # Initialize asset loader
-        self.asset_loader = AssetLoader()
+        # Sound effects play through a fixed set of prioritized channels
+        self.sound_effects = VoiceManager(
+            self.asset_loader.sounds,
+            self.config.SOUND_CHANNELS,
+            self.config.SOUND_EFFECTS
+        )
         self.load_assets()
         
         # Initialize resource manager
-        self.resource_manager = ResourceManager()
+        if self.config.INVENTORY_BACKEND == "compact":
+            if self.config.REPLACEMENT_POLICY != "mfu":
+                raise ValueError("The compact inventory backend only supports the MFU policy")
+            self.resource_manager = CompactResourceManager(
+                self.config.INVENTORY_SIZE,
+                counter_increment=self.config.COUNTER_INCREMENT,
+                counter_max=self.config.COUNTER_MAX,
+                toxic_threshold=self.config.TOXIC_THRESHOLD,
+                resource_types=self.config.RESOURCE_TYPES.keys()
+            )
+        else:
+            self.resource_manager = ResourceManager(
+                self.config.INVENTORY_SIZE,
+                lazy_aging=self.config.LAZY_AGING,
+                policy=self.config.REPLACEMENT_POLICY,
+                counter_increment=self.config.COUNTER_INCREMENT,
+                counter_max=self.config.COUNTER_MAX,
+                toxic_threshold=self.config.TOXIC_THRESHOLD
+            )
+        
+        # Record inventory operations for offline replay if requested
+        self.trace_writer = None
+        if self.config.TRACE_FILE:
+            self.trace_writer = TraceWriter(
+                self.config.TRACE_FILE,
+                self.config.INVENTORY_SIZE,
+                self.config.RESOURCE_TYPES.keys()
+            )
+            self.resource_manager.recorder = self.trace_writer
         
         # Initialize MFU algorithm
         self.mfu_algorithm = MFUAlgorithm()
         
         # Initialize scene manager and scenes
-        self.scene_manager = SceneManager()
-        self.scene_manager.add_scene("workshop", WorkshopScene(self))
-        self.scene_manager.add_scene("collection", CollectionScene(self))
-        self.scene_manager.set_active_scene("workshop")
-        
-        # Set up aging timer (15 seconds)
-        self.aging_event = pygame.USEREVENT + 1
-        pygame.time.set_timer(self.aging_event, self.config.AGING_INTERVAL)
+        self.scene_manager = SceneManager(self.asset_loader)
+        self.scene_manager.add_scene("workshop", WorkshopScene(self), next_scene="collection")
+        self.scene_manager.add_scene("collection", CollectionScene(self), next_scene="workshop")
+        if start_scene:
+            self.scene_manager.set_active_scene(start_scene)
+        
+        # Simulation clock, advanced in fixed ticks by step(); aging runs on it
+        self.sim_time = 0.0      # Simulated milliseconds since the game started
+        self.tick_time = 0.0     # Length of the tick being simulated, 0 outside step()
+        self.next_aging = self.config.AGING_INTERVAL
+        self.interpolation = 1.0  # Fraction of a tick between the last tick and the frame being drawn
         
         # Game state
         self.running = True
@@ -62,58 +134,69 @@ class Game:
         self.celebration_interval = 200  # milliseconds between frames
     
     def load_assets(self):
-        """Load all game assets"""
-        # Load character image
-        self.asset_loader.load_image("character", self.config.CHARACTER_IMAGE, (80, 120))
-        
-        # Load celebration images
-        for i in range(1, 6):
-            self.asset_loader.load_image(f"celebration_{i}", 
-                                        f"{self.config.IMAGES_DIR}/Character/celebracion_{i}.png", 
-                                        (80, 120))
-        
-        # Load resource images
-        for resource_type, path in self.config.RESOURCE_IMAGES.items():
-            self.asset_loader.load_image(f"resource_{resource_type}", path, (40, 40))
-        
-        # Load weapon images for all states
-        for state, weapons in self.config.WEAPON_IMAGES.items():
-            for weapon_type, path in weapons.items():
-                self.asset_loader.load_image(f"weapon_{weapon_type}_{state}", path, (80, 60))
-        
-        # Load UI images
-        self.asset_loader.load_image("clock_icon", self.config.CLOCK_ICON, (20, 20))
-        
-        # Load background image
-        self.asset_loader.load_image("background", f"{self.config.ASSETS_DIR}/images/backGround.png", (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
-        
-        # Load game over and victory images
-        self.asset_loader.load_image("gameover", f"{self.config.ASSETS_DIR}/images/gameover.png", (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
-        self.asset_loader.load_image("gamewin", f"{self.config.ASSETS_DIR}/images/gamewin.png", (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
-        
-        # Load sounds
-        self.asset_loader.load_sound("point", f"{self.config.ASSETS_DIR}/audio/point.mp3")
-        self.asset_loader.load_sound("obtain_element_1", f"{self.config.ASSETS_DIR}/audio/obtener_elemento.mp3")
-        self.asset_loader.load_sound("obtain_element_2", f"{self.config.ASSETS_DIR}/audio/obtener_elemento_2.mp3")
-        self.asset_loader.load_sound("lose_point", f"{self.config.ASSETS_DIR}/audio/lose_point.mp3")
-        
-        # Load background music
-        self.asset_loader.load_sound("workshop_music", f"{self.config.ASSETS_DIR}/audio/reparar.mp3")
-        self.asset_loader.load_sound("collection_music", f"{self.config.ASSETS_DIR}/audio/recolectar.mp3")
-        
-        # Music state
-        self.current_music = None
-        self.music_volume = 0.0
-        self.target_volume = 0.7  # Maximum target volume
-        self.volume_step = 0.01   # Gradual volume increment
+        """
+        Register all game assets
+        
+        Nothing is decoded here: SceneManager loads each scene's manifest
+        when the scene is activated, and game_over loads its end screen.
+        """
+        # Character, celebration, resource, weapon and UI sprites, served from
+        # the atlas when one has been built
+        if self.config.USE_SPRITE_ATLAS and os.path.exists(self.config.ATLAS_MANIFEST):
+            self.asset_loader.load_atlas(self.config.ATLAS_MANIFEST)
+        for name, path, size in sprite_specs(self.config):
+            self.asset_loader.register_image(name, path, size)
+        
+        # Background image
+        self.asset_loader.register_image("background", f"{self.config.ASSETS_DIR}/images/backGround.png", (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        
+        # Game over and victory images
+        self.asset_loader.register_image("gameover", f"{self.config.ASSETS_DIR}/images/gameover.png", (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        self.asset_loader.register_image("gamewin", f"{self.config.ASSETS_DIR}/images/gamewin.png", (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        
+        # Sounds
+        self.asset_loader.register_sound("point", f"{self.config.ASSETS_DIR}/audio/point.mp3")
+        self.asset_loader.register_sound("obtain_element_1", f"{self.config.ASSETS_DIR}/audio/obtener_elemento.mp3")
+        self.asset_loader.register_sound("obtain_element_2", f"{self.config.ASSETS_DIR}/audio/obtener_elemento_2.mp3")
+        self.asset_loader.register_sound("lose_point", f"{self.config.ASSETS_DIR}/audio/lose_point.mp3")
+        
         
     # El método run se ha eliminado ya que ahora el bucle principal está en main.py
-    # La lógica de actualización de la celebración se maneja directamente en main.py
+    # La simulación avanza en pasos fijos con step(), llamado desde el bucle de main.py
+    
+    def step(self, dt):
+        """
+        Advance the simulation by one fixed tick
+        
+        Args:
+            dt (float): Length of the tick in simulated milliseconds
+        """
+        self.tick_time = dt
+        self.sim_time += dt
+        
+        # Age every AGING_INTERVAL of simulated time
+        if self.sim_time >= self.next_aging:
+            self.next_aging += self.config.AGING_INTERVAL
+            self.apply_aging()
+        
+        self.scene_manager.update()
+        self.update_celebration()
+        self.tick_time = 0.0
+    
+    def update_celebration(self):
+        """Advance the celebration animation if it is playing"""
+        if not self.celebrating:
+            return
+        if self.sim_time - self.celebration_timer > self.celebration_interval:
+            self.celebration_frame = (self.celebration_frame % 5) + 1
+            self.celebration_timer = self.sim_time
+            
+            # End celebration after cycling through all frames
+            if self.celebration_frame == 1:
+                self.celebrating = False
     
     def apply_aging(self):
         """Apply aging to all resources and weapons"""
-        print("Applying aging to resources and weapons...")
-        
         # Apply aging to resources
         self.resource_manager.apply_aging()
         
@@ -130,11 +213,20 @@ class Game:
                         # Only lose health once per round for destroyed weapons
                         self.health -= 1
                         weapon_destroyed_this_round = True
-                        print(f"Weapon destroyed! Health reduced to {self.health}")
+                        log.info("weapon_destroyed", weapon=weapon.type, health=self.health)
                         # Play lose point sound
                         self.play_lose_point_sound()
         
-        print("Aging process completed")
+        log.debug("aging_applied", health=self.health)
+    
+    def shutdown(self):
+        """Release resources that outlive the game loop"""
+        if self.trace_writer:
+            self.trace_writer.close()
+        self.profiler.stop_recording()
+        if self.audio_enabled:
+            self.music.stop()
+            self.sound_effects.stop()
     
     def check_game_over(self):
         """Check if game is over (player health <= 0)"""
@@ -152,75 +244,25 @@ class Game:
         if not self.audio_enabled:
             return
             
-        sound = self.asset_loader.get_sound("lose_point")
-        if sound:
-            sound.play()
-            print("Playing lose point sound")
+        # Highest priority: preempts pickup sounds when channels run out
+        self.sound_effects.play("lose_point")
             
     def play_background_music(self, scene_name):
-        """Play background music for the current scene with gradual volume increase"""
+        """Fade over to the background music of a scene"""
         if not self.audio_enabled:
-            print(f"Audio disabled, not playing music for {scene_name}")
+            audio_log.debug("music_skipped", scene=scene_name, reason="audio_disabled")
             return
-            
-        # Determine which music to play based on the scene
-        music_name = None
-        if scene_name == "workshop":
-            music_name = "workshop_music"
-        elif scene_name == "collection":
-            music_name = "collection_music"
-        
-        # If no valid scene or already playing the correct music, do nothing
-        if not music_name:
-            print(f"No music defined for scene: {scene_name}")
-            return
-        elif self.current_music and self.current_music == music_name:
-            print(f"Already playing {music_name}, no change needed")
-            return
-            
-        print(f"Changing music to {music_name} for scene {scene_name}")
-        
-        # Stop any currently playing music
-        pygame.mixer.stop()
-        
-        # Get the new music and start playing it
-        music = self.asset_loader.get_sound(music_name)
-        if music:
-            # Set initial volume to 0
-            music.set_volume(0)
-            # Play on loop (-1 means infinite loop)
-            music.play(loops=-1)
-            # Store current music and reset volume
-            self.current_music = music_name
-            self.music_volume = 0.0
-            print(f"Started playing {music_name} with initial volume 0.0")
-        else:
-            print(f"Failed to load music: {music_name}")
-            
-    def update_music_volume(self, dt):
-        """Gradually increase music volume"""
-        if not self.audio_enabled or not self.current_music:
+        
+        # If no valid scene, do nothing; the player ignores the track already playing
+        if scene_name not in self.config.MUSIC_TRACKS:
+            audio_log.warning("music_missing", scene=scene_name)
             return
-            
-        # Increase volume gradually
-        if self.music_volume < self.target_volume:
-            # Increase by 0.001 per millisecond, up to target volume
-            old_volume = self.music_volume
-            self.music_volume = min(self.music_volume + 0.0001 * dt, self.target_volume)
-            music = self.asset_loader.get_sound(self.current_music)
-            if music:
-                music.set_volume(self.music_volume)
-                # Only print when volume changes significantly to avoid console spam
-                if int(old_volume * 100) != int(self.music_volume * 100) and int(self.music_volume * 100) % 10 == 0:
-                    print(f"Music volume updated to {self.music_volume:.2f}")
-                
+        self.music.play(scene_name)
+    
     def play_point_sound(self):
         """Play sound when player gains points"""
         if self.audio_enabled:
-            sound = self.asset_loader.get_sound("point")
-            if sound:
-                sound.play()
-                print("Playing point sound")
+            self.sound_effects.play("point")
                 
     def play_obtain_element_sound(self):
         """Play a random sound when player obtains an element"""
@@ -228,35 +270,33 @@ class Game:
             # Randomly choose between the two sounds
             import random
             sound_name = random.choice(["obtain_element_1", "obtain_element_2"])
-            sound = self.asset_loader.get_sound(sound_name)
-            if sound:
-                sound.play()
-                print(f"Playing obtain element sound: {sound_name}")
+            self.sound_effects.play(sound_name)
                 
     def start_celebration(self):
         """Start the character celebration animation and play sound"""
         self.celebrating = True
         self.celebration_frame = 1
-        self.celebration_timer = pygame.time.get_ticks()
-        print("Starting celebration animation")
+        self.celebration_timer = self.sim_time
+        log.debug("celebration_started")
         
         # Play point sound
         self.play_point_sound()
     
     def game_over(self, message):
         """Handle game over state"""
-        print(f"Game over: {message}")
-        print(f"Final score: {self.score}, Weapons repaired: {self.weapons_repaired}")
+        log.info("game_over", message=message, score=self.score, weapons_repaired=self.weapons_repaired)
         
         # Determine which image to use based on the message
         if "Victoria" in message:
             # Victory condition
-            background_image = self.asset_loader.get_image("gamewin")
-            print("Showing victory screen")
+            image_name = "gamewin"
         else:
             # Game over condition
-            background_image = self.asset_loader.get_image("gameover")
-            print("Showing game over screen")
+            image_name = "gameover"
+        
+        # End screens are not part of any scene manifest, load on demand
+        self.asset_loader.load(image_name)
+        background_image = self.asset_loader.get_image(image_name)
         
         # Display the background image
         if background_image:
@@ -264,46 +304,43 @@ class Game:
         else:
             # Fallback to black background if image not found
             self.screen.fill((0, 0, 0))
-            print("Warning: Game over background image not found, using black background")
+            log.warning("image_missing", image="game_over_background")
         
-        # Create font for score display
-        font_medium = pygame.font.Font(None, 36)
+        # Shared font for score display, rasterized through the text cache
+        font_medium = self.config.FONT_SCREEN
+        text_cache = self.config.TEXT_CACHE
         
         # Score in bottom right corner with white text
-        score_text = font_medium.render(f"Puntuación: {self.score}", True, (255, 255, 255))
+        score_text = text_cache.render(font_medium, f"Puntuación: {self.score}", (255, 255, 255))
         score_rect = score_text.get_rect()
         score_rect.bottomright = (self.config.SCREEN_WIDTH - 20, self.config.SCREEN_HEIGHT - 20)
         self.screen.blit(score_text, score_rect)
         
         # Weapons repaired (slightly above score)
-        weapons_text = font_medium.render(f"Armas Reparadas: {self.weapons_repaired}", True, (255, 255, 255))
+        weapons_text = text_cache.render(font_medium, f"Armas Reparadas: {self.weapons_repaired}", (255, 255, 255))
         weapons_rect = weapons_text.get_rect()
         weapons_rect.bottomright = (self.config.SCREEN_WIDTH - 20, score_rect.top - 10)
         self.screen.blit(weapons_text, weapons_rect)
         
         # Exit instructions at the bottom
-        exit_text = font_medium.render("Presiona ESC para salir", True, (255, 255, 255))
+        exit_text = text_cache.render(font_medium, "Presiona ESC para salir", (255, 255, 255))
         exit_rect = exit_text.get_rect()
         exit_rect.midbottom = (self.config.SCREEN_WIDTH // 2, self.config.SCREEN_HEIGHT - 20)
         self.screen.blit(exit_text, exit_rect)
         
         pygame.display.flip()
         
-        print("Waiting for ESC key to exit...")
-        
         # Wait for ESC key to exit
         waiting = True
         while waiting:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    print("Quit event received")
                     waiting = False
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
-                        print("ESC key pressed, exiting game")
                         waiting = False
             
             self.clock.tick(30)
         
         self.running = False
-        print("Game terminated")
\ No newline at end of file
+        log.info("game_terminated")
\ No newline at end of file
@@ -2,15 +2,140 @@
 MFU Algorithm module - Implements the Most Frequently Used replacement algorithm
 """
 
-class MFUAlgorithm:
+from src.core.replacement_policy import ReplacementPolicy
+from src.utils.event_log import get_logger
+
+log = get_logger("mfu")
+
+class MFUAlgorithm(ReplacementPolicy):
     """
     Most Frequently Used (MFU) replacement algorithm
     Tracks usage frequency of resources and replaces the most frequently used
+    
+    Besides the stateless linear scan in get_replacement_index, the algorithm
+    keeps an indexed max-heap of inventory slots. The owner reports counter
+    changes through update() and reset(), and the victim is then available in
+    O(1) through peek_victim(). Ties are broken by the lowest slot index, the
+    same rule as the linear scan.
+    
+    The heap orders slots by keys, highest first. For MFU the keys are the
+    counters themselves (the same list); subclasses that set evict_lowest
+    keep the negated counters instead, so that every comparison is inline.
     """
     
+    name = "mfu"
+    evict_lowest = False  # Evict the lowest counter first instead of the highest
+    
     def __init__(self):
         """Initialize the MFU algorithm"""
-        pass
+        self.heap = []       # Slot indices arranged as a binary max-heap
+        self.positions = []  # Slot index -> position of that slot in the heap
+        self.counters = []   # Slot index -> counter value
+        self.keys = self.counters  # Slot index -> value the heap puts first, see the class docstring
+    
+    def reset(self, resources):
+        """
+        Rebuild the heap from a full inventory in O(n)
+        
+        Args:
+            resources (list): List of Resource objects, in slot order
+        """
+        self.rebuild([resource.counter for resource in resources])
+    
+    def rebuild(self, counters):
+        """
+        Rebuild the heap from one counter per slot in O(n)
+        
+        Args:
+            counters (list): Counter values, in slot order
+        """
+        self.counters = list(counters)
+        self.keys = [-counter for counter in self.counters] if self.evict_lowest else self.counters
+        self.heap = list(range(len(self.counters)))
+        self.positions = list(range(len(self.counters)))
+        
+        for position in range(len(self.heap) // 2 - 1, -1, -1):
+            self._sift_down(position)
+    
+    def update(self, index, counter):
+        """
+        Record the counter of a slot, adding the slot if it is new
+        
+        Args:
+            index (int): Slot index; a new slot must be the next free index
+            counter (int): Current counter value of the resource in the slot
+        """
+        if index == len(self.counters):
+            self.counters.append(counter)
+            if self.evict_lowest:
+                self.keys.append(-counter)
+            self.positions.append(len(self.heap))
+            self.heap.append(index)
+            self._sift_up(len(self.heap) - 1)
+            return
+        
+        if counter == self.counters[index]:
+            return
+        self.counters[index] = counter
+        if self.evict_lowest:
+            self.keys[index] = -counter
+        
+        # The key may have gone either way, so try both directions; at most one moves
+        self._sift_up(self.positions[index])
+        self._sift_down(self.positions[index])
+    
+    def zero_victim(self):
+        """Set the counter of the victim slot to 0 in O(log n), as update(peek_victim(), 0) would"""
+        index = self.heap[0]
+        if not self.counters[index]:
+            return
+        self.counters[index] = 0
+        if self.evict_lowest:
+            # Counters are never negative, so the victim keeps the highest key
+            self.keys[index] = 0
+        else:
+            self._sift_down(0)
+    
+    def peek_victim(self):
+        """
+        Get the slot the MFU rule would replace, in O(1)
+        
+        Returns:
+            int: Index of resource to replace, or -1 if there are no slots
+        """
+        if not self.heap:
+            return -1
+        return self.heap[0]
+    
+    def on_insert(self, index, resource):
+        """Track the counter of a newly stored resource"""
+        self.update(index, resource.counter)
+    
+    def on_use(self, index, resource):
+        """Track the counter of a used resource"""
+        self.update(index, resource.counter)
+    
+    def on_aging(self, resources):
+        """
+        Re-read every counter and restore the heap order in place
+        
+        Halving never reverses the order of two counters but can create ties,
+        which the slot index breaks, so a bottom-up pass over the current
+        arrangement moves only the slots now out of place. Nothing moves if
+        no counter changed, as when every counter was already 0.
+        """
+        counters = [resource.counter for resource in resources]
+        if counters == self.counters:
+            return
+        self.counters[:] = counters
+        if self.evict_lowest:
+            self.keys[:] = [-counter for counter in counters]
+        for position in range(len(self.heap) // 2 - 1, -1, -1):
+            self._sift_down(position)
+    
+    def select_victim(self, resources, resource_type=None):
+        """Pick the slot with the highest counter"""
+        return self.peek_victim()
     
     def get_replacement_index(self, resources):
         """
@@ -18,7 +143,7 @@ class MFUAlgorithm:
         
         Args:
             resources (list): List of Resource objects
-            
+        
         Returns:
             int: Index of resource to replace
         """
@@ -28,22 +153,67 @@ class MFUAlgorithm:
         # Find resource with highest counter (most frequently used)
         max_counter = -1
         max_index = -1
-        print("MFUAlgorithm: get_replacement_index called")
-        
-        # Print resources with useful information
-        print("Resources:")
-        for i, resource in enumerate(resources):
-            print(f"  [{i}] Type: {resource.type}, Counter: {resource.counter}")
-        
         for i, resource in enumerate(resources):
             if resource.counter > max_counter:
                 max_counter = resource.counter
                 max_index = i
-                print(f"New max counter found: {max_counter} at index {max_index} (Type: {resource.type})")
         
-        if max_index >= 0:
-            print(f"Selected resource for replacement: [{max_index}] Type: {resources[max_index].type}, Counter: {resources[max_index].counter}")
-        else:
-            print("No resource selected for replacement")
-            
-        return max_index
\ No newline at end of file
+        if log.debug_enabled:
+            log.debug(
+                "replacement_scan",
+                slots=[[resource.type, resource.counter] for resource in resources],
+                victim=max_index,
+                victim_type=resources[max_index].type,
+                victim_counter=max_counter
+            )
+        
+        return max_index
+    
+    def _sift_up(self, position):
+        """Move the slot at a heap position up until the heap order holds"""
+        heap = self.heap
+        positions = self.positions
+        keys = self.keys
+        index = heap[position]
+        key = keys[index]
+        while position > 0:
+            parent = (position - 1) // 2
+            above = heap[parent]
+            # Stop below a higher key, or an equal one in a lower slot
+            above_key = keys[above]
+            if key < above_key or (key == above_key and index > above):
+                break
+            heap[position] = above
+            positions[above] = position
+            position = parent
+        heap[position] = index
+        positions[index] = position
+    
+    def _sift_down(self, position):
+        """Move the slot at a heap position down until the heap order holds"""
+        heap = self.heap
+        positions = self.positions
+        keys = self.keys
+        size = len(heap)
+        index = heap[position]
+        key = keys[index]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            below = heap[child]
+            below_key = keys[below]
+            if child + 1 < size:
+                right = heap[child + 1]
+                right_key = keys[right]
+                if right_key > below_key or (right_key == below_key and right < below):
+                    child += 1
+                    below = right
+                    below_key = right_key
+            if below_key < key or (below_key == key and below > index):
+                break
+            heap[position] = below
+            positions[below] = position
+            position = child
+        heap[position] = index
+        positions[index] = position
\ No newline at end of file
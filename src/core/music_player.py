@@ -0,0 +1,113 @@
+"""
+Music Player module - Streams background music with fades between tracks
+"""
+
+import os
+import pygame
+from src.utils.event_log import get_logger
+
+log = get_logger("audio")
+
+class MusicPlayer:
+    """
+    Plays one looping background track at a time through pygame.mixer.music
+    
+    pygame.mixer.music decodes from disk as it plays, so memory use does not
+    depend on the length of the track, and it leaves the Sound channels used
+    by the effects alone. Fades are done by the mixer: switching tracks fades
+    the current one out, and when the mixer reports it stopped (end_event)
+    the next one starts with a fade-in.
+    
+    This is not a crossfade. There is a single music stream, so the two
+    fades run one after the other, with a dip of about 2 * fade_ms in
+    between. Overlapping them would mean playing the incoming track on a
+    dedicated Channel until the handoff, and Channels only play fully
+    decoded Sounds, the memory cost this player exists to avoid.
+    """
+    
+    def __init__(self, tracks, volume=0.7, fade_ms=1000, end_event=pygame.USEREVENT + 2):
+        """
+        Initialize the music player
+        
+        Args:
+            tracks (dict): Track name -> path of the music file
+            volume (float): Music volume once faded in, from 0.0 to 1.0
+            fade_ms (int): Duration of each fade-out and fade-in in milliseconds
+            end_event (int): Event type the mixer posts when the music stops
+        """
+        self.tracks = tracks
+        self.volume = volume
+        self.fade_ms = fade_ms
+        self.end_event = end_event
+        self.current = None  # Track playing or fading in
+        self.pending = None  # Track to start once the current one has faded out
+    
+    def play(self, name):
+        """
+        Switch to a track, fading out whatever is playing
+        
+        Args:
+            name (str): Name of the track
+        
+        Returns:
+            bool: Whether the track is playing or will start after the fade-out
+        """
+        if name == self.pending or (name == self.current and self.pending is None):
+            return True
+        
+        path = self.tracks.get(name)
+        if path is None or not os.path.exists(path):
+            log.warning("music_unavailable", music=name, path=path)
+            return False
+        
+        if self.current and pygame.mixer.music.get_busy():
+            # A fade-out already in progress just gets a new successor
+            if self.pending is None:
+                pygame.mixer.music.fadeout(self.fade_ms)
+            self.pending = name
+            log.debug("music_fading_out", music=self.current, next=name)
+            return True
+        
+        return self.start(name)
+    
+    def handle_event(self, event):
+        """
+        Start the pending track once the previous one has faded out
+        
+        Args:
+            event: Pygame event of type end_event
+        """
+        if event.type == self.end_event and self.pending is not None:
+            self.start(self.pending)
+    
+    def start(self, name):
+        """
+        Start a track immediately, fading it in
+        
+        Args:
+            name (str): Name of the track
+        
+        Returns:
+            bool: Whether the track started
+        """
+        self.pending = None
+        try:
+            pygame.mixer.music.set_endevent(self.end_event)
+            pygame.mixer.music.load(self.tracks[name])
+            pygame.mixer.music.set_volume(self.volume)
+            pygame.mixer.music.play(loops=-1, fade_ms=self.fade_ms)
+        except pygame.error as e:
+            self.current = None
+            log.warning("music_unavailable", music=name, error=str(e))
+            return False
+        
+        self.current = name
+        log.info("music_started", music=name)
+        return True
+    
+    def stop(self):
+        """Stop the music without a fade"""
+        self.current = None
+        self.pending = None
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
\ No newline at end of file
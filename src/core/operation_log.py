@@ -0,0 +1,47 @@
+"""
+Operation Log module - Records the operations applied to an inventory
+"""
+
+class OperationLog:
+    """
+    In-memory record of inventory operations
+    
+    Attach one to a resource manager's recorder attribute to capture a
+    session; the resulting operations can be replayed against any manager
+    or replacement policy. Each operation is a tuple:
+        ("add", resource_type)
+        ("use", resource_type, amount)
+        ("consume", {resource_type: amount, ...})
+        ("age",)
+    """
+    
+    ADD = "add"
+    USE = "use"
+    CONSUME = "consume"
+    AGE = "age"
+    
+    def __init__(self):
+        """Initialize an empty log"""
+        self.operations = []
+    
+    def record_add(self, resource_type):
+        """Record an add_resource call"""
+        self.operations.append((self.ADD, resource_type))
+    
+    def record_use(self, resource_type, amount):
+        """Record a use_resource call"""
+        self.operations.append((self.USE, resource_type, amount))
+    
+    def record_consume(self, requirements):
+        """Record a consume_resources call"""
+        self.operations.append((self.CONSUME, dict(requirements)))
+    
+    def record_aging(self):
+        """Record an apply_aging call"""
+        self.operations.append((self.AGE,))
+    
+    def __len__(self):
+        return len(self.operations)
+    
+    def __iter__(self):
+        return iter(self.operations)
\ No newline at end of file
@@ -0,0 +1,239 @@
+"""
+Operation Trace module - Compact binary recording of inventory operations
+
+A trace file is a fixed-size header followed by 4-byte little-endian records
+(op: uint8, type code: uint8, amount: uint16). The header holds the
+inventory size and a table mapping type codes to names, which the writer
+fills in as new types appear. A consume_resources call is stored as one
+record per requirement, the last one flagged with CONSUME_END.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from src.core.operation_log import OperationLog
+
+MAGIC = b"MFUTRACE"
+VERSION = 1
+
+HEADER = struct.Struct("<8sHHHH")  # magic, version, inventory size, type count, reserved
+TYPE_NAME_SIZE = 16
+MAX_TYPES = 64
+DATA_OFFSET = HEADER.size + MAX_TYPES * TYPE_NAME_SIZE
+
+RECORD = struct.Struct("<BBH")
+
+# Record op codes
+OP_ADD = 1
+OP_USE = 2
+OP_CONSUME = 3      # A requirement of a consume group, more follow
+OP_CONSUME_END = 4  # Last requirement of a consume group
+OP_AGE = 5
+
+NO_TYPE = 255  # Type code of records that carry no type
+
+class TraceWriter:
+    """
+    Recorder that appends operations to a trace file
+    
+    Implements the same record_* interface as OperationLog, so it can be
+    attached as a resource manager's recorder.
+    """
+    
+    def __init__(self, path, inventory_size, resource_types=()):
+        """
+        Create a trace file, replacing any existing one
+        
+        Args:
+            path (str): File path of the trace
+            inventory_size (int): Inventory size of the recorded manager
+            resource_types (iterable): Type names to assign the first codes to
+        """
+        self.path = path
+        self.inventory_size = inventory_size
+        self.type_codes = {}
+        self.file = open(path, "w+b")
+        self.file.write(HEADER.pack(MAGIC, VERSION, inventory_size, 0, 0))
+        self.file.write(bytes(MAX_TYPES * TYPE_NAME_SIZE))
+        self.records = 0
+        
+        for resource_type in resource_types:
+            self.get_type_code(resource_type)
+    
+    def get_type_code(self, resource_type):
+        """
+        Get the code of a resource type, adding it to the header if it is new
+        
+        Args:
+            resource_type (str): Type of resource
+            
+        Returns:
+            int: Code of the resource type
+        """
+        code = self.type_codes.get(resource_type)
+        if code is not None:
+            return code
+        
+        code = len(self.type_codes)
+        name = resource_type.encode("utf-8")
+        if code >= MAX_TYPES or len(name) > TYPE_NAME_SIZE:
+            raise ValueError(f"Cannot store resource type {resource_type!r} in a trace")
+        
+        # Patch the type table and count in the header, then return to the end
+        end = self.file.tell()
+        self.file.seek(HEADER.size + code * TYPE_NAME_SIZE)
+        self.file.write(name.ljust(TYPE_NAME_SIZE, b"\0"))
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.inventory_size, code + 1, 0))
+        self.file.seek(end)
+        
+        self.type_codes[resource_type] = code
+        return code
+    
+    def record_add(self, resource_type):
+        """Record an add_resource call"""
+        self.file.write(RECORD.pack(OP_ADD, self.get_type_code(resource_type), 0))
+        self.records += 1
+    
+    def record_use(self, resource_type, amount):
+        """Record a use_resource call"""
+        self.file.write(RECORD.pack(OP_USE, self.get_type_code(resource_type), amount))
+        self.records += 1
+    
+    def record_consume(self, requirements):
+        """Record a consume_resources call"""
+        items = list(requirements.items())
+        if not items:
+            self.file.write(RECORD.pack(OP_CONSUME_END, NO_TYPE, 0))
+        for i, (resource_type, amount) in enumerate(items):
+            op = OP_CONSUME_END if i == len(items) - 1 else OP_CONSUME
+            self.file.write(RECORD.pack(op, self.get_type_code(resource_type), amount))
+        self.records += 1
+    
+    def record_aging(self):
+        """Record an apply_aging call"""
+        self.file.write(RECORD.pack(OP_AGE, NO_TYPE, 0))
+        self.records += 1
+    
+    def close(self):
+        """Flush and close the trace file"""
+        if not self.file.closed:
+            self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+class TraceReader:
+    """
+    Memory-mapped reader of a trace file
+    
+    Records are decoded straight from the mapping, so traces larger than
+    memory stream from disk page by page.
+    """
+    
+    def __init__(self, path):
+        """
+        Open and map a trace file
+        
+        Args:
+            path (str): File path of the trace
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        size = os.fstat(self.file.fileno()).st_size
+        if size < DATA_OFFSET:
+            self.file.close()
+            raise ValueError(f"Not a trace file: {path}")
+        
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(self.map, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            self.map.madvise(mmap.MADV_SEQUENTIAL)
+        
+        magic, version, self.inventory_size, type_count, _ = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported trace file: {path}")
+        
+        self.type_names = []
+        for code in range(type_count):
+            offset = HEADER.size + code * TYPE_NAME_SIZE
+            name = self.map[offset:offset + TYPE_NAME_SIZE].rstrip(b"\0")
+            self.type_names.append(name.decode("utf-8"))
+        
+        # Ignore a partial trailing record left by an interrupted session
+        self.record_count = (size - DATA_OFFSET) // RECORD.size
+    
+    def records(self):
+        """
+        Iterate over the raw records
+        
+        Returns:
+            generator: (op, type code, amount) tuples
+        """
+        end = DATA_OFFSET + self.record_count * RECORD.size
+        with memoryview(self.map) as view:
+            with view[DATA_OFFSET:end] as data:
+                yield from RECORD.iter_unpack(data)
+    
+    def words(self, chunk_records=1 << 20):
+        """
+        Iterate over the records in chunks of 32-bit words
+        
+        Each record reads as op | type code << 8 | amount << 16, which makes
+        a record usable as a single int, for instance in a dict key.
+        
+        Args:
+            chunk_records (int): Records per chunk
+        
+        Returns:
+            generator: array of uint32 per chunk
+        """
+        end = DATA_OFFSET + self.record_count * RECORD.size
+        with memoryview(self.map) as view:
+            for start in range(DATA_OFFSET, end, chunk_records * RECORD.size):
+                words = array("I")
+                words.frombytes(view[start:min(end, start + chunk_records * RECORD.size)])
+                if sys.byteorder != "little":
+                    words.byteswap()
+                yield words
+    
+    def operations(self):
+        """
+        Iterate over the trace as OperationLog tuples
+        
+        Returns:
+            iterator: Operations in OperationLog format
+        """
+        names = self.type_names
+        group = {}
+        for op, code, amount in self.records():
+            if op == OP_ADD:
+                yield (OperationLog.ADD, names[code])
+            elif op == OP_USE:
+                yield (OperationLog.USE, names[code], amount)
+            elif op == OP_CONSUME:
+                group[names[code]] = amount
+            elif op == OP_CONSUME_END:
+                if code != NO_TYPE:
+                    group[names[code]] = amount
+                yield (OperationLog.CONSUME, group)
+                group = {}
+            elif op == OP_AGE:
+                yield (OperationLog.AGE,)
+    
+    def close(self):
+        """Unmap and close the trace file"""
+        if not self.map.closed:
+            self.map.close()
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
\ No newline at end of file
@@ -0,0 +1,209 @@
+"""
+Replacement Policies module - Alternative replacement policies and the policy registry
+"""
+
+from collections import Counter, OrderedDict, deque
+from src.core.mfu_algorithm import MFUAlgorithm
+from src.core.replacement_policy import ReplacementPolicy
+
+class AgingLFUPolicy(MFUAlgorithm):
+    """
+    Least Frequently Used with aging
+    Replaces the resource with the lowest (halved over time) usage counter
+    """
+    
+    name = "aging_lfu"
+    evict_lowest = True
+
+class LFUPolicy(AgingLFUPolicy):
+    """
+    Least Frequently Used without aging
+    Counts the uses of each resource since it was stored, ignoring the
+    game's counters, and replaces the least used one
+    """
+    
+    name = "lfu"
+    
+    def reset(self, resources):
+        """Start every slot with no recorded uses"""
+        self.rebuild([0] * len(resources))
+    
+    def on_insert(self, index, resource):
+        """A new resource has not been used yet"""
+        self.update(index, 0)
+    
+    def on_use(self, index, resource):
+        """Count one more use of the slot"""
+        self.update(index, self.counters[index] + 1)
+    
+    def on_aging(self, resources):
+        """Use counts are not aged"""
+        pass
+
+class LRUPolicy(ReplacementPolicy):
+    """
+    Least Recently Used
+    Replaces the resource that has gone the longest without being stored or used
+    """
+    
+    name = "lru"
+    
+    def __init__(self):
+        """Initialize the LRU policy"""
+        self.order = OrderedDict()  # Slot indices, least recently touched first
+    
+    def reset(self, resources):
+        """Treat the inventory as touched in slot order"""
+        self.order = OrderedDict.fromkeys(range(len(resources)))
+    
+    def on_insert(self, index, resource):
+        """Mark the slot as most recently touched"""
+        self.order[index] = None
+        self.order.move_to_end(index)
+    
+    def on_use(self, index, resource):
+        """Mark the slot as most recently touched"""
+        self.order.move_to_end(index)
+    
+    def select_victim(self, resources, resource_type=None):
+        """Pick the least recently touched slot"""
+        return next(iter(self.order))
+
+class ClockPolicy(ReplacementPolicy):
+    """
+    CLOCK (second chance)
+    Sweeps a hand over the slots, clearing reference bits, and replaces the
+    first slot whose bit is already clear
+    """
+    
+    name = "clock"
+    
+    def __init__(self):
+        """Initialize the CLOCK policy"""
+        self.referenced = bytearray()  # Slot index -> reference bit
+        self.hand = 0
+    
+    def reset(self, resources):
+        """Mark every slot as referenced and restart the hand"""
+        self.referenced = bytearray(b"\x01" * len(resources))
+        self.hand = 0
+    
+    def on_insert(self, index, resource):
+        """Storing a resource counts as a reference"""
+        if index == len(self.referenced):
+            self.referenced.append(1)
+        else:
+            self.referenced[index] = 1
+    
+    def on_use(self, index, resource):
+        """Using a resource counts as a reference"""
+        self.referenced[index] = 1
+    
+    def select_victim(self, resources, resource_type=None):
+        """Advance the hand to the first unreferenced slot"""
+        referenced = self.referenced
+        size = len(referenced)
+        hand = self.hand % size
+        while referenced[hand]:
+            referenced[hand] = 0
+            hand = (hand + 1) % size
+        self.hand = (hand + 1) % size
+        return hand
+
+class ARCPolicy(ReplacementPolicy):
+    """
+    Adaptive Replacement Cache
+    Splits the slots into resources not used since they were stored (recent)
+    and resources used at least once (frequent), and adapts the share of
+    recent slots using ghost lists of the types that were evicted from each
+    side. Resources of one type are interchangeable, so ghosts are tracked
+    by type instead of by identity.
+    """
+    
+    name = "arc"
+    
+    def __init__(self):
+        """Initialize the ARC policy"""
+        self.recent = OrderedDict()    # T1: slots not used since stored, LRU first
+        self.frequent = OrderedDict()  # T2: slots used at least once, LRU first
+        self.recent_ghosts = deque()   # B1: types evicted from T1, oldest first
+        self.frequent_ghosts = deque() # B2: types evicted from T2, oldest first
+        self.recent_ghost_counts = Counter()
+        self.frequent_ghost_counts = Counter()
+        self.target = 0    # Adaptive target size of T1
+        self.capacity = 0  # Number of slots seen
+    
+    def reset(self, resources):
+        """Treat every stored resource as recent and forget all ghosts"""
+        self.recent = OrderedDict.fromkeys(range(len(resources)))
+        self.frequent = OrderedDict()
+        self.recent_ghosts.clear()
+        self.frequent_ghosts.clear()
+        self.recent_ghost_counts.clear()
+        self.frequent_ghost_counts.clear()
+        self.target = 0
+        self.capacity = len(resources)
+    
+    def on_insert(self, index, resource):
+        """A newly stored resource starts on the recent side"""
+        self.frequent.pop(index, None)
+        self.recent[index] = None
+        self.recent.move_to_end(index)
+        self.capacity = max(self.capacity, index + 1)
+    
+    def on_use(self, index, resource):
+        """A used resource moves to the most recent end of the frequent side"""
+        self.recent.pop(index, None)
+        self.frequent[index] = None
+        self.frequent.move_to_end(index)
+    
+    def select_victim(self, resources, resource_type=None):
+        """Adapt the recent target on a ghost hit, then evict from the side over its share"""
+        if self.recent_ghost_counts[resource_type]:
+            step = max(1, len(self.frequent_ghosts) // len(self.recent_ghosts))
+            self.target = min(self.capacity, self.target + step)
+            self._forget(self.recent_ghosts, self.recent_ghost_counts, resource_type)
+        elif self.frequent_ghost_counts[resource_type]:
+            step = max(1, len(self.recent_ghosts) // len(self.frequent_ghosts))
+            self.target = max(0, self.target - step)
+            self._forget(self.frequent_ghosts, self.frequent_ghost_counts, resource_type)
+        
+        if self.recent and (len(self.recent) > self.target or not self.frequent):
+            index = self.recent.popitem(last=False)[0]
+            self._remember(self.recent_ghosts, self.recent_ghost_counts, resources[index].type)
+        else:
+            index = self.frequent.popitem(last=False)[0]
+            self._remember(self.frequent_ghosts, self.frequent_ghost_counts, resources[index].type)
+        return index
+    
+    def _remember(self, ghosts, counts, resource_type):
+        """Add an evicted type to a ghost list bounded by the capacity"""
+        ghosts.append(resource_type)
+        counts[resource_type] += 1
+        while len(ghosts) > self.capacity:
+            counts[ghosts.popleft()] -= 1
+    
+    def _forget(self, ghosts, counts, resource_type):
+        """Remove the oldest ghost of a type once it has been hit, as ARC moves it back into the cache"""
+        ghosts.remove(resource_type)
+        counts[resource_type] -= 1
+
+# Policy name -> policy class, for Config.REPLACEMENT_POLICY
+POLICIES = {
+    policy.name: policy
+    for policy in (MFUAlgorithm, LFUPolicy, AgingLFUPolicy, LRUPolicy, ClockPolicy, ARCPolicy)
+}
+
+def create_policy(name):
+    """
+    Create a replacement policy by name
+    
+    Args:
+        name (str): One of the keys of POLICIES
+        
+    Returns:
+        ReplacementPolicy: A new policy instance
+    """
+    if name not in POLICIES:
+        raise ValueError(f"Unknown replacement policy: {name} (expected one of {', '.join(POLICIES)})")
+    return POLICIES[name]()
\ No newline at end of file
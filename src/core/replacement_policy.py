@@ -0,0 +1,69 @@
+"""
+Replacement Policy module - Interface for inventory replacement policies
+"""
+
+from abc import ABC, abstractmethod
+
+class ReplacementPolicy(ABC):
+    """
+    Base class for the policies that pick which slot a full inventory overwrites
+    
+    The owning ResourceManager reports every slot event to the policy, so a
+    policy can keep whatever bookkeeping it needs and answer select_victim()
+    without scanning the inventory. Subclasses must implement select_victim();
+    the event hooks default to doing nothing.
+    """
+    
+    # Name used to select the policy from Config.REPLACEMENT_POLICY
+    name = None
+    
+    def reset(self, resources):
+        """
+        Rebuild the policy state from an inventory
+        
+        Args:
+            resources (list): List of Resource objects, in slot order
+        """
+        pass
+    
+    def on_insert(self, index, resource):
+        """
+        Called when a resource is stored in a slot, new or overwritten
+        
+        Args:
+            index (int): Slot index
+            resource (Resource): Resource now in the slot
+        """
+        pass
+    
+    def on_use(self, index, resource):
+        """
+        Called after the resource in a slot has been used
+        
+        Args:
+            index (int): Slot index
+            resource (Resource): Resource in the slot
+        """
+        pass
+    
+    def on_aging(self, resources):
+        """
+        Called after the counters of the inventory have been halved
+        
+        Args:
+            resources (list): List of Resource objects, in slot order
+        """
+        pass
+    
+    @abstractmethod
+    def select_victim(self, resources, resource_type=None):
+        """
+        Pick the slot to overwrite; only called right before that happens
+        
+        Args:
+            resources (list): List of Resource objects, in slot order
+            resource_type (str, optional): Type of the incoming resource
+            
+        Returns:
+            int: Index of resource to replace
+        """
\ No newline at end of file
@@ -2,17 +2,59 @@
 Resource Manager module - Handles game resources and inventory
 """
 
+from array import array
+from bisect import bisect_left, insort
 from src.core.mfu_algorithm import MFUAlgorithm
-from src.entities.resource import Resource
+from src.core.replacement_policies import create_policy
+from src.entities.resource import Resource, AgingEpoch, LazyAgingResource
 
 class ResourceManager:
     """Manages the player's inventory and resource collection"""
     
-    def __init__(self, inventory_size=6):
-        """Initialize the resource manager"""
+    def __init__(self, inventory_size=6, lazy_aging=False, policy="mfu",
+                 counter_increment=Resource.COUNTER_INCREMENT, counter_max=Resource.COUNTER_MAX,
+                 toxic_threshold=Resource.TOXIC_THRESHOLD):
+        """
+        Initialize the resource manager
+        
+        Args:
+            inventory_size (int): Number of inventory slots
+            lazy_aging (bool): Age counters on read through a global epoch
+                instead of halving every resource on each aging pass
+            policy (str or ReplacementPolicy): Replacement policy, or the
+                name of one registered in replacement_policies.POLICIES
+            counter_increment (int): How much a counter increases when used
+            counter_max (int): Saturation value of counters
+            toxic_threshold (int): Counter value above which removal is toxic
+        """
         self.inventory = []
         self.inventory_size = inventory_size
-        self.mfu_algorithm = MFUAlgorithm()
+        self.type_slots = {}  # Resource type -> sorted slot indices holding that type
+        
+        # Counter settings that differ from the Resource class defaults
+        self.resource_settings = {
+            name: value
+            for name, value in (
+                ("COUNTER_INCREMENT", counter_increment),
+                ("COUNTER_MAX", counter_max),
+                ("TOXIC_THRESHOLD", toxic_threshold)
+            )
+            if value != getattr(Resource, name)
+        }
+        
+        # Replacement policy, kept in sync with every slot event
+        if isinstance(policy, str):
+            policy = create_policy(policy)
+        self.policy = policy
+        self.policy.reset(self.inventory)
+        
+        # Lazy aging state
+        self.lazy_aging = lazy_aging
+        self.aging_epoch = AgingEpoch()
+        self.policy_epoch = 0  # Epoch the policy last saw aging in
+        
+        # Optional operation recorder (see OperationLog)
+        self.recorder = None
     
     def add_resource(self, resource_type):
         """
@@ -28,28 +70,157 @@ class ResourceManager:
                 - replaced_resource (Resource or None): The resource that was replaced, if any
                 - toxic_damage (int): Amount of damage from toxic replacement, if any
         """
+        if self.recorder is not None:
+            self.recorder.record_add(resource_type)
+        
         # Create new resource
-        new_resource = Resource(resource_type)
+        new_resource = self.create_resource(resource_type)
         
         # If inventory has space, simply add the resource
         if len(self.inventory) < self.inventory_size:
-            self.inventory.append(new_resource)
+            self.append_slot(new_resource)
             return True, None, 0
         
-        # Inventory is full, use MFU to replace a resource
-        replaced_index = self.mfu_algorithm.get_replacement_index(self.inventory)
-        replaced_resource = self.inventory[replaced_index]
+        # Inventory is full, let the replacement policy pick a resource
+        replaced_index = self.get_victim_index(resource_type)
+        replaced_resource = self.replace_slot(replaced_index, new_resource)
         
         # Check if replacement is toxic (high counter value)
         toxic_damage = 0
         if replaced_resource.counter > replaced_resource.TOXIC_THRESHOLD:
             toxic_damage = 1  # Player takes 1 damage
         
-        # Replace the resource
-        self.inventory[replaced_index] = new_resource
-        
         return True, replaced_resource, toxic_damage
     
+    def add_resources(self, resource_types):
+        """
+        Add a sequence of resources in one pass
+        Equivalent to calling add_resource for each type in order
+        
+        With the MFU policy the batch skips the per-resource policy
+        dispatch: free slots are filled with one extend, and every eviction
+        reads the victim straight off the heap root and zeroes its counter,
+        which sifts the next victim up. Once the root counter is 0 the rest
+        of the batch replaces that slot in turn and is settled at once.
+        Other policies are asked for every victim in turn.
+        
+        Args:
+            resource_types (iterable): Types of resources to add
+            
+        Returns:
+            tuple: (replaced_slots, replaced_counters, toxic_damage)
+                - replaced_slots (array): Per added resource, the slot it replaced, or -1 if it took a free slot
+                - replaced_counters (array): Per added resource, the counter of the replaced resource, or -1
+                - toxic_damage (int): Total damage from toxic replacements
+        """
+        resource_types = list(resource_types)
+        if self.recorder is not None:
+            for resource_type in resource_types:
+                self.recorder.record_add(resource_type)
+        
+        policy = self.policy
+        if type(policy) is not MFUAlgorithm:
+            return self.add_each_resource(resource_types)
+        
+        new_resources = self.create_resources(resource_types)
+        inventory = self.inventory
+        type_slots = self.type_slots
+        toxic_damage = 0
+        
+        # Fill the free slots with one extend; new resources start at counter 0
+        free = self.inventory_size - len(inventory)
+        if free > 0:
+            free = min(free, len(new_resources))
+            first = len(inventory)
+            inventory.extend(new_resources[:free])
+            for index in range(first, first + free):
+                type_slots.setdefault(inventory[index].type, []).append(index)
+                policy.update(index, 0)
+            replaced_slots = array("i", [-1] * free)
+            replaced_counters = array("i", [-1] * free)
+            new_resources = new_resources[free:]
+        else:
+            replaced_slots = array("i")
+            replaced_counters = array("i")
+        
+        if new_resources:
+            if self.policy_epoch != self.aging_epoch.value:
+                policy.on_aging(inventory)
+                self.policy_epoch = self.aging_epoch.value
+            
+            # The heap root is the victim; zeroing it brings up the next one
+            heap = policy.heap
+            heap_counters = policy.counters
+            zero_victim = policy.zero_victim
+            add_slot = replaced_slots.append
+            add_counter = replaced_counters.append
+            toxic_threshold = inventory[0].TOXIC_THRESHOLD
+            lazy_aging = self.lazy_aging
+            for position, resource in enumerate(new_resources):
+                index = heap[0]
+                counter = heap_counters[index]
+                if counter:
+                    if counter > toxic_threshold:
+                        toxic_damage += 1
+                    add_slot(index)
+                    add_counter(counter)
+                    zero_victim()
+                else:
+                    # The root holds the highest counter, so every counter is 0 and
+                    # this slot takes each remaining resource in turn, keeping the last
+                    remaining = len(new_resources) - position
+                    replaced_slots.extend([index] * remaining)
+                    replaced_counters.extend([0] * remaining)
+                    resource = new_resources[-1]
+                
+                replaced_resource = inventory[index]
+                if lazy_aging:
+                    replaced_resource.detach()
+                inventory[index] = resource
+                if replaced_resource.type != resource.type:
+                    old_slots = type_slots[replaced_resource.type]
+                    del old_slots[bisect_left(old_slots, index)]
+                    insort(type_slots.setdefault(resource.type, []), index)
+                if not counter:
+                    break
+        
+        return replaced_slots, replaced_counters, toxic_damage
+    
+    def add_each_resource(self, resource_types):
+        """
+        Add resources one at a time, asking the policy for every victim
+        
+        Args:
+            resource_types (list): Types of resources to add
+            
+        Returns:
+            tuple: Same as add_resources
+        """
+        replaced_slots = array("i")
+        replaced_counters = array("i")
+        toxic_damage = 0
+        
+        inventory = self.inventory
+        inventory_size = self.inventory_size
+        for resource_type in resource_types:
+            new_resource = self.create_resource(resource_type)
+            
+            if len(inventory) < inventory_size:
+                self.append_slot(new_resource)
+                replaced_slots.append(-1)
+                replaced_counters.append(-1)
+                continue
+            
+            replaced_index = self.get_victim_index(resource_type)
+            replaced_resource = self.replace_slot(replaced_index, new_resource)
+            counter = replaced_resource.counter
+            if counter > replaced_resource.TOXIC_THRESHOLD:
+                toxic_damage += 1
+            replaced_slots.append(replaced_index)
+            replaced_counters.append(counter)
+        
+        return replaced_slots, replaced_counters, toxic_damage
+    
     def use_resource(self, resource_type, amount=1):
         """
         Use resources of specified type from inventory
@@ -61,29 +232,164 @@ class ResourceManager:
         Returns:
             bool: Whether the resources were successfully used
         """
-        # Find resources of the specified type
-        available_resources = [r for r in self.inventory if r.type == resource_type]
+        if self.recorder is not None:
+            self.recorder.record_use(resource_type, amount)
         
         # Check if we have enough
-        if len(available_resources) < amount:
+        if self.get_resource_count(resource_type) < amount:
             return False
         
-        # Use the resources (increase their counters)
-        for i in range(amount):
-            resource = available_resources[i]
-            resource.use()  # Increases counter
+        self.use_first_slots(resource_type, amount)
+        return True
+    
+    def use_resources(self, requirements):
+        """
+        Use several resource types in one call
+        Equivalent to calling use_resource for each entry in order
         
+        Args:
+            requirements (dict): Resource type -> number of resources to use
+            
+        Returns:
+            array: Per entry, 1 if the resources were used and 0 otherwise
+        """
+        results = array("B")
+        for resource_type, amount in requirements.items():
+            results.append(self.use_resource(resource_type, amount))
+        return results
+    
+    def consume_resources(self, requirements):
+        """
+        Use every listed resource, or none of them if any is short
+        
+        Args:
+            requirements (dict): Resource type -> number of resources to use
+            
+        Returns:
+            bool: Whether all the resources were used
+        """
+        if self.recorder is not None:
+            self.recorder.record_consume(requirements)
+        
+        # Check if we have enough of every type before touching any counter
+        type_slots = self.type_slots
+        for resource_type, amount in requirements.items():
+            if len(type_slots.get(resource_type, ())) < amount:
+                return False
+        
+        use_first_slots = self.use_first_slots
+        for resource_type, amount in requirements.items():
+            use_first_slots(resource_type, amount)
         return True
     
+    def use_first_slots(self, resource_type, amount):
+        """Use the first slots holding a resource type, in slot order"""
+        inventory = self.inventory
+        on_use = self.policy.on_use
+        for index in self.type_slots.get(resource_type, ())[:amount]:
+            resource = inventory[index]
+            resource.use()  # Increases counter
+            on_use(index, resource)
+    
+    def create_resource(self, resource_type):
+        """Create a resource that follows this inventory's aging mode and counter settings"""
+        if self.lazy_aging:
+            resource = LazyAgingResource(resource_type, self.aging_epoch)
+        else:
+            resource = Resource(resource_type)
+        
+        for name, value in self.resource_settings.items():
+            setattr(resource, name, value)
+        return resource
+    
+    def create_resources(self, resource_types):
+        """
+        Create one resource per type, as create_resource would
+        
+        Args:
+            resource_types (list): Types of resources to create
+            
+        Returns:
+            list: New resources, in order
+        """
+        if self.resource_settings:
+            return [self.create_resource(resource_type) for resource_type in resource_types]
+        if self.lazy_aging:
+            epoch = self.aging_epoch
+            return [LazyAgingResource(resource_type, epoch) for resource_type in resource_types]
+        return list(map(Resource, resource_types))
+    
+    def append_slot(self, resource):
+        """Store a resource in the next free slot and index it"""
+        index = len(self.inventory)
+        self.inventory.append(resource)
+        self.policy.on_insert(index, resource)
+        # The new slot has the highest index, so appending keeps the bucket sorted
+        self.type_slots.setdefault(resource.type, []).append(index)
+    
+    def replace_slot(self, index, resource):
+        """
+        Store a resource in an occupied slot and index it
+        
+        Args:
+            index (int): Slot to overwrite
+            resource (Resource): Resource to store
+            
+        Returns:
+            Resource: The resource that was in the slot
+        """
+        replaced_resource = self.inventory[index]
+        if self.lazy_aging:
+            replaced_resource.detach()
+        
+        self.inventory[index] = resource
+        self.policy.on_insert(index, resource)
+        if replaced_resource.type != resource.type:
+            old_slots = self.type_slots[replaced_resource.type]
+            del old_slots[bisect_left(old_slots, index)]
+            insort(self.type_slots.setdefault(resource.type, []), index)
+        
+        return replaced_resource
+    
+    def get_victim_index(self, resource_type=None):
+        """
+        Get the slot the replacement policy overwrites for an incoming resource
+        Stateful policies (CLOCK, ARC) advance, so call it only right before replacing
+        
+        Args:
+            resource_type (str, optional): Type of the incoming resource
+            
+        Returns:
+            int: Index of resource to replace
+        """
+        # Report epochs that passed since the policy last saw aging
+        if self.policy_epoch != self.aging_epoch.value:
+            self.policy.on_aging(self.inventory)
+            self.policy_epoch = self.aging_epoch.value
+        
+        return self.policy.select_victim(self.inventory, resource_type)
+    
     def apply_aging(self):
         """Apply aging to all resources (divide counters by 2)"""
+        if self.recorder is not None:
+            self.recorder.record_aging()
+        
+        if self.lazy_aging:
+            # Counters are shifted on read; the policy hears of it on next eviction
+            self.aging_epoch.value += 1
+            return
+        
         for resource in self.inventory:
             resource.apply_aging()
+        
+        self.policy.on_aging(self.inventory)
     
     def get_resource_count(self, resource_type):
         """Get count of resources of specified type in inventory"""
-        return sum(1 for r in self.inventory if r.type == resource_type)
+        return len(self.type_slots.get(resource_type, ()))
     
     def clear_inventory(self):
         """Clear the inventory"""
-        self.inventory = []
\ No newline at end of file
+        self.inventory = []
+        self.type_slots = {}
+        self.policy.reset(self.inventory)
\ No newline at end of file
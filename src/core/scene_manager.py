@@ -3,22 +3,47 @@ Scene Manager module - Manages game scenes and transitions
 """
 
 class SceneManager:
-    """Manages different game scenes and transitions between them"""
+    """
+    Manages different game scenes and transitions between them
     
-    def __init__(self):
-        """Initialize the scene manager"""
+    With an AssetLoader, the manager also owns the scenes' assets: a scene's
+    manifest is loaded when it is activated, the manifest of the scene most
+    likely to follow it is preloaded in idle time, and assets that neither
+    of the two lists are released.
+    """
+    
+    def __init__(self, asset_loader=None):
+        """
+        Initialize the scene manager
+        
+        Args:
+            asset_loader (AssetLoader, optional): Loader of the assets listed in scene manifests
+        """
         self.scenes = {}
         self.active_scene = None
+        self.active_scene_id = None
+        
+        # Scene asset management
+        self.asset_loader = asset_loader
+        self.next_scenes = {}      # Scene id -> id of the scene most likely to follow it
+        self.preload_batch = None  # AssetBatch loading the next scene's assets
+        
+        # Regions to present with display.update() in dirty-rect mode
+        self.dirty_rects = []
+        self.full_redraw = True
     
-    def add_scene(self, scene_id, scene):
+    def add_scene(self, scene_id, scene, next_scene=None):
         """
         Add a scene to the manager
         
         Args:
             scene_id (str): Unique identifier for the scene
             scene (Scene): Scene object to add
+            next_scene (str, optional): ID of the scene most likely to follow this one
         """
         self.scenes[scene_id] = scene
+        if next_scene:
+            self.next_scenes[scene_id] = next_scene
     
     def set_active_scene(self, scene_id):
         """
@@ -31,13 +56,22 @@ class SceneManager:
             bool: Whether the scene was successfully activated
         """
         if scene_id in self.scenes:
+            # Load whatever the preloader has not reached yet
+            self.load_scene_assets(scene_id)
+            
             # If there's a current scene, exit it
             if self.active_scene:
                 self.active_scene.on_exit()
             
             # Set and enter new scene
             self.active_scene = self.scenes[scene_id]
+            self.active_scene_id = scene_id
             self.active_scene.on_enter()
+            self.invalidate()
+            
+            # Keep only the assets of this scene and the next one
+            self.release_unused_assets()
+            self.schedule_preload()
             
             # Start playing the appropriate background music
             # We need to access the game instance from the scene
@@ -48,6 +82,106 @@ class SceneManager:
         
         return False
     
+    def get_manifest(self, scene_id):
+        """
+        Get the asset manifest of a scene
+        
+        Args:
+            scene_id (str): ID of the scene, or None
+            
+        Returns:
+            list: Asset names, empty for an unknown scene
+        """
+        scene = self.scenes.get(scene_id)
+        return scene.get_asset_manifest() if scene else []
+    
+    def start_scene_load(self, scene_id):
+        """
+        Start loading a scene's assets without activating it
+        
+        Args:
+            scene_id (str): ID of the scene
+            
+        Returns:
+            AssetBatch or None: Batch to poll() until it is done, or None without an asset loader
+        """
+        if self.asset_loader is None:
+            return None
+        return self.asset_loader.start_batch(self.get_manifest(scene_id))
+    
+    def load_scene_assets(self, scene_id):
+        """
+        Load every asset in a scene's manifest that is not loaded yet
+        
+        Args:
+            scene_id (str): ID of the scene
+        """
+        if self.asset_loader is None:
+            return
+        
+        # Let an unfinished preload complete instead of decoding its assets twice
+        if self.preload_batch is not None:
+            self.preload_batch.wait()
+            self.preload_batch = None
+        self.asset_loader.load_batch(self.get_manifest(scene_id))
+    
+    def release_unused_assets(self):
+        """
+        Release the loaded assets that neither the active scene nor the next one lists
+        
+        Returns:
+            list: Names of the released assets
+        """
+        if self.asset_loader is None:
+            return []
+        live = set(self.get_manifest(self.active_scene_id))
+        live.update(self.get_manifest(self.next_scenes.get(self.active_scene_id)))
+        
+        released = [name for name in self.asset_loader.loaded_assets() if name not in live]
+        for name in released:
+            self.asset_loader.unload(name)
+        return released
+    
+    def schedule_preload(self):
+        """Start decoding the assets of the scene that follows the active one"""
+        if self.asset_loader is None:
+            return
+        self.preload_batch = self.start_scene_load(self.next_scenes.get(self.active_scene_id))
+    
+    def preload(self, deadline):
+        """
+        Advance the preload of the next scene's assets until a deadline passes
+        
+        Called with whatever is left of the frame budget. Decodes run on the
+        loader's threads; this stores the finished ones, and without threads
+        loads assets one at a time, so the last one may finish past the
+        deadline.
+        
+        Args:
+            deadline (float): time.perf_counter() value to stop at
+            
+        Returns:
+            bool: Whether assets are still being preloaded
+        """
+        if self.preload_batch is None:
+            return False
+        if self.preload_batch.poll(deadline):
+            self.preload_batch = None
+            return False
+        return True
+    
+    def get_idle_timeout(self):
+        """
+        Get how long the screen stays the same without input
+        
+        Returns:
+            float or None: Simulated milliseconds until the active scene changes, or
+                None if it changes every tick or assets are still being preloaded
+        """
+        if self.active_scene is None or self.preload_batch is not None:
+            return None
+        return self.active_scene.get_idle_timeout()
+    
     def handle_event(self, event):
         """
         Pass event to active scene
@@ -65,10 +199,53 @@ class SceneManager:
     
     def draw(self, surface):
         """
-        Draw the active scene
+        Draw the active scene, unless nothing on screen would change
+        
+        The scene reports its changes before drawing. When it reports none
+        and nothing else marked the frame dirty, the surface still holds
+        the last drawn frame, so the draw is skipped entirely.
         
         Args:
             surface: Pygame surface to draw on
+            
+        Returns:
+            bool: Whether the scene was drawn
         """
-        if self.active_scene:
-            self.active_scene.draw(surface)
\ No newline at end of file
+        if not self.active_scene:
+            return False
+        
+        rects = self.active_scene.get_dirty_rects()
+        if rects is None:
+            self.full_redraw = True
+        else:
+            self.dirty_rects.extend(rects)
+        if not self.full_redraw and not self.dirty_rects:
+            return False
+        
+        self.active_scene.draw(surface)
+        return True
+    
+    def mark_dirty(self, rect):
+        """
+        Report a changed screen region outside the active scene's own tracking
+        
+        Args:
+            rect (pygame.Rect): Changed region
+        """
+        self.dirty_rects.append(rect)
+    
+    def invalidate(self):
+        """Present the whole screen on the next frame"""
+        self.full_redraw = True
+    
+    def take_dirty_rects(self):
+        """
+        Get the regions to present for this frame and start a new frame
+        
+        Returns:
+            list or None: Changed rectangles, or None for a full-screen update
+        """
+        rects = None if self.full_redraw else self.dirty_rects
+        self.dirty_rects = []
+        self.full_redraw = False
+        return rects
\ No newline at end of file
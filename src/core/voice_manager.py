@@ -0,0 +1,148 @@
+"""
+Voice Manager module - Plays sound effects on a bounded set of mixer channels
+"""
+
+import pygame
+from src.utils.event_log import get_logger
+
+log = get_logger("audio")
+
+# Settings of sounds missing from the effect table
+DEFAULT_EFFECT = {"priority": 0, "voices": 1, "retrigger_ms": 0, "reserved": 0}
+
+class VoiceManager:
+    """
+    Decides which mixer channel, if any, each sound effect plays on
+    
+    The mixer gets a fixed number of channels, so the cost of mixing never
+    grows with the number of effects requested. Per sound, the effect table
+    sets:
+        priority: a sound may take over a shared channel playing a lower priority sound
+        voices: how many copies of the sound may play at once; the oldest copy
+            is restarted when the limit is reached
+        retrigger_ms: a request within this long of the last start is dropped
+        reserved: channels kept for this sound alone, taken from the front of
+            the mixer's channels and excluded from pygame's own channel search
+    A request that finds no free shared channel and nothing to preempt is dropped.
+    """
+    
+    def __init__(self, sounds, channel_count=8, effects=None):
+        """
+        Initialize the voice manager
+        
+        Args:
+            sounds (dict): Sound name -> pygame.mixer.Sound, e.g. AssetLoader.sounds
+            channel_count (int): Mixer channels used for effects
+            effects (dict, optional): Sound name -> settings, see the class docstring
+        """
+        self.sounds = sounds
+        self.channel_count = channel_count
+        self.effects = effects or {}
+        
+        # Set up on the first play, once the mixer is known to be initialized
+        self.channels = None
+        self.reserved = {}         # Sound name -> indices of its reserved channels
+        self.shared = []           # Indices of the channels any sound may use
+        self.voices = []           # Channel index -> (name, priority, start time) of its last sound
+        self.last_started = {}     # Sound name -> time it last started playing
+        self.dropped = 0
+    
+    def effect(self, name):
+        """Settings of a sound, with defaults for anything not configured"""
+        return {**DEFAULT_EFFECT, **self.effects.get(name, {})}
+    
+    def setup(self):
+        """Allocate the mixer channels and split them into reserved and shared ones"""
+        pygame.mixer.set_num_channels(self.channel_count)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.channel_count)]
+        self.voices = [None] * self.channel_count
+        
+        index = 0
+        for name in self.effects:
+            count = min(self.effect(name)["reserved"], self.channel_count - index - 1)
+            if count > 0:
+                self.reserved[name] = list(range(index, index + count))
+                index += count
+        pygame.mixer.set_reserved(index)
+        self.shared = list(range(index, self.channel_count))
+    
+    def play(self, name):
+        """
+        Play a sound effect if its limits and the free channels allow it
+        
+        Args:
+            name (str): Name of the sound
+        
+        Returns:
+            pygame.mixer.Channel or None: Channel the sound plays on, or None if it was dropped
+        """
+        sound = self.sounds.get(name)
+        if sound is None:
+            return None
+        if self.channels is None:
+            self.setup()
+        
+        effect = self.effect(name)
+        now = pygame.time.get_ticks()
+        last = self.last_started.get(name)
+        if last is not None and now - last < effect["retrigger_ms"]:
+            return self.drop(name, "retrigger")
+        
+        index = self.pick_channel(name, effect)
+        if index is None:
+            return self.drop(name, "no_channel")
+        
+        channel = self.channels[index]
+        channel.play(sound)
+        self.voices[index] = (name, effect["priority"], now)
+        self.last_started[name] = now
+        log.debug("sound_played", sound=name, channel=index)
+        return channel
+    
+    def pick_channel(self, name, effect):
+        """
+        Choose the channel a sound should play on
+        
+        Args:
+            name (str): Name of the sound
+            effect (dict): Settings of the sound
+        
+        Returns:
+            int or None: Channel index, or None if the sound should be dropped
+        """
+        # At the voice limit, restart the oldest copy of the same sound
+        playing = [index for index in range(self.channel_count) if self.is_playing(index, name)]
+        if len(playing) >= effect["voices"]:
+            return min(playing, key=lambda index: self.voices[index][2])
+        
+        # The sound's own channels, then free shared ones
+        candidates = self.reserved.get(name, []) + self.shared
+        for index in candidates:
+            if not self.channels[index].get_busy():
+                return index
+        
+        # Take over the oldest of the lowest priority sounds below this one
+        victims = [
+            index for index in self.shared
+            if self.voices[index] is not None and self.voices[index][1] < effect["priority"]
+        ]
+        if not victims:
+            return None
+        return min(victims, key=lambda index: (self.voices[index][1], self.voices[index][2]))
+    
+    def is_playing(self, index, name):
+        """Whether a channel is busy with a given sound"""
+        voice = self.voices[index]
+        return voice is not None and voice[0] == name and self.channels[index].get_busy()
+    
+    def drop(self, name, reason):
+        """Record a request that did not play"""
+        self.dropped += 1
+        log.debug("sound_dropped", sound=name, reason=reason)
+        return None
+    
+    def stop(self):
+        """Stop every sound effect"""
+        if self.channels is not None:
+            for channel in self.channels:
+                channel.stop()
\ No newline at end of file
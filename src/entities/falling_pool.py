@@ -0,0 +1,273 @@
+"""
+Falling Pool module - Array-backed storage for the resources falling in CollectionScene
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # The web build has no NumPy; the pool falls back to array.array
+    np = None
+
+class FallingEntityPool:
+    """
+    Falling entities stored as parallel arrays instead of one object each
+    
+    Positions, velocities, type codes, a collectible flag and a spawn serial
+    live in preallocated arrays whose first `count` slots are in use; the
+    capacity doubles when it runs out and is never given back. Removing an
+    entity moves the last one into its slot (swap-remove), so removal is O(1)
+    and nothing is allocated per entity per frame.
+    
+    With NumPy, step() moves every entity and tests all of them against the
+    player in a few array operations. Without it the same arithmetic runs in
+    a plain loop over array.array storage, still without creating Rects.
+    Slot order is not spawn order once entities have been removed; collected
+    entities are reported oldest first using the spawn serial.
+    """
+    
+    def __init__(self, type_names, entity_size=(30, 30), capacity=256, use_numpy=True):
+        """
+        Initialize the pool
+        
+        Args:
+            type_names (iterable): Resource type names; their position is the type code
+            entity_size (tuple): Width and height of the collision box of every entity
+            capacity (int): Initial number of slots
+            use_numpy (bool): Use NumPy arrays when NumPy is installed
+        """
+        self.numpy = use_numpy and np is not None
+        self.type_names = list(type_names)
+        self.type_codes = {name: code for code, name in enumerate(self.type_names)}
+        self.width, self.height = entity_size
+        
+        self.count = 0
+        self.capacity = 0
+        self.next_serial = 0
+        self.x = self.y = self.vx = self.vy = None
+        self.types = self.collectible = self.serials = None
+        self.allocate(max(capacity, 1))
+    
+    def allocate(self, capacity):
+        """
+        Resize the arrays to a new capacity, keeping the entities in use
+        
+        Args:
+            capacity (int): New number of slots, at least count
+        """
+        fields = ("x", "y", "vx", "vy", "types", "collectible", "serials")
+        if self.numpy:
+            dtypes = (np.int32, np.int32, np.int32, np.int32, np.uint8, np.bool_, np.int64)
+            for field, dtype in zip(fields, dtypes):
+                new = np.zeros(capacity, dtype=dtype)
+                old = getattr(self, field)
+                if old is not None:
+                    new[:self.count] = old[:self.count]
+                setattr(self, field, new)
+        else:
+            typecodes = ("i", "i", "i", "i", "B", "B", "q")
+            for field, typecode in zip(fields, typecodes):
+                new = array(typecode, bytes(capacity * array(typecode).itemsize))
+                old = getattr(self, field)
+                if old is not None:
+                    new[:self.count] = old[:self.count]
+                setattr(self, field, new)
+        self.capacity = capacity
+    
+    def spawn(self, resource_type, x, y=0, vx=0, vy=3, collectible=True):
+        """
+        Add an entity
+        
+        Args:
+            resource_type (str): Type of resource
+            x (int): Left edge
+            y (int): Top edge
+            vx (int): Horizontal movement per step
+            vy (int): Vertical movement per step
+            collectible (bool): Whether the player picks it up on contact
+        
+        Returns:
+            int: Slot of the new entity (valid until the next removal)
+        """
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+        index = self.count
+        self.x[index] = x
+        self.y[index] = y
+        self.vx[index] = vx
+        self.vy[index] = vy
+        self.types[index] = self.type_codes[resource_type]
+        self.collectible[index] = collectible
+        self.serials[index] = self.next_serial
+        self.next_serial += 1
+        self.count += 1
+        return index
+    
+    def remove(self, index):
+        """
+        Remove the entity in a slot by moving the last entity into it
+        
+        Args:
+            index (int): Slot to free
+        """
+        last = self.count - 1
+        if index != last:
+            for field in (self.x, self.y, self.vx, self.vy, self.types, self.collectible, self.serials):
+                field[index] = field[last]
+        self.count = last
+    
+    def clear(self):
+        """Remove every entity, keeping the capacity"""
+        self.count = 0
+    
+    def step(self, player_rect, bottom):
+        """
+        Move every entity, then remove those that reached the player or fell past the bottom
+        
+        Args:
+            player_rect (pygame.Rect): Collision box of the player
+            bottom (int): Entities whose top edge is below this are removed
+        
+        Returns:
+            list: Type names of the collected entities, oldest first
+        """
+        if self.count == 0:
+            return []
+        if self.numpy:
+            return self.step_numpy(player_rect, bottom)
+        return self.step_loop(player_rect, bottom)
+    
+    def step_numpy(self, player_rect, bottom):
+        """step() as array operations over all the slots in use"""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        
+        # Same test as Rect.colliderect for boxes with a non-zero size
+        hit = (
+            (x < player_rect.right) & (player_rect.x < x + self.width) &
+            (y < player_rect.bottom) & (player_rect.y < y + self.height) &
+            self.collectible[:n]
+        )
+        gone = hit | (y > bottom)
+        if not gone.any():
+            return []
+        
+        hits = np.flatnonzero(hit)
+        hits = hits[np.argsort(self.serials[hits])]
+        collected = [self.type_names[code] for code in self.types[hits].tolist()]
+        
+        # Highest slot first, so a slot moved down has already been checked
+        for index in np.flatnonzero(gone)[::-1].tolist():
+            self.remove(index)
+        return collected
+    
+    def step_loop(self, player_rect, bottom):
+        """step() as a plain loop, for when NumPy is not available"""
+        left, top, right, player_bottom = player_rect.x, player_rect.y, player_rect.right, player_rect.bottom
+        width, height = self.width, self.height
+        xs, ys, vxs, vys, collectible = self.x, self.y, self.vx, self.vy, self.collectible
+        hits = []
+        gone = []
+        for index in range(self.count):
+            x = xs[index] + vxs[index]
+            y = ys[index] + vys[index]
+            xs[index] = x
+            ys[index] = y
+            if collectible[index] and x < right and left < x + width and y < player_bottom and top < y + height:
+                hits.append(index)
+                gone.append(index)
+            elif y > bottom:
+                gone.append(index)
+        if not gone:
+            return []
+        
+        hits.sort(key=self.serials.__getitem__)
+        collected = [self.type_names[self.types[index]] for index in hits]
+        for index in reversed(gone):
+            self.remove(index)
+        return collected
+    
+    def positions(self, alpha=1.0):
+        """
+        Get the type code and position of every entity, in slot order
+        
+        Args:
+            alpha (float): Fraction of the last step to show; below 1 the
+                positions are moved back along the velocity, between the
+                previous step and the current one
+        
+        Returns:
+            zip: (type code, x, y) tuples
+        """
+        n = self.count
+        xs, ys = self.interpolate(alpha)
+        if self.numpy:
+            return zip(self.types[:n].tolist(), xs.tolist(), ys.tolist())
+        return zip(self.types[:n], xs, ys)
+    
+    def interpolate(self, alpha):
+        """
+        Positions of the slots in use moved back along the velocity
+        
+        Args:
+            alpha (float): Fraction of the last step to show
+        
+        Returns:
+            tuple: (xs, ys) as NumPy arrays or lists
+        """
+        n = self.count
+        back = 1.0 - alpha
+        if self.numpy:
+            if alpha >= 1.0:
+                return self.x[:n], self.y[:n]
+            xs = np.rint(self.x[:n] - self.vx[:n] * back).astype(np.int32)
+            ys = np.rint(self.y[:n] - self.vy[:n] * back).astype(np.int32)
+            return xs, ys
+        if alpha >= 1.0:
+            return list(self.x[:n]), list(self.y[:n])
+        xs = [round(x - vx * back) for x, vx in zip(self.x[:n], self.vx[:n])]
+        ys = [round(y - vy * back) for y, vy in zip(self.y[:n], self.vy[:n])]
+        return xs, ys
+    
+    def positions_by_type(self, alpha=1.0, slots=None, offsets=None):
+        """
+        Get the position of every entity, grouped by type code
+        
+        Drawing the groups one after another submits each image once for all
+        its entities, without a Python step per entity when NumPy is there.
+        
+        Args:
+            alpha (float): Fraction of the last step to show, see positions()
+            slots (sequence, optional): Slots to include, in ascending order;
+                every slot in use when None
+            offsets (list, optional): (dx, dy) added to the positions of each type code
+        
+        Returns:
+            list: For each type code, a list of (x, y) tuples in slot order
+        """
+        n = self.count
+        xs, ys = self.interpolate(alpha)
+        if offsets is None:
+            offsets = [(0, 0)] * len(self.type_names)
+        if self.numpy:
+            types = self.types[:n]
+            if slots is not None:
+                xs, ys, types = xs[slots], ys[slots], types[slots]
+            groups = []
+            for code, (dx, dy) in enumerate(offsets):
+                selected = types == code
+                groups.append(list(zip((xs[selected] + dx).tolist(), (ys[selected] + dy).tolist())))
+            return groups
+        
+        if slots is None:
+            slots = range(n)
+        groups = [[] for _ in self.type_names]
+        types = self.types
+        for index in slots:
+            code = types[index]
+            dx, dy = offsets[code]
+            groups[code].append((xs[index] + dx, ys[index] + dy))
+        return groups
\ No newline at end of file
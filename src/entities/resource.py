@@ -7,6 +7,7 @@ class Resource:
     
     # Class constants
     COUNTER_INCREMENT = 8  # How much counter increases when used
+    COUNTER_MAX = 255      # Counter saturates here (8-bit)
     TOXIC_THRESHOLD = 64   # Counter value above which removal is toxic
     
     def __init__(self, resource_type):
@@ -26,8 +27,9 @@ class Resource:
         Returns:
             bool: Whether the counter was successfully increased
         """
-        if self.counter < 255:  # 8-bit counter max
-            self.counter += self.COUNTER_INCREMENT
+        counter = self.counter
+        if counter < self.COUNTER_MAX:  # 8-bit counter max
+            self.counter = min(counter + self.COUNTER_INCREMENT, self.COUNTER_MAX)
             return True
         return False
     
@@ -36,4 +38,69 @@ class Resource:
         Apply aging to the resource (divide counter by 2)
         Simulates oxidation/degradation over time
         """
-        self.counter //= 2
\ No newline at end of file
+        self.counter //= 2
+
+def roll_resource_type(roll, probabilities):
+    """
+    Map a uniform roll in [0, 1) to a resource type
+    
+    Args:
+        roll (float): Uniform random number in [0, 1)
+        probabilities (dict): Resource type -> spawn probability, summing to 1
+        
+    Returns:
+        str: The resource type whose cumulative probability band contains the roll
+    """
+    cumulative = 0.0
+    for resource_type, probability in probabilities.items():
+        cumulative += probability
+        if roll < cumulative:
+            return resource_type
+    return resource_type
+
+class AgingEpoch:
+    """Global aging clock shared by a ResourceManager and its lazily aged resources"""
+    
+    __slots__ = ("value",)
+    
+    def __init__(self):
+        """Initialize the epoch counter"""
+        self.value = 0  # Number of aging passes applied so far
+
+class LazyAgingResource(Resource):
+    """
+    Resource whose aging is applied when the counter is read
+    
+    Stores the raw counter and the epoch it was last written in. Halving an
+    integer k times is the same as shifting it right by k, so the effective
+    counter is the raw counter shifted right once per elapsed epoch.
+    """
+    
+    def __init__(self, resource_type, epoch):
+        """
+        Initialize a lazily aged resource
+        
+        Args:
+            resource_type (str): Type of resource ("nut", "circuit", "cell", "core")
+            epoch (AgingEpoch): Aging clock of the owning inventory
+        """
+        self.epoch = epoch
+        self.raw_counter = 0
+        self.touched_epoch = epoch.value
+        super().__init__(resource_type)
+    
+    @property
+    def counter(self):
+        """Effective counter, as eager halving would have left it"""
+        return self.raw_counter >> (self.epoch.value - self.touched_epoch)
+    
+    @counter.setter
+    def counter(self, value):
+        self.raw_counter = value
+        self.touched_epoch = self.epoch.value
+    
+    def detach(self):
+        """Freeze the counter so that later epochs no longer age it"""
+        counter = self.counter
+        self.epoch = AgingEpoch()
+        self.counter = counter
\ No newline at end of file
@@ -53,15 +53,10 @@ class Weapon:
         Returns:
             bool: Whether the weapon was successfully repaired
         """
-        # Check if we have all required resources
-        if not self.can_repair(resource_manager):
+        # Use all required resources, or none if any is missing
+        if not resource_manager.consume_resources(self.requirements):
             return False
         
-        # Use resources
-        for resource_type, amount in self.requirements.items():
-            if not resource_manager.use_resource(resource_type, amount):
-                return False
-        
         # Mark as repaired
         self.repaired = True
         self.state = self.STATE_NORMAL  # Reset state when repaired
@@ -16,6 +16,19 @@ class Scene:
         """
         self.game = game
     
+    def get_asset_manifest(self):
+        """
+        Get the assets this scene draws or plays
+        
+        SceneManager loads them before the scene is entered, preloads them
+        while the scene before it runs and releases them once no live scene
+        lists them.
+        
+        Returns:
+            list: Names of assets registered with the game's AssetLoader
+        """
+        return []
+    
     def on_enter(self):
         """Called when scene becomes active"""
         pass
@@ -44,4 +57,30 @@ class Scene:
         Args:
             surface: Pygame surface to draw on
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def get_idle_timeout(self):
+        """
+        Get how long the scene's picture stays the same without input
+        
+        The main loop uses this to sleep until an event arrives or the
+        timeout passes instead of drawing every frame. Scenes that animate
+        on every tick keep this default.
+        
+        Returns:
+            float or None: Simulated milliseconds until the next change, or None if it changes every tick
+        """
+        return None
+    
+    def get_dirty_rects(self):
+        """
+        Get the screen regions whose pixels the next draw changes
+        
+        Called once before every draw; when every scene region is unchanged
+        the draw is skipped. Scenes that do not track their changes keep
+        this default, which makes every frame a full-screen update.
+        
+        Returns:
+            list or None: Changed rectangles, or None if anything may have changed
+        """
+        return None
\ No newline at end of file
@@ -4,9 +4,13 @@ Collection Scene module - Scene for collecting resources
 
 import pygame
 import random
+from itertools import repeat
 from src.scenes.base_scene import Scene
-from src.entities.resource import Resource
+from src.entities.resource import Resource, roll_resource_type
+from src.entities.falling_pool import FallingEntityPool
 from src.ui.status_panel import StatusPanel
+from src.utils.debris_lod import topmost_debris
+from src.utils.static_layer import StaticLayer
 
 class CollectionScene(Scene):
     """Scene where player collects resources from the wasteland"""
@@ -23,30 +27,58 @@ class CollectionScene(Scene):
             self.config
         )
         
-        # Resource spawning
-        self.resources = []
+        # Falling resources, stored as arrays (see FallingEntityPool)
+        self.pool = FallingEntityPool(self.config.RESOURCE_TYPES)
         self.spawn_timer = 0
-        self.spawn_interval = 1000  # ms
+        self.spawn_interval = self.config.SPAWN_INTERVAL  # ms
+        
+        # Storm mode (F6): non-collectible debris at STORM_SPAWN_RATE per second
+        self.storm = False
+        self.storm_debt = 0.0  # Fraction of a debris entity carried over to the next frame
         
         # Player character
         self.player_x = self.config.SCREEN_WIDTH // 2
         self.player_y = self.config.SCREEN_HEIGHT - 100
         self.player_speed = 5
         self.player_rect = pygame.Rect(self.player_x, self.player_y, 40, 60)
+        self.previous_player_x = self.player_x  # Position at the previous tick, for interpolation
         
         # Movement flags
         self.moving_left = False
         self.moving_right = False
         self.facing_left = False  # Track which direction the player is facing
+        
+        # Sprites placed for the coming draw, and the areas they covered in the
+        # last one (None when there were too many to track)
+        self.layout = None
+        self.sprite_rects = None
+        
+        # Resource sprites cropped to their visible pixels, by type (see get_resource_sprite)
+        self.resource_sprites = {}
+        
+        # Background and status panel frame, composed once
+        self.static_layer = StaticLayer()
+    
+    def get_asset_manifest(self):
+        """Background, character and resource sprites, pickup and damage sounds"""
+        manifest = ["background", "character", "clock_icon", "obtain_element_1", "obtain_element_2",
+                    "lose_point"]
+        manifest.extend(f"resource_{resource_type}" for resource_type in self.config.RESOURCE_TYPES)
+        return manifest
     
     def on_enter(self):
         """Called when scene becomes active"""
         # Reset resources
-        self.resources = []
+        self.pool.clear()
         self.spawn_timer = 0
+        self.storm = False
+        self.sprite_rects = None
         
         # Start playing collection background music
         self.game.play_background_music("collection")
+        
+        # Assets or settings may have changed while the scene was inactive
+        self.static_layer.invalidate()
     
     def handle_event(self, event):
         """Handle pygame events"""
@@ -58,6 +90,10 @@ class CollectionScene(Scene):
             elif event.key == pygame.K_w:
                 # Shortcut to workshop scene
                 self.game.scene_manager.set_active_scene("workshop")
+            elif event.key == pygame.K_F6:
+                # Toggle the storm stress test
+                self.storm = not self.storm
+                self.storm_debt = 0.0
         
         elif event.type == pygame.KEYUP:
             if event.key == pygame.K_LEFT:
@@ -71,8 +107,9 @@ class CollectionScene(Scene):
                 self.game.scene_manager.set_active_scene("workshop")
     
     def update(self):
-        """Update scene logic"""
+        """Update scene logic, one fixed simulation tick"""
         # Update player movement
+        self.previous_player_x = self.player_x
         if self.moving_left:
             self.player_x = max(50, self.player_x - self.player_speed)
             self.facing_left = True
@@ -82,43 +119,35 @@ class CollectionScene(Scene):
         
         self.player_rect.x = self.player_x
         
-        # Spawn resources
-        self.spawn_timer += self.game.clock.get_time()
+        # Spawn resources on simulated time, so fast-forward spawns faster too
+        tick_time = self.game.tick_time
+        self.spawn_timer += tick_time
         if self.spawn_timer >= self.spawn_interval:
             self.spawn_resource()
             self.spawn_timer = 0
+        if self.storm:
+            self.spawn_storm(tick_time)
         
-        # Update resources
-        for resource in self.resources[:]:
-            resource["y"] += 3  # Fall speed
+        # Move resources, dropping those that fell off-screen or reached the player
+        collected = self.pool.step(self.player_rect, self.config.SCREEN_HEIGHT)
+        for resource_type in collected:
+            # Add to inventory
+            success, replaced, damage = self.game.resource_manager.add_resource(resource_type)
+            
+            # Play sound when obtaining an element
+            self.game.play_obtain_element_sound()
             
-            # Check if player collected the resource
-            resource_rect = pygame.Rect(resource["x"], resource["y"], 30, 30)
-            if resource_rect.colliderect(self.player_rect):
-                # Add to inventory
-                success, replaced, damage = self.game.resource_manager.add_resource(resource["type"])
-                
-                # Play sound when obtaining an element
-                self.game.play_obtain_element_sound()
-                
-                # Apply damage if toxic replacement
-                if damage > 0:
-                    self.game.health -= damage
-                    # Play lose point sound
-                    self.game.play_lose_point_sound()
-                
-                # Apply additional damage if collecting radioactive core
-                if resource["type"] == "core":
-                    self.game.health -= 1
-                    # Play lose point sound
-                    self.game.play_lose_point_sound()
-                
-                # Remove from scene
-                self.resources.remove(resource)
+            # Apply damage if toxic replacement
+            if damage > 0:
+                self.game.health -= damage
+                # Play lose point sound
+                self.game.play_lose_point_sound()
             
-            # Remove if off-screen
-            elif resource["y"] > self.config.SCREEN_HEIGHT:
-                self.resources.remove(resource)
+            # Apply additional damage if collecting radioactive core
+            if resource_type == "core":
+                self.game.health -= 1
+                # Play lose point sound
+                self.game.play_lose_point_sound()
         
         # Update status panel
         self.status_panel.update()
@@ -128,40 +157,151 @@ class CollectionScene(Scene):
     
     def draw(self, surface):
         """Draw scene elements"""
-        # Draw wasteland background
-        self.draw_background(surface)
+        # Draw wasteland background and status panel frame from the cached static layer
+        static_layer = self.static_layer.get(None, surface.get_size(), self.draw_static)
+        surface.blit(static_layer, (0, 0))
         
-        # Draw resources
-        for resource in self.resources:
-            resource_image = self.game.asset_loader.get_image(f"resource_{resource['type']}")
+        # Draw resources where get_dirty_rects placed them, one blits call per type
+        layout = self.layout if self.layout is not None else self.layout_sprites()
+        self.layout = None
+        groups, player_x = layout
+        for resource_type, positions in zip(self.pool.type_names, groups):
+            resource_image, _ = self.get_resource_sprite(resource_type)
             if resource_image:
-                surface.blit(resource_image, (resource["x"], resource["y"]))
+                surface.blits(zip(repeat(resource_image), positions), doreturn=False)
             else:
-                # Fallback to colored rectangle if image not available
-                color = self.config.RESOURCE_TYPES[resource["type"]]["color"]
-                pygame.draw.rect(surface, color, pygame.Rect(resource["x"], resource["y"], 30, 30))
+                # Fallback to colored rectangles if image not available
+                color = self.config.RESOURCE_TYPES[resource_type]["color"]
+                for x, y in positions:
+                    pygame.draw.rect(surface, color, pygame.Rect(x, y, 30, 30))
         
-        # Draw player character
-        character_image = self.game.asset_loader.get_image("character")
+        # Draw player character between its last two simulated positions
+        # Facing left uses the horizontally flipped variant, built once by the loader
+        character_image = self.game.asset_loader.get_variant("character", flip_x=self.facing_left)
         if character_image:
-            if self.facing_left:
-                # Flip the image horizontally when facing left
-                flipped_image = pygame.transform.flip(character_image, True, False)
-                surface.blit(flipped_image, (self.player_rect.x - 20, self.player_rect.y - 30))
-            else:
-                surface.blit(character_image, (self.player_rect.x - 20, self.player_rect.y - 30))
+            surface.blit(character_image, (player_x - 20, self.player_rect.y - 30))
         else:
             # Fallback to rectangle if image not available
-            pygame.draw.rect(surface, (200, 200, 200), self.player_rect)
+            pygame.draw.rect(surface, (200, 200, 200), self.player_rect.move(player_x - self.player_rect.x, 0))
         
-        # Draw status panel
-        self.status_panel.draw(surface)
+        # Draw status panel over the resources, restoring its static parts first
+        with self.game.profiler.section("draw.status_panel"):
+            for rect in self.status_panel.static_rects:
+                surface.blit(static_layer, rect, rect)
+            self.status_panel.draw_dynamic(surface)
         
         # Draw instructions
-        font = self.config.FONT_SMALL
-        text = font.render("Usa las flechas IZQUIERDA/DERECHA para moverte. Recoge los recursos que caen.", True, self.config.TEXT_COLOR)
+        text = self.config.TEXT_CACHE.render(
+            self.config.FONT_SMALL,
+            "Usa las flechas IZQUIERDA/DERECHA para moverte. Recoge los recursos que caen.",
+            self.config.TEXT_COLOR
+        )
         surface.blit(text, (50, self.config.SCREEN_HEIGHT - 50))
     
+    def layout_sprites(self):
+        """
+        Place the sprites of the coming draw between their last two simulated positions
+        
+        Returns:
+            tuple: (groups, player_x) with groups a list of (x, y) lists, one per
+                type code, placing the sprites of get_resource_sprite()
+        """
+        alpha = self.game.interpolation
+        slots = None
+        if self.config.DEBRIS_CULLING and self.pool.count > self.config.DEBRIS_CULL_THRESHOLD:
+            # Optional level of detail: debris covering other debris is not drawn
+            slots = topmost_debris(self.pool, self.config.DEBRIS_CULL_CELL, alpha)
+        offsets = [self.get_resource_sprite(resource_type)[1] for resource_type in self.pool.type_names]
+        groups = self.pool.positions_by_type(alpha, slots, offsets)
+        player_x = round(self.previous_player_x + (self.player_x - self.previous_player_x) * alpha)
+        return groups, player_x
+    
+    def get_sprite_rects(self, groups, player_x):
+        """
+        Get the areas the resources and the player cover at a layout
+        
+        Args:
+            groups (list): (x, y) of every resource drawn, one list per type code
+            player_x (int): Left edge of the player's collision box
+        
+        Returns:
+            list: One rectangle per resource, then the player's
+        """
+        rects = []
+        for resource_type, positions in zip(self.pool.type_names, groups):
+            resource_image, _ = self.get_resource_sprite(resource_type)
+            size = resource_image.get_size() if resource_image else (30, 30)
+            rects.extend(pygame.Rect(position, size) for position in positions)
+        
+        character_image = self.game.asset_loader.get_variant("character", flip_x=self.facing_left)
+        if character_image:
+            rects.append(character_image.get_rect(topleft=(player_x - 20, self.player_rect.y - 30)))
+        else:
+            rects.append(self.player_rect.move(player_x - self.player_rect.x, 0))
+        return rects
+    
+    def get_resource_sprite(self, resource_type):
+        """
+        Get the image drawn for a falling resource, without its transparent border
+        
+        Fully transparent pixels leave the screen unchanged, so blitting only
+        the bounding box of the visible ones draws the same picture while
+        blending far fewer pixels, which is most of the cost of a storm.
+        The crop is redone if the loader's image changes.
+        
+        Args:
+            resource_type (str): Type of resource
+        
+        Returns:
+            tuple: (image, (dx, dy)) with dx, dy where the crop sits in the
+                full image, or (None, (0, 0)) if the image is not loaded
+        """
+        resource_image = self.game.asset_loader.get_image(f"resource_{resource_type}")
+        if resource_image is None:
+            return None, (0, 0)
+        entry = self.resource_sprites.get(resource_type)
+        if entry is None or entry[0] is not resource_image:
+            bounds = resource_image.get_bounding_rect()
+            entry = (resource_image, resource_image.subsurface(bounds).copy(), bounds.topleft)
+            self.resource_sprites[resource_type] = entry
+        return entry[1], entry[2]
+    
+    def get_dirty_rects(self):
+        """
+        Lay out the coming draw and collect the regions it changes
+        
+        Sprites are reported where they were and where they will be, unless
+        none of them moved; status changes are reported by the panel.
+        """
+        self.layout = self.layout_sprites()
+        groups, player_x = self.layout
+        rects = self.status_panel.get_dirty_rects()
+        
+        # Past a point (storm mode) one full update is cheaper than many small ones
+        previous_rects = self.sprite_rects
+        if sum(map(len, groups)) >= self.config.DIRTY_RECT_LIMIT:
+            self.sprite_rects = None
+        else:
+            self.sprite_rects = self.get_sprite_rects(groups, player_x)
+        if previous_rects is None or self.sprite_rects is None:
+            return None
+        
+        if self.sprite_rects != previous_rects:
+            rects += previous_rects + self.sprite_rects
+        if len(rects) > self.config.DIRTY_RECT_LIMIT:
+            return None
+        return rects
+    
+    def draw_static(self, surface):
+        """
+        Draw the layers that never change in this scene
+        
+        Args:
+            surface: Pygame surface to draw on
+        """
+        self.draw_background(surface)
+        self.status_panel.draw_static(surface)
+    
     def draw_background(self, surface):
         """Draw the wasteland background"""
         # Draw background image
@@ -179,23 +319,34 @@ class CollectionScene(Scene):
     def spawn_resource(self):
         """Spawn a random resource"""
         # Determine resource type based on rarity
-        roll = random.random()
-        
-        if roll < 0.5:  # 50% chance
-            resource_type = "nut"
-        elif roll < 0.8:  # 30% chance
-            resource_type = "circuit"
-        elif roll < 0.95:  # 15% chance
-            resource_type = "cell"
-        else:  # 5% chance
-            resource_type = "core"
+        resource_type = roll_resource_type(random.random(), self.config.SPAWN_PROBABILITIES)
         
         # Random x position
         x = random.randint(50, self.config.SCREEN_WIDTH - 80)
         
-        # Add to resources list
-        self.resources.append({
-            "type": resource_type,
-            "x": x,
-            "y": 0
-        })
\ No newline at end of file
+        # Add to the falling pool
+        self.pool.spawn(resource_type, x)
+    
+    def spawn_storm(self, tick_time):
+        """
+        Spawn this tick's share of storm debris
+        
+        Debris cannot be collected, so the stress test does not end the game.
+        
+        Args:
+            tick_time (float): Simulated milliseconds in this tick
+        """
+        self.storm_debt += self.config.STORM_SPAWN_RATE * tick_time / 1000
+        count = int(self.storm_debt)
+        self.storm_debt -= count
+        
+        resource_types = self.pool.type_names
+        max_x = self.config.SCREEN_WIDTH - 80
+        for _ in range(count):
+            self.pool.spawn(
+                random.choice(resource_types),
+                random.randint(50, max_x),
+                random.randint(-40, 0),
+                vy=random.randint(3, 8),
+                collectible=False
+            )
\ No newline at end of file
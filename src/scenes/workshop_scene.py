@@ -8,6 +8,7 @@ from src.entities.weapon import Weapon
 from src.ui.inventory_panel import InventoryPanel
 from src.ui.repair_panel import RepairPanel
 from src.ui.status_panel import StatusPanel
+from src.utils.static_layer import StaticLayer
 
 class WorkshopScene(Scene):
     """Workshop scene where player repairs weapons"""
@@ -44,11 +45,30 @@ class WorkshopScene(Scene):
         
         # Currently selected weapon
         self.selected_weapon = None
+        
+        # Character sprite area and the animation frame last drawn there
+        self.character_rect = pygame.Rect(780, 300, 80, 120)
+        self.drawn_character = None
+        
+        # Background and panel frames, composed once per weapon change
+        self.static_layer = StaticLayer()
+    
+    def get_asset_manifest(self):
+        """Background, character and celebration frames, weapon and resource sprites, sounds"""
+        manifest = ["background", "character", "clock_icon", "point", "lose_point"]
+        manifest.extend(f"celebration_{i}" for i in range(1, 6))
+        manifest.extend(f"resource_{resource_type}" for resource_type in self.config.RESOURCE_TYPES)
+        for state, weapons in self.config.WEAPON_IMAGES.items():
+            manifest.extend(f"weapon_{weapon_type}_{state}" for weapon_type in weapons)
+        return manifest
     
     def on_enter(self):
         """Called when scene becomes active"""
         # Start playing workshop background music
         self.game.play_background_music("workshop")
+        
+        # Assets or settings may have changed while the scene was inactive
+        self.static_layer.invalidate()
     
     def handle_event(self, event):
         """Handle pygame events"""
@@ -88,13 +108,37 @@ class WorkshopScene(Scene):
     
     def draw(self, surface):
         """Draw scene elements"""
-        # Draw background
+        # Draw background and panel frames from the cached static layer; the
+        # repair panel only changes with the weapons, so it is static too
+        static_layer = self.static_layer.get(self.repair_panel.get_state(), surface.get_size(), self.draw_static)
+        surface.blit(static_layer, (0, 0))
+        
+        # Draw character
+        self.draw_character(surface)
+        
+        # Draw UI panel contents
+        profiler = self.game.profiler
+        with profiler.section("draw.inventory_panel"):
+            self.inventory_panel.draw_dynamic(surface)
+        with profiler.section("draw.status_panel"):
+            self.status_panel.draw_dynamic(surface)
+    
+    def draw_static(self, surface):
+        """
+        Draw the layers that only change with the weapons on the workbench
+        
+        Args:
+            surface: Pygame surface to draw on
+        """
         self.draw_background(surface)
         
-        # Draw UI panels
-        self.inventory_panel.draw(surface)
-        self.repair_panel.draw(surface)
-        self.status_panel.draw(surface)
+        profiler = self.game.profiler
+        with profiler.section("draw.inventory_panel"):
+            self.inventory_panel.draw_static(surface)
+        with profiler.section("draw.repair_panel"):
+            self.repair_panel.draw(surface)
+        with profiler.section("draw.status_panel"):
+            self.status_panel.draw_static(surface)
     
     def draw_background(self, surface):
         """Draw the workshop background"""
@@ -107,18 +151,37 @@ class WorkshopScene(Scene):
             # Draw workshop elements (shelves, workbench, etc.)
             pygame.draw.rect(surface, (60, 50, 40), pygame.Rect(30, 80, 740, 540))
             pygame.draw.rect(surface, (70, 60, 50), pygame.Rect(400, 100, 350, 500))
-        
-        # Draw character on the right side of the workshop
+    
+    def draw_character(self, surface):
+        """Draw the character on the right side of the workshop"""
         if self.game.celebrating:
             # Draw celebration animation
             celebration_image = self.game.asset_loader.get_image(f"celebration_{self.game.celebration_frame}")
             if celebration_image:
-                surface.blit(celebration_image, (780, 300))
+                surface.blit(celebration_image, self.character_rect.topleft)
         else:
             # Draw normal character
             character_image = self.game.asset_loader.get_image("character")
             if character_image:
-                surface.blit(character_image, (780, 300))
+                surface.blit(character_image, self.character_rect.topleft)
+    
+    def get_idle_timeout(self):
+        """Until the aging countdown shows its next second, unless the character is celebrating"""
+        if self.game.celebrating:
+            return None
+        return (self.game.next_aging - self.game.sim_time) % 1000
+    
+    def get_dirty_rects(self):
+        """Collect the regions the panels and the character animation will change"""
+        rects = self.inventory_panel.get_dirty_rects()
+        rects += self.repair_panel.get_dirty_rects()
+        rects += self.status_panel.get_dirty_rects()
+        
+        character = self.game.celebration_frame if self.game.celebrating else 0
+        if character != self.drawn_character:
+            self.drawn_character = character
+            rects.append(self.character_rect)
+        return rects
     
     def try_repair_weapon(self):
         """Attempt to repair the selected weapon"""
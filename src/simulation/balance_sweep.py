@@ -0,0 +1,313 @@
+"""
+Balance Sweep module - Monte Carlo sweep over the game's balance parameters
+
+Expands a grid of Config balance parameters (inventory size, aging interval,
+counter increment, toxic threshold, spawn probabilities), plays a batch of
+HeadlessGame sessions for every combination on a process pool and streams one
+aggregate row per combination to a CSV or JSON lines file.
+
+Every combination is seeded from its own key, so rows do not depend on the
+number of workers or on the order they finish in. Rerunning the same command
+skips the combinations already in the results file, which is how an
+interrupted sweep resumes. The row keys include the games, step limit and
+seed of the run, so a rerun with other run settings adds its own rows
+instead of skipping combinations simulated with different settings:
+    python -m src.simulation.balance_sweep --inventory-size 4,6,8 --toxic-threshold 32,64,96 \\
+        --spawn nut=0.5,circuit=0.3,cell=0.15,core=0.05 --games 500 --output sweep.csv
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+import zlib
+from src.core.config import Config
+from src.simulation.headless_game import HeadlessGame, simulation_params, RUNNING, WON
+
+# Grid parameters settable from the command line, as (option, params key)
+GRID_PARAMETERS = (
+    ("inventory_size", "inventory_size"),
+    ("aging_interval", "aging_interval"),
+    ("counter_increment", "counter_increment"),
+    ("toxic_threshold", "toxic_threshold")
+)
+
+# Columns of a results row, in file order
+RESULT_FIELDS = (
+    "key", "inventory_size", "aging_interval", "counter_increment", "toxic_threshold",
+    "spawn_probabilities", "games", "win_rate", "avg_toxic_health_lost", "repairs_per_minute",
+    "avg_steps", "seed"
+)
+
+def format_spawn(probabilities):
+    """
+    Format spawn probabilities as 'nut=0.5;circuit=0.3;...'
+    
+    Args:
+        probabilities (dict): Resource type -> spawn probability
+        
+    Returns:
+        str: Compact, order-preserving representation
+    """
+    return ";".join(f"{resource_type}={probability:g}" for resource_type, probability in probabilities.items())
+
+def parse_spawn(text):
+    """
+    Parse spawn probabilities written as 'nut=0.5,circuit=0.3,...'
+    
+    Args:
+        text (str): Comma- or semicolon-separated type=probability pairs
+        
+    Returns:
+        dict: Resource type -> spawn probability
+    """
+    probabilities = {}
+    for pair in text.replace(";", ",").split(","):
+        resource_type, _, probability = pair.partition("=")
+        if not probability:
+            raise ValueError(f"Invalid spawn probability '{pair}', expected type=probability")
+        probabilities[resource_type.strip()] = float(probability)
+    return probabilities
+
+def expand_grid(base_params, grid, spawn_profiles):
+    """
+    Build the parameter sets of every grid combination
+    
+    Args:
+        base_params (dict): Simulation parameters the grid starts from
+        grid (dict): Params key -> list of values to try
+        spawn_profiles (list): Spawn probability dicts to try
+        
+    Returns:
+        list: (key, params) for every combination, in grid order
+    """
+    keys = list(grid)
+    combinations = []
+    for values in itertools.product(*(grid[key] for key in keys)):
+        for spawn_probabilities in spawn_profiles:
+            params = dict(base_params, spawn_probabilities=spawn_probabilities)
+            params.update(zip(keys, values))
+            combinations.append((config_key(params), params))
+    return combinations
+
+def config_key(params):
+    """
+    Identify a parameter set by the values the sweep varies
+    
+    Args:
+        params (dict): Simulation parameters
+        
+    Returns:
+        str: Stable key used for seeding
+    """
+    parts = [f"{key}={params[key]}" for _, key in GRID_PARAMETERS]
+    parts.append(f"spawn={format_spawn(params['spawn_probabilities'])}")
+    return "|".join(parts)
+
+def run_key(key, games, max_steps, base_seed):
+    """
+    Extend a combination key with the run settings its results depend on
+    
+    Args:
+        key (str): Combination key from config_key
+        games (int): Games per combination
+        max_steps (int): Step limit per game
+        base_seed (int): Base seed of the sweep
+        
+    Returns:
+        str: Key of the results row, used for resuming
+    """
+    return f"{key}|games={games}|max_steps={max_steps}|seed={base_seed}"
+
+def simulate_configuration(task):
+    """
+    Play a batch of games with one parameter set and aggregate the results
+    
+    Runs in a worker process.
+    
+    Args:
+        task (tuple): (key, params, games, max_steps, base_seed)
+        
+    Returns:
+        dict: Results row (see RESULT_FIELDS)
+    """
+    key, params, games, max_steps, base_seed = task
+    seed = zlib.crc32(key.encode("utf-8")) ^ base_seed
+    rng = random.Random(seed)
+    
+    wins = 0
+    toxic_damage = 0
+    weapons_repaired = 0
+    steps = 0
+    for _ in range(games):
+        game = HeadlessGame(params)
+        while game.outcome == RUNNING and game.steps < max_steps:
+            game.step(rng.random(), rng.random(), rng.random())
+        wins += game.outcome == WON
+        toxic_damage += game.toxic_damage
+        weapons_repaired += game.weapons_repaired
+        steps += game.steps
+    
+    minutes = steps * params["spawn_interval"] / 60000
+    return {
+        "key": run_key(key, games, max_steps, base_seed),
+        "inventory_size": params["inventory_size"],
+        "aging_interval": params["aging_interval"],
+        "counter_increment": params["counter_increment"],
+        "toxic_threshold": params["toxic_threshold"],
+        "spawn_probabilities": format_spawn(params["spawn_probabilities"]),
+        "games": games,
+        "win_rate": round(wins / games, 6),
+        "avg_toxic_health_lost": round(toxic_damage / games, 6),
+        "repairs_per_minute": round(weapons_repaired / minutes, 6) if minutes else 0.0,
+        "avg_steps": round(steps / games, 3),
+        "seed": seed
+    }
+
+class ResultsFile:
+    """
+    Append-only results file in CSV or JSON lines format
+    
+    The format follows the extension: .jsonl/.json write one JSON object per
+    line, anything else writes CSV. Rows are flushed as they are written, so
+    an interrupted sweep leaves at most one partial line, which is dropped
+    when the file is reopened.
+    """
+    
+    def __init__(self, path):
+        """
+        Open a results file, loading the keys of the rows already in it
+        
+        Args:
+            path (str): Path of the results file
+        """
+        self.path = path
+        self.json_lines = os.path.splitext(path)[1].lower() in (".jsonl", ".json")
+        self.completed = set()
+        
+        if os.path.exists(path):
+            self._drop_partial_line()
+            with open(path, newline="", encoding="utf-8") as file:
+                if self.json_lines:
+                    for line in file:
+                        if line.strip():
+                            self.completed.add(json.loads(line)["key"])
+                else:
+                    for row in csv.DictReader(file):
+                        self.completed.add(row["key"])
+        
+        write_header = not self.json_lines and (not os.path.exists(path) or os.path.getsize(path) == 0)
+        self.file = open(path, "a", newline="", encoding="utf-8")
+        self.writer = None
+        if not self.json_lines:
+            self.writer = csv.DictWriter(self.file, fieldnames=RESULT_FIELDS)
+            if write_header:
+                self.writer.writeheader()
+                self.file.flush()
+    
+    def _drop_partial_line(self):
+        """Truncate the file after its last complete line"""
+        with open(self.path, "rb+") as file:
+            data = file.read()
+            if data and not data.endswith(b"\n"):
+                file.truncate(data.rfind(b"\n") + 1)
+    
+    def write(self, row):
+        """
+        Append a results row and flush it to disk
+        
+        Args:
+            row (dict): Results row
+        """
+        if self.json_lines:
+            self.file.write(json.dumps(row) + "\n")
+        else:
+            self.writer.writerow(row)
+        self.file.flush()
+        self.completed.add(row["key"])
+    
+    def close(self):
+        """Close the file"""
+        self.file.close()
+
+def run_sweep(combinations, results, games, max_steps, seed=0, workers=None):
+    """
+    Simulate every combination not yet in the results file
+    
+    Args:
+        combinations (list): (key, params) pairs from expand_grid
+        results (ResultsFile): Destination of the rows
+        games (int): Games per combination
+        max_steps (int): Step limit per game
+        seed (int): Base seed mixed into every combination's seed
+        workers (int, optional): Worker processes (default: one per core)
+        
+    Returns:
+        int: Number of rows written
+    """
+    tasks = [
+        (key, params, games, max_steps, seed)
+        for key, params in combinations if run_key(key, games, max_steps, seed) not in results.completed
+    ]
+    if not tasks:
+        return 0
+    
+    written = 0
+    with multiprocessing.Pool(workers) as pool:
+        for row in pool.imap_unordered(simulate_configuration, tasks):
+            results.write(row)
+            written += 1
+            print(f"[{written}/{len(tasks)}] {row['key']}: win rate {row['win_rate']:.3f}, "
+                  f"toxic {row['avg_toxic_health_lost']:.3f}, repairs/min {row['repairs_per_minute']:.3f}")
+    return written
+
+def parse_values(text):
+    """Parse a comma-separated list of integers"""
+    return [int(value) for value in text.split(",")]
+
+def main():
+    """Run a parameter sweep from the command line"""
+    parser = argparse.ArgumentParser(description="Monte Carlo sweep over the game's balance parameters")
+    for option, _ in GRID_PARAMETERS:
+        parser.add_argument(f"--{option.replace('_', '-')}", type=parse_values,
+                            help="comma-separated values to try (default: the Config value)")
+    parser.add_argument("--spawn", action="append", type=parse_spawn,
+                        help="spawn probabilities as type=p,...; repeat to try several profiles")
+    parser.add_argument("--games", type=int, default=200, help="games per combination")
+    parser.add_argument("--max-steps", type=int, default=1800, help="step limit per game (one step per spawn interval)")
+    parser.add_argument("--seed", type=int, default=0, help="base random seed")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--output", default="balance_sweep.csv", help="results file, .csv or .jsonl")
+    args = parser.parse_args()
+    
+    base_params = simulation_params(Config())
+    grid = {}
+    for option, key in GRID_PARAMETERS:
+        grid[key] = getattr(args, option) or [base_params[key]]
+    spawn_profiles = args.spawn or [base_params["spawn_probabilities"]]
+    combinations = expand_grid(base_params, grid, spawn_profiles)
+    
+    results = ResultsFile(args.output)
+    skipped = sum(
+        run_key(key, args.games, args.max_steps, args.seed) in results.completed
+        for key, _ in combinations
+    )
+    if skipped:
+        print(f"Resuming: {skipped} of {len(combinations)} combinations already in {args.output}")
+    
+    start = time.perf_counter()
+    try:
+        written = run_sweep(combinations, results, args.games, args.max_steps, args.seed, args.workers)
+    except KeyboardInterrupt:
+        print(f"Interrupted; rerun the same command to resume from {args.output}")
+        return
+    finally:
+        results.close()
+    print(f"Wrote {written} rows to {args.output} in {time.perf_counter() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
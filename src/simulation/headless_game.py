@@ -0,0 +1,168 @@
+"""
+Headless Game module - Rules-level model of a game session without pygame
+
+Each step covers one spawn interval of the collection scene: a resource
+spawns and is caught or missed, the bot repairs the first weapon it can,
+and every AGING_INTERVAL the inventory and the weapons age. The random
+numbers for a step are passed in, so the same stream can drive this model
+and the vectorized engine.
+"""
+
+from src.core.resource_manager import ResourceManager
+from src.entities.resource import roll_resource_type
+
+# Game outcomes
+RUNNING = 0
+WON = 1
+LOST = 2
+
+# Weapon states, in aging order (see Weapon)
+WEAPON_NORMAL = 0
+WEAPON_OXIDIZED = 1
+WEAPON_DESTROYED = 2
+
+def simulation_params(config, **overrides):
+    """
+    Collect the balance parameters of a Config into a plain dict
+    
+    The dict is picklable, unlike Config, so it can be sent to worker processes.
+    
+    Args:
+        config (Config): Game configuration
+        **overrides: Parameters to replace
+        
+    Returns:
+        dict: Simulation parameters
+    """
+    params = {
+        "inventory_size": config.INVENTORY_SIZE,
+        "aging_interval": config.AGING_INTERVAL,
+        "counter_increment": config.COUNTER_INCREMENT,
+        "counter_max": config.COUNTER_MAX,
+        "toxic_threshold": config.TOXIC_THRESHOLD,
+        "spawn_interval": config.SPAWN_INTERVAL,
+        "spawn_probabilities": dict(config.SPAWN_PROBABILITIES),
+        "weapons": {
+            weapon_type: {"requirements": dict(data["requirements"]), "points": data["points"]}
+            for weapon_type, data in config.WEAPONS.items()
+        },
+        "initial_weapons": ["pistol", "shotgun", "rifle"],
+        "max_health": config.PLAYER_MAX_HEALTH,
+        "weapons_to_win": config.WEAPONS_TO_WIN,
+        "catch_rate": 0.8  # Share of spawned resources the bot catches
+    }
+    params.update(overrides)
+    return params
+
+class HeadlessGame:
+    """One game session driven by ResourceManager"""
+    
+    def __init__(self, params):
+        """
+        Initialize a session
+        
+        Args:
+            params (dict): Simulation parameters (see simulation_params)
+        """
+        self.params = params
+        self.weapon_types = list(params["weapons"])
+        self.resource_manager = ResourceManager(
+            params["inventory_size"],
+            counter_increment=params["counter_increment"],
+            counter_max=params["counter_max"],
+            toxic_threshold=params["toxic_threshold"]
+        )
+        
+        # Weapons on the workbench as [type, state]
+        self.weapons = [[weapon_type, WEAPON_NORMAL] for weapon_type in params["initial_weapons"]]
+        
+        self.health = params["max_health"]
+        self.score = 0
+        self.weapons_repaired = 0
+        self.toxic_damage = 0  # Health lost to toxic evictions
+        self.elapsed = 0       # Simulated milliseconds
+        self.next_aging = params["aging_interval"]
+        self.steps = 0
+        self.outcome = RUNNING
+    
+    def step(self, spawn_roll, catch_roll, weapon_roll):
+        """
+        Advance the session by one spawn interval
+        
+        Args:
+            spawn_roll (float): Uniform [0, 1) roll picking the spawned type
+            catch_roll (float): Uniform [0, 1) roll deciding whether it is caught
+            weapon_roll (float): Uniform [0, 1) roll picking a replacement weapon
+        """
+        if self.outcome != RUNNING:
+            return
+        
+        params = self.params
+        self.steps += 1
+        self.elapsed += params["spawn_interval"]
+        
+        # Collect the spawned resource
+        if catch_roll < params["catch_rate"]:
+            resource_type = roll_resource_type(spawn_roll, params["spawn_probabilities"])
+            damage = self.resource_manager.add_resource(resource_type)[2]
+            self.health -= damage
+            self.toxic_damage += damage
+            if resource_type == "core":
+                self.health -= 1
+        
+        if self.health <= 0:
+            self.outcome = LOST
+            return
+        
+        # Repair the first weapon the inventory allows
+        for weapon in self.weapons:
+            weapon_data = params["weapons"][weapon[0]]
+            if self.resource_manager.consume_resources(weapon_data["requirements"]):
+                self.weapons_repaired += 1
+                self.score += weapon_data["points"]
+                index = min(int(weapon_roll * len(self.weapon_types)), len(self.weapon_types) - 1)
+                weapon[0] = self.weapon_types[index]
+                weapon[1] = WEAPON_NORMAL
+                break
+        
+        if 0 < params["weapons_to_win"] <= self.weapons_repaired:
+            self.outcome = WON
+            return
+        
+        # Aging of resources and weapons
+        if self.elapsed >= self.next_aging:
+            self.next_aging += params["aging_interval"]
+            self.resource_manager.apply_aging()
+            
+            destroyed = False
+            for weapon in self.weapons:
+                if weapon[1] == WEAPON_OXIDIZED:
+                    destroyed = True
+                weapon[1] = min(weapon[1] + 1, WEAPON_DESTROYED)
+            
+            # Only lose health once per round for destroyed weapons
+            if destroyed:
+                self.health -= 1
+                if self.health <= 0:
+                    self.outcome = LOST
+    
+    def result(self):
+        """
+        Summary of the session
+        
+        Returns:
+            dict: outcome, steps, health, score, weapons_repaired, toxic_damage,
+                elapsed (ms), types and counters of the inventory
+        """
+        inventory = self.resource_manager.inventory
+        return {
+            "outcome": self.outcome,
+            "steps": self.steps,
+            "health": self.health,
+            "score": self.score,
+            "weapons_repaired": self.weapons_repaired,
+            "toxic_damage": self.toxic_damage,
+            "elapsed": self.elapsed,
+            "types": [resource.type for resource in inventory],
+            "counters": [resource.counter for resource in inventory]
+        }
\ No newline at end of file
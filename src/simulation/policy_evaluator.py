@@ -0,0 +1,420 @@
+"""
+Policy Evaluator module - Compares replacement policies against the offline optimum
+
+Run as a script to compare every registered policy on a synthetic session
+or on a recorded trace:
+    python -m src.simulation.policy_evaluator --operations 100000 --inventory-size 6
+    python -m src.simulation.policy_evaluator --trace session.trace
+"""
+
+import argparse
+import random
+import time
+from bisect import bisect_left
+from collections import Counter
+from src.core.compact_resource_manager import CompactResourceManager
+from src.core.config import Config
+from src.core.operation_log import OperationLog
+from src.core.operation_trace import TraceReader
+from src.core.replacement_policy import ReplacementPolicy
+from src.core.replacement_policies import POLICIES
+from src.core.resource_manager import ResourceManager
+from src.entities.resource import roll_resource_type
+
+class FurthestNextNeedPolicy(ReplacementPolicy):
+    """
+    Offline furthest-next-need policy (Belady's rule adapted to typed slots)
+    
+    Resources of one type are interchangeable and using them does not remove
+    them, so a slot only matters while some future demand needs that many
+    resources of its type. For each candidate type the policy looks up when
+    the copy it would lose is next needed, evicts from the type needed
+    furthest in the future, and within that type evicts the lowest counter.
+    It needs the whole operation sequence up front and must be told the
+    current position with seek().
+    
+    This is a reference with knowledge of the future, not an optimum: with
+    counters and toxic damage in play, Belady's rule minimizes neither the
+    missed repairs nor the toxic damage, and real policies can beat it on
+    either metric. See optimal_missed_repairs() and optimal_toxic_damage()
+    for the actual optima.
+    """
+    
+    name = "furthest-next-need"
+    
+    NEVER = float("inf")
+    
+    def __init__(self, operations):
+        """
+        Index the future demands of a recorded session
+        
+        Args:
+            operations (iterable): Operations in OperationLog format
+        """
+        self.position = 0
+        
+        # (type, copies) -> sorted positions of demands needing at least that many
+        self.demand_positions = {}
+        for position, operation in enumerate(operations):
+            if operation[0] == OperationLog.USE:
+                demands = {operation[1]: operation[2]}
+            elif operation[0] == OperationLog.CONSUME:
+                demands = operation[1]
+            else:
+                continue
+            
+            for resource_type, amount in demands.items():
+                for copies in range(1, amount + 1):
+                    self.demand_positions.setdefault((resource_type, copies), []).append(position)
+    
+    def seek(self, position):
+        """Set the position of the operation being applied"""
+        self.position = position
+    
+    def next_need(self, resource_type, copies):
+        """
+        Position of the next demand needing at least some copies of a type
+        
+        Args:
+            resource_type (str): Type of resource
+            copies (int): Number of copies
+            
+        Returns:
+            float: Position of the demand, or NEVER
+        """
+        positions = self.demand_positions.get((resource_type, copies))
+        if not positions:
+            return self.NEVER
+        i = bisect_left(positions, self.position)
+        return positions[i] if i < len(positions) else self.NEVER
+    
+    def select_victim(self, resources, resource_type=None):
+        """Evict the resource whose loss is felt furthest in the future"""
+        counts = Counter(resource.type for resource in resources)
+        
+        best_key = None
+        best_index = -1
+        for index, resource in enumerate(resources):
+            # Copies of this type left after the swap, plus the one that would be lost
+            copies = counts[resource.type] + (resource.type == resource_type)
+            key = (-self.next_need(resource.type, copies), resource.counter, index)
+            if best_key is None or key < best_key:
+                best_key = key
+                best_index = index
+        
+        return best_index
+
+def replay(manager, operations):
+    """
+    Apply recorded operations to a resource manager
+    
+    Args:
+        manager (ResourceManager): Manager to drive
+        operations (sequence): Operations in OperationLog format
+        
+    Returns:
+        dict: toxic_damage, missed_uses, missed_repairs, operations,
+            seconds and ops_per_second
+    """
+    seek = getattr(manager.policy, "seek", None)
+    toxic_damage = 0
+    missed_uses = 0
+    missed_repairs = 0
+    
+    start = time.perf_counter()
+    for position, operation in enumerate(operations):
+        if seek is not None:
+            seek(position)
+        
+        kind = operation[0]
+        if kind == OperationLog.ADD:
+            toxic_damage += manager.add_resource(operation[1])[2]
+        elif kind == OperationLog.USE:
+            if not manager.use_resource(operation[1], operation[2]):
+                missed_uses += 1
+        elif kind == OperationLog.CONSUME:
+            if not manager.consume_resources(operation[1]):
+                missed_repairs += 1
+        elif kind == OperationLog.AGE:
+            manager.apply_aging()
+    seconds = time.perf_counter() - start
+    
+    return {
+        "toxic_damage": toxic_damage,
+        "missed_uses": missed_uses,
+        "missed_repairs": missed_repairs,
+        "operations": len(operations),
+        "seconds": seconds,
+        "ops_per_second": len(operations) / seconds if seconds > 0 else float("inf")
+    }
+
+def evaluate_policy(operations, inventory_size, policy, lazy_aging=False):
+    """
+    Replay a session with one replacement policy
+    
+    Args:
+        operations (sequence): Operations in OperationLog format
+        inventory_size (int): Number of inventory slots
+        policy (str or ReplacementPolicy): Policy name or instance
+        lazy_aging (bool): Whether to use lazy epoch aging
+        
+    Returns:
+        dict: Replay statistics, see replay()
+    """
+    manager = ResourceManager(inventory_size, lazy_aging=lazy_aging, policy=policy)
+    return replay(manager, operations)
+
+def optimal_missed_repairs(operations, inventory_size, upper_bound=None):
+    """
+    Fewest missed repairs any choice of victims can achieve on a session
+    
+    Whether a repair succeeds depends only on how many resources of each
+    type are held, and only adds change those counts, so an exact dynamic
+    program over the inventory compositions tries every victim type at
+    every eviction. Which copy of a type is evicted does not matter for this
+    metric, and the number of compositions stays small at any inventory size.
+    
+    Args:
+        operations (sequence): Operations in OperationLog format
+        inventory_size (int): Number of inventory slots
+        upper_bound (int, optional): Missed repairs of a known strategy,
+            compositions that cannot beat it are dropped
+        
+    Returns:
+        int: Minimum number of missed repairs
+    """
+    codes = {}
+    for operation in operations:
+        if operation[0] == OperationLog.ADD:
+            codes.setdefault(operation[1], len(codes))
+    
+    frontier = {(0,) * len(codes): 0}  # Per-type counts -> fewest missed repairs
+    successors = {}                     # (counts, added code) -> reachable counts
+    for operation in operations:
+        kind = operation[0]
+        if kind == OperationLog.ADD:
+            code = codes[operation[1]]
+            following = {}
+            for counts, missed in frontier.items():
+                targets = successors.get((counts, code))
+                if targets is None:
+                    grown = list(counts)
+                    grown[code] += 1
+                    if sum(counts) < inventory_size:
+                        targets = [tuple(grown)]
+                    else:
+                        targets = []
+                        for victim, count in enumerate(counts):
+                            if count:
+                                target = grown.copy()
+                                target[victim] -= 1
+                                targets.append(tuple(target))
+                    successors[(counts, code)] = targets
+                for target in targets:
+                    if following.get(target, missed + 1) > missed:
+                        following[target] = missed
+            frontier = following
+        elif kind == OperationLog.CONSUME:
+            requirements = [(codes.get(resource_type), amount) for resource_type, amount in operation[1].items()]
+            following = {}
+            for counts, missed in frontier.items():
+                for code, amount in requirements:
+                    if (0 if code is None else counts[code]) < amount:
+                        missed += 1
+                        break
+                if upper_bound is None or missed < upper_bound:
+                    following[counts] = missed
+            if not following:
+                return upper_bound
+            frontier = following
+    
+    return min(frontier.values())
+
+def optimal_toxic_damage(operations, inventory_size, upper_bound=None, max_expansions=1000000):
+    """
+    Least toxic damage any choice of victims can achieve on a session
+    
+    Exact dynamic program over whole inventories packed as in
+    CompactResourceManager.get_state: at every eviction each slot is tried
+    as the victim, and inventories reached several ways keep their lowest
+    damage. Counters and slot order both matter here, so the number of
+    inventories grows quickly with the inventory size; the search gives up
+    after max_expansions inventory updates. It is practical for three or four
+    slots and short sessions, or whenever a known strategy takes no damage.
+    
+    Args:
+        operations (sequence): Operations in OperationLog format
+        inventory_size (int): Number of inventory slots
+        upper_bound (int, optional): Toxic damage of a known strategy,
+            inventories that cannot beat it are dropped
+        max_expansions (int): Most inventory updates before giving up
+        
+    Returns:
+        int or None: Minimum toxic damage, or None if the search gave up
+    """
+    if upper_bound == 0:
+        return 0
+    
+    manager = CompactResourceManager(inventory_size)
+    threshold = manager.toxic_threshold
+    halve_table = manager.HALVE_TABLE
+    transitions = {}  # (inventory, operation) -> inventory after a use or repair
+    
+    frontier = {b"": 0}  # Packed inventory -> least toxic damage
+    for operation in operations:
+        max_expansions -= len(frontier)
+        if max_expansions < 0:
+            return None
+        
+        kind = operation[0]
+        following = {}
+        if kind == OperationLog.ADD:
+            code = bytes((manager.get_type_code(operation[1]),))
+            for state, damage in frontier.items():
+                filled = len(state) >> 1
+                if filled < inventory_size:
+                    target = state[:filled] + code + state[filled:] + b"\0"
+                    if following.get(target, damage + 1) > damage:
+                        following[target] = damage
+                    continue
+                for index in range(filled):
+                    cost = damage + (state[filled + index] > threshold)
+                    if upper_bound is not None and cost >= upper_bound:
+                        continue
+                    target = state[:index] + code + state[index + 1:filled + index] + b"\0" + state[filled + index + 1:]
+                    if following.get(target, cost + 1) > cost:
+                        following[target] = cost
+            if not following:
+                return upper_bound
+        elif kind == OperationLog.AGE:
+            for state, damage in frontier.items():
+                filled = len(state) >> 1
+                target = state[:filled] + state[filled:].translate(halve_table)
+                if following.get(target, damage + 1) > damage:
+                    following[target] = damage
+        else:
+            key = operation if kind == OperationLog.USE else tuple(operation[1].items())
+            for state, damage in frontier.items():
+                target = transitions.get((state, key))
+                if target is None:
+                    manager.set_state(state)
+                    if kind == OperationLog.USE:
+                        manager.use_resource(operation[1], operation[2])
+                    else:
+                        manager.consume_resources(operation[1])
+                    target = transitions[(state, key)] = manager.get_state()
+                if following.get(target, damage + 1) > damage:
+                    following[target] = damage
+        frontier = following
+    
+    return min(frontier.values())
+
+def compare_policies(operations, inventory_size, policy_names=None, lazy_aging=False, max_expansions=1000000):
+    """
+    Replay a session with several policies and the offline reference, and
+    measure each metric's gap to its offline optimum
+    
+    The best score of the replayed policies bounds each optimum search. Each
+    optimum is taken separately, so no single strategy needs to reach both.
+    
+    Args:
+        operations (sequence): Operations in OperationLog format
+        inventory_size (int): Number of inventory slots
+        policy_names (iterable, optional): Policies to compare, all by default
+        lazy_aging (bool): Whether to use lazy epoch aging
+        max_expansions (int): Search limit of optimal_toxic_damage()
+        
+    Returns:
+        list: One dict per policy with the replay statistics plus
+            toxic_damage_over_opt and missed_repairs_over_opt (None when the
+            optimum is unknown), the furthest-next-need reference first
+    """
+    operations = list(operations)
+    reference = evaluate_policy(operations, inventory_size, FurthestNextNeedPolicy(operations), lazy_aging)
+    reference["policy"] = FurthestNextNeedPolicy.name
+    
+    rows = [reference]
+    for name in policy_names or POLICIES:
+        row = evaluate_policy(operations, inventory_size, name, lazy_aging)
+        row["policy"] = name
+        rows.append(row)
+    
+    toxic_optimum = optimal_toxic_damage(
+        operations, inventory_size, min(row["toxic_damage"] for row in rows), max_expansions
+    )
+    missed_optimum = optimal_missed_repairs(operations, inventory_size, min(row["missed_repairs"] for row in rows))
+    for row in rows:
+        row["toxic_damage_over_opt"] = None if toxic_optimum is None else row["toxic_damage"] - toxic_optimum
+        row["missed_repairs_over_opt"] = row["missed_repairs"] - missed_optimum
+    return rows
+
+def generate_session(config, length, seed=0, add_ratio=0.6, aging_every=15):
+    """
+    Generate a synthetic session following the game's rules
+    
+    Resources spawn with Config.SPAWN_PROBABILITIES and repairs ask for the
+    requirements of a random weapon from Config.WEAPONS.
+    
+    Args:
+        config (Config): Game configuration
+        length (int): Number of operations
+        seed (int): Random seed
+        add_ratio (float): Share of operations that add a resource
+        aging_every (int): Operations between aging passes
+        
+    Returns:
+        list: Operations in OperationLog format
+    """
+    rng = random.Random(seed)
+    weapons = list(config.WEAPONS.values())
+    log = OperationLog()
+    
+    for step in range(1, length + 1):
+        if step % aging_every == 0:
+            log.record_aging()
+        elif rng.random() < add_ratio:
+            log.record_add(roll_resource_type(rng.random(), config.SPAWN_PROBABILITIES))
+        else:
+            log.record_consume(rng.choice(weapons)["requirements"])
+    
+    return log.operations
+
+def main():
+    """Compare all policies on a session and print a table"""
+    parser = argparse.ArgumentParser(
+        description="Compare inventory replacement policies with an offline reference and the offline optimum"
+    )
+    parser.add_argument("--operations", type=int, default=100000, help="number of operations to generate")
+    parser.add_argument("--inventory-size", type=int, default=None, help="inventory slots (default: Config.INVENTORY_SIZE)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the session")
+    parser.add_argument("--policies", default=",".join(POLICIES), help="comma-separated policy names")
+    parser.add_argument("--lazy-aging", action="store_true", help="use lazy epoch aging")
+    parser.add_argument("--trace", help="replay a recorded trace instead of a synthetic session")
+    parser.add_argument(
+        "--max-expansions", type=int, default=1000000,
+        help="search limit of the toxic damage optimum, shown as - when reached"
+    )
+    args = parser.parse_args()
+    
+    if args.trace:
+        with TraceReader(args.trace) as reader:
+            inventory_size = args.inventory_size or reader.inventory_size
+            operations = list(reader.operations())
+    else:
+        config = Config()
+        inventory_size = args.inventory_size or config.INVENTORY_SIZE
+        operations = generate_session(config, args.operations, args.seed)
+    rows = compare_policies(
+        operations, inventory_size, args.policies.split(","), args.lazy_aging, args.max_expansions
+    )
+    
+    print(f"{'policy':<18} {'toxic':>8} {'+opt':>6} {'missed':>8} {'+opt':>6} {'ops/s':>12}")
+    for row in rows:
+        toxic_over_opt = "-" if row["toxic_damage_over_opt"] is None else row["toxic_damage_over_opt"]
+        print(
+            f"{row['policy']:<18} {row['toxic_damage']:>8} {toxic_over_opt:>6} "
+            f"{row['missed_repairs']:>8} {row['missed_repairs_over_opt']:>6} {row['ops_per_second']:>12,.0f}"
+        )
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,295 @@
+"""
+Replay Trace module - Replays recorded inventory traces without pygame
+
+Usage:
+    python -m src.simulation.replay_trace session.trace [--backend compact] [--cached] [--expect CHECKSUM]
+
+Prints throughput, gameplay totals and a checksum of the final inventory;
+exits with status 1 if --expect is given and the checksum differs. Every
+record is applied to the manager unless --cached is given, which replays a
+compact inventory through replay_transitions (a memo of state transitions
+that measures lookups, not the inventory code).
+"""
+
+import argparse
+import sys
+import time
+import zlib
+from src.core.compact_resource_manager import CompactResourceManager
+from src.core.operation_trace import (
+    TraceReader, OP_ADD, OP_USE, OP_CONSUME, OP_CONSUME_END, OP_AGE, NO_TYPE
+)
+from src.core.resource_manager import ResourceManager
+
+# Outcomes of a record in replay_transitions
+PENDING = 0        # Part of a consume group, or an unknown op; not an operation
+APPLIED = 1
+TOXIC_ADD = 2
+MISSED_USE = 3
+MISSED_REPAIR = 4
+OUTCOME_COUNT = 5
+
+# Share of cache misses in a chunk above which replay_transitions stops caching
+MAX_MISS_RATE = 0.25
+
+def inventory_checksum(manager):
+    """
+    Checksum of the types and counters in an inventory, in slot order
+    
+    Args:
+        manager: ResourceManager or CompactResourceManager
+        
+    Returns:
+        str: CRC-32 as eight hex digits
+    """
+    checksum = 0
+    for resource in manager.inventory:
+        entry = f"{resource.type}:{resource.counter};".encode("utf-8")
+        checksum = zlib.crc32(entry, checksum)
+    return f"{checksum:08x}"
+
+def replay_trace(reader, manager):
+    """
+    Apply every record of a trace to a resource manager
+    
+    Consecutive adds are handed to add_resources in one call.
+    
+    Args:
+        reader (TraceReader): Open trace
+        manager: ResourceManager or CompactResourceManager
+        
+    Returns:
+        dict: operations, seconds, ops_per_second, toxic_damage,
+            missed_uses, missed_repairs and checksum
+    """
+    names = reader.type_names
+    add_resources = manager.add_resources
+    use_resource = manager.use_resource
+    consume_resources = manager.consume_resources
+    apply_aging = manager.apply_aging
+    
+    operations = 0
+    toxic_damage = 0
+    missed_uses = 0
+    missed_repairs = 0
+    pending_adds = []
+    group = {}
+    
+    start = time.perf_counter()
+    for op, code, amount in reader.records():
+        if op == OP_ADD:
+            pending_adds.append(names[code])
+            continue
+        
+        if pending_adds:
+            toxic_damage += add_resources(pending_adds)[2]
+            operations += len(pending_adds)
+            pending_adds = []
+        
+        # Most frequent first: repairs are most of the records after adds
+        if op == OP_CONSUME:
+            group[names[code]] = amount
+        elif op == OP_CONSUME_END:
+            if code != NO_TYPE:
+                group[names[code]] = amount
+            if not consume_resources(group):
+                missed_repairs += 1
+            group = {}
+            operations += 1
+        elif op == OP_USE:
+            if not use_resource(names[code], amount):
+                missed_uses += 1
+            operations += 1
+        elif op == OP_AGE:
+            apply_aging()
+            operations += 1
+    
+    if pending_adds:
+        toxic_damage += add_resources(pending_adds)[2]
+        operations += len(pending_adds)
+    seconds = time.perf_counter() - start
+    
+    return replay_result(manager, operations, seconds, toxic_damage, missed_uses, missed_repairs)
+
+def replay_transitions(reader, manager, max_transitions=1 << 20, chunk_records=1 << 14):
+    """
+    Replay a trace on a compact manager through a cache of state transitions
+    
+    A compact inventory is a few bytes (see CompactResourceManager.get_state)
+    and every record changes it deterministically, so the pair (state,
+    record) always leads to the same next state and outcome. Sessions made
+    mostly of adds, repairs and aging revisit a small set of states, since
+    counters saturate, halve and reset in the same patterns. Each pair is
+    then applied through the manager once, and every later occurrence is a
+    single dict lookup on the state id and the record read as one int. The
+    requirements of a consume group that has not ended yet are part of the
+    state.
+    
+    A miss costs several times a direct application, so when a chunk of
+    records misses more than MAX_MISS_RATE of the time the rest of the trace
+    is applied directly instead. The cache is also dropped whenever it grows
+    past max_transitions, to bound memory.
+    
+    Args:
+        reader (TraceReader): Open trace
+        manager (CompactResourceManager): Manager without a recorder
+        max_transitions (int): Most (state, record) pairs kept
+        chunk_records (int): Records between checks of the miss rate
+        
+    Returns:
+        dict: Same as replay_trace
+    """
+    names = reader.type_names
+    for name in names:
+        manager.get_type_code(name)
+    
+    states = []       # State id -> (packed inventory, pending consume requirements)
+    state_ids = {}
+    transitions = {}  # State id << 32 | record -> (next state id << 32, outcome)
+    tallies = [0] * OUTCOME_COUNT
+    
+    def intern(state):
+        """Id of a state, shifted to make room for the record in a key"""
+        state_id = state_ids.get(state)
+        if state_id is None:
+            state_id = len(states) << 32
+            state_ids[state] = state_id
+            states.append(state)
+        return state_id
+    
+    def apply_record(record, group):
+        """Apply a record to the manager; returns the pending requirements and the outcome"""
+        op, code, amount = record & 0xFF, (record >> 8) & 0xFF, record >> 16
+        if op == OP_ADD:
+            return group, TOXIC_ADD if manager.add_resource(names[code])[2] else APPLIED
+        if op == OP_USE:
+            return group, APPLIED if manager.use_resource(names[code], amount) else MISSED_USE
+        if op == OP_CONSUME:
+            return group + ((names[code], amount),), PENDING
+        if op == OP_CONSUME_END:
+            requirements = dict(group)
+            if code != NO_TYPE:
+                requirements[names[code]] = amount
+            return (), APPLIED if manager.consume_resources(requirements) else MISSED_REPAIR
+        if op == OP_AGE:
+            manager.apply_aging()
+            return group, APPLIED
+        return group, PENDING
+    
+    def learn(state_id, record):
+        """Apply a record to a state through the manager and cache the result"""
+        inventory, group = states[state_id >> 32]
+        manager.set_state(inventory)
+        group, outcome = apply_record(record, group)
+        transition = (intern((manager.get_state(), group)), outcome)
+        transitions[state_id | record] = transition
+        return transition
+    
+    state_id = intern((manager.get_state(), ()))
+    group = None  # Pending requirements once records are applied directly
+    start = time.perf_counter()
+    for words in reader.words(chunk_records):
+        if group is not None:
+            for record in words:
+                group, outcome = apply_record(record, group)
+                tallies[outcome] += 1
+            continue
+        
+        misses = 0
+        get_transition = transitions.get
+        for record in words:
+            transition = get_transition(state_id | record)
+            if transition is None:
+                misses += 1
+                if len(transitions) >= max_transitions:
+                    # Start over from the current state only
+                    current = states[state_id >> 32]
+                    states.clear()
+                    state_ids.clear()
+                    transitions.clear()
+                    state_id = intern(current)
+                transition = learn(state_id, record)
+            state_id, outcome = transition
+            tallies[outcome] += 1
+        
+        if misses > len(words) * MAX_MISS_RATE:
+            # States rarely repeat: continue from the current one without the cache
+            inventory, group = states[state_id >> 32]
+            manager.set_state(inventory)
+    
+    if group is None:
+        manager.set_state(states[state_id >> 32][0])
+    seconds = time.perf_counter() - start
+    
+    operations = sum(tallies) - tallies[PENDING]
+    return replay_result(manager, operations, seconds, tallies[TOXIC_ADD], tallies[MISSED_USE],
+                         tallies[MISSED_REPAIR])
+
+def replay_result(manager, operations, seconds, toxic_damage, missed_uses, missed_repairs):
+    """Assemble the statistics returned by replay_trace"""
+    return {
+        "operations": operations,
+        "seconds": seconds,
+        "ops_per_second": operations / seconds if seconds > 0 else float("inf"),
+        "toxic_damage": toxic_damage,
+        "missed_uses": missed_uses,
+        "missed_repairs": missed_repairs,
+        "checksum": inventory_checksum(manager)
+    }
+
+def create_manager(backend, inventory_size, resource_types, policy="mfu", lazy_aging=False):
+    """
+    Create the resource manager a trace is replayed against
+    
+    Args:
+        backend (str): "objects" or "compact"
+        inventory_size (int): Number of inventory slots
+        resource_types (list): Type names of the trace
+        policy (str): Replacement policy of the objects backend
+        lazy_aging (bool): Lazy epoch aging for the objects backend
+        
+    Returns:
+        ResourceManager or CompactResourceManager: The new manager
+    """
+    if backend == "compact":
+        return CompactResourceManager(inventory_size, resource_types=resource_types)
+    return ResourceManager(inventory_size, lazy_aging=lazy_aging, policy=policy)
+
+def main():
+    """Replay a trace file and report throughput and the final checksum"""
+    parser = argparse.ArgumentParser(description="Replay a recorded inventory trace")
+    parser.add_argument("trace", help="trace file recorded with Config.TRACE_FILE")
+    parser.add_argument("--backend", choices=("objects", "compact"), default="objects")
+    parser.add_argument("--policy", default="mfu", help="replacement policy (objects backend)")
+    parser.add_argument("--lazy-aging", action="store_true", help="use lazy epoch aging (objects backend)")
+    parser.add_argument("--cached", action="store_true",
+                        help="replay through the cache of state transitions (compact backend)")
+    parser.add_argument("--expect", help="expected final checksum; mismatches exit with status 1")
+    args = parser.parse_args()
+    if args.cached and args.backend != "compact":
+        parser.error("--cached needs --backend compact")
+    
+    with TraceReader(args.trace) as reader:
+        manager = create_manager(args.backend, reader.inventory_size, reader.type_names,
+                                 args.policy, args.lazy_aging)
+        if args.cached:
+            result = replay_transitions(reader, manager)
+        else:
+            result = replay_trace(reader, manager)
+    
+    print(f"mode:           {'cached transitions' if args.cached else 'direct'} ({args.backend})")
+    print(f"operations:     {result['operations']:,}")
+    print(f"seconds:        {result['seconds']:.3f}")
+    print(f"ops/second:     {result['ops_per_second']:,.0f}")
+    print(f"toxic damage:   {result['toxic_damage']}")
+    print(f"missed uses:    {result['missed_uses']}")
+    print(f"missed repairs: {result['missed_repairs']}")
+    print(f"checksum:       {result['checksum']}")
+    
+    if args.expect and args.expect.lower() != result["checksum"]:
+        print(f"Checksum mismatch: expected {args.expect}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
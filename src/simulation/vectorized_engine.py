@@ -0,0 +1,259 @@
+"""
+Vectorized Engine module - Simulates many independent games at once with NumPy
+
+Holds N inventories as (N, slots) type and counter arrays and applies the
+HeadlessGame rules to all of them with whole-array operations. Driven with
+the same random stream, every game ends in exactly the state HeadlessGame
+(and therefore ResourceManager) reaches; verify() checks that.
+
+Requires NumPy, which the game itself does not need:
+    python -m src.simulation.vectorized_engine --games 100000 --steps 600 --verify 500
+"""
+
+import argparse
+import time
+import numpy as np
+from src.core.config import Config
+from src.simulation.headless_game import (
+    HeadlessGame, simulation_params, RUNNING, WON, LOST, WEAPON_NORMAL, WEAPON_OXIDIZED, WEAPON_DESTROYED
+)
+
+EMPTY = -1  # Type code of an empty slot
+
+class VectorizedGames:
+    """N game sessions stored as arrays and stepped together"""
+    
+    def __init__(self, params, game_count):
+        """
+        Initialize the sessions
+        
+        Args:
+            params (dict): Simulation parameters (see simulation_params)
+            game_count (int): Number of independent games
+        """
+        self.params = params
+        self.game_count = game_count
+        slots = params["inventory_size"]
+        
+        # Resource types and cumulative spawn bands, accumulated like roll_resource_type
+        self.type_names = list(params["spawn_probabilities"])
+        cumulative = 0.0
+        bands = []
+        for probability in params["spawn_probabilities"].values():
+            cumulative += probability
+            bands.append(cumulative)
+        self.spawn_bands = np.array(bands)
+        self.core_code = self.type_names.index("core") if "core" in self.type_names else EMPTY
+        
+        # Weapon table: requirements as a (weapons, types) matrix
+        self.weapon_names = list(params["weapons"])
+        self.requirements = np.zeros((len(self.weapon_names), len(self.type_names)), dtype=np.int16)
+        self.points = np.zeros(len(self.weapon_names), dtype=np.int32)
+        for w, weapon_type in enumerate(self.weapon_names):
+            data = params["weapons"][weapon_type]
+            self.points[w] = data["points"]
+            for resource_type, amount in data["requirements"].items():
+                self.requirements[w, self.type_names.index(resource_type)] = amount
+        
+        # Inventories
+        self.types = np.full((game_count, slots), EMPTY, dtype=np.int8)
+        self.counters = np.zeros((game_count, slots), dtype=np.int16)
+        self.filled = np.zeros(game_count, dtype=np.int32)
+        
+        # Workbench
+        initial = [self.weapon_names.index(weapon_type) for weapon_type in params["initial_weapons"]]
+        self.weapon_codes = np.tile(np.array(initial, dtype=np.int8), (game_count, 1))
+        self.weapon_states = np.full((game_count, len(initial)), WEAPON_NORMAL, dtype=np.int8)
+        
+        # Player state
+        self.health = np.full(game_count, params["max_health"], dtype=np.int32)
+        self.score = np.zeros(game_count, dtype=np.int32)
+        self.weapons_repaired = np.zeros(game_count, dtype=np.int32)
+        self.toxic_damage = np.zeros(game_count, dtype=np.int32)
+        self.steps = np.zeros(game_count, dtype=np.int32)
+        self.outcome = np.full(game_count, RUNNING, dtype=np.int8)
+        
+        # All games share the clock, so aging happens on the same steps
+        self.elapsed = 0
+        self.next_aging = params["aging_interval"]
+        
+        self.rows = np.arange(game_count)
+    
+    def step(self, spawn_rolls, catch_rolls, weapon_rolls):
+        """
+        Advance every running game by one spawn interval
+        
+        Args:
+            spawn_rolls (ndarray): Per game uniform [0, 1) roll picking the spawned type
+            catch_rolls (ndarray): Per game uniform [0, 1) roll deciding whether it is caught
+            weapon_rolls (ndarray): Per game uniform [0, 1) roll picking a replacement weapon
+        """
+        params = self.params
+        rows = self.rows
+        slots = params["inventory_size"]
+        active = self.outcome == RUNNING
+        self.steps += active
+        self.elapsed += params["spawn_interval"]
+        
+        # Collect the spawned resource: free slot first, otherwise MFU (argmax keeps the first max)
+        spawned = np.minimum(np.searchsorted(self.spawn_bands, spawn_rolls, side="right"), len(self.type_names) - 1)
+        caught = active & (catch_rolls < params["catch_rate"])
+        full = self.filled >= slots
+        victim = np.argmax(self.counters, axis=1)
+        slot = np.where(full, victim, np.minimum(self.filled, slots - 1))
+        toxic = caught & full & (self.counters[rows, slot] > params["toxic_threshold"])
+        
+        target = rows[caught]
+        self.types[target, slot[caught]] = spawned[caught]
+        self.counters[target, slot[caught]] = 0
+        self.filled += caught & ~full
+        
+        self.health -= toxic
+        self.toxic_damage += toxic
+        self.health -= caught & (spawned == self.core_code)
+        
+        self.outcome[active & (self.health <= 0)] = LOST
+        active &= self.outcome == RUNNING
+        
+        # Repair the first weapon each inventory allows
+        counts = np.stack([(self.types == code).sum(axis=1) for code in range(len(self.type_names))], axis=1)
+        needed = self.requirements[self.weapon_codes]  # (games, weapons on bench, types)
+        repairable = (counts[:, None, :] >= needed).all(axis=2)
+        repair = active & repairable.any(axis=1)
+        choice = np.argmax(repairable, axis=1)
+        chosen = self.weapon_codes[rows, choice]
+        
+        use = np.zeros(self.counters.shape, dtype=bool)
+        for code in range(len(self.type_names)):
+            holds = self.types == code
+            rank = np.cumsum(holds, axis=1)
+            use |= holds & (rank <= self.requirements[chosen, code][:, None])
+        use &= repair[:, None]
+        np.minimum(self.counters + use * params["counter_increment"], params["counter_max"], out=self.counters)
+        
+        self.weapons_repaired += repair
+        self.score += np.where(repair, self.points[chosen], 0)
+        replacement = np.minimum((weapon_rolls * len(self.weapon_names)).astype(np.int64), len(self.weapon_names) - 1)
+        self.weapon_codes[rows[repair], choice[repair]] = replacement[repair]
+        self.weapon_states[rows[repair], choice[repair]] = WEAPON_NORMAL
+        
+        if params["weapons_to_win"] > 0:
+            self.outcome[active & (self.weapons_repaired >= params["weapons_to_win"])] = WON
+            active &= self.outcome == RUNNING
+        
+        # Aging of resources and weapons
+        if self.elapsed >= self.next_aging:
+            self.next_aging += params["aging_interval"]
+            self.counters[active] >>= 1
+            
+            destroyed = (self.weapon_states == WEAPON_OXIDIZED).any(axis=1) & active
+            aged = np.minimum(self.weapon_states + 1, WEAPON_DESTROYED).astype(np.int8)
+            self.weapon_states[active] = aged[active]
+            self.health -= destroyed
+            self.outcome[destroyed & (self.health <= 0)] = LOST
+    
+    def run(self, steps, rng):
+        """
+        Step every game until all have ended or the step limit is reached
+        
+        Args:
+            steps (int): Maximum number of steps
+            rng (numpy.random.Generator): Random stream, three rolls per game per step
+        """
+        for _ in range(steps):
+            if not (self.outcome == RUNNING).any():
+                break
+            spawn_rolls, catch_rolls, weapon_rolls = rng.random((3, self.game_count))
+            self.step(spawn_rolls, catch_rolls, weapon_rolls)
+    
+    def result(self, game):
+        """
+        Summary of one game, in the format of HeadlessGame.result()
+        
+        Args:
+            game (int): Game index
+            
+        Returns:
+            dict: Session summary
+        """
+        filled = self.filled[game]
+        return {
+            "outcome": int(self.outcome[game]),
+            "steps": int(self.steps[game]),
+            "health": int(self.health[game]),
+            "score": int(self.score[game]),
+            "weapons_repaired": int(self.weapons_repaired[game]),
+            "toxic_damage": int(self.toxic_damage[game]),
+            "elapsed": int(self.steps[game]) * self.params["spawn_interval"],
+            "types": [self.type_names[code] for code in self.types[game, :filled]],
+            "counters": [int(counter) for counter in self.counters[game, :filled]]
+        }
+
+def run_reference(params, game_count, steps, rng):
+    """
+    Run HeadlessGame sessions on the random stream VectorizedGames.run consumes
+    
+    Args:
+        params (dict): Simulation parameters
+        game_count (int): Number of games
+        steps (int): Maximum number of steps
+        rng (numpy.random.Generator): Random stream
+        
+    Returns:
+        list: HeadlessGame objects
+    """
+    games = [HeadlessGame(params) for _ in range(game_count)]
+    for _ in range(steps):
+        if all(game.outcome != RUNNING for game in games):
+            break
+        spawn_rolls, catch_rolls, weapon_rolls = rng.random((3, game_count))
+        for i, game in enumerate(games):
+            game.step(spawn_rolls[i], catch_rolls[i], weapon_rolls[i])
+    return games
+
+def verify(params, game_count, steps, seed=0):
+    """
+    Check that the vectorized engine matches ResourceManager game by game
+    
+    Args:
+        params (dict): Simulation parameters
+        game_count (int): Number of games
+        steps (int): Maximum number of steps
+        seed (int): Seed of the shared random stream
+        
+    Returns:
+        list: Indices of games whose results differ
+    """
+    engine = VectorizedGames(params, game_count)
+    engine.run(steps, np.random.default_rng(seed))
+    reference = run_reference(params, game_count, steps, np.random.default_rng(seed))
+    return [i for i, game in enumerate(reference) if engine.result(i) != game.result()]
+
+def main():
+    """Simulate a batch of games and print aggregate results"""
+    parser = argparse.ArgumentParser(description="Simulate many MFU games at once with NumPy")
+    parser.add_argument("--games", type=int, default=100000, help="number of independent games")
+    parser.add_argument("--steps", type=int, default=600, help="maximum spawn intervals per game")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random stream")
+    parser.add_argument("--verify", type=int, default=0, help="also check this many games against ResourceManager")
+    args = parser.parse_args()
+    
+    params = simulation_params(Config())
+    engine = VectorizedGames(params, args.games)
+    start = time.perf_counter()
+    engine.run(args.steps, np.random.default_rng(args.seed))
+    seconds = time.perf_counter() - start
+    
+    minutes = engine.steps * params["spawn_interval"] / 60000
+    print(f"games:               {args.games:,} in {seconds:.2f}s")
+    print(f"win rate:            {(engine.outcome == WON).mean():.3f}")
+    print(f"loss rate:           {(engine.outcome == LOST).mean():.3f}")
+    print(f"avg toxic damage:    {engine.toxic_damage.mean():.3f}")
+    print(f"repairs per minute:  {(engine.weapons_repaired / np.maximum(minutes, 1e-9)).mean():.3f}")
+    
+    if args.verify:
+        mismatches = verify(params, args.verify, args.steps, args.seed)
+        print(f"verified {args.verify} games against ResourceManager: {len(mismatches)} mismatches")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+Frame Timing Overlay module - On-screen frame time statistics
+"""
+
+import pygame
+
+class FrameTimingOverlay:
+    """
+    Shows rolling p50/p95/p99 frame times and the per-section breakdown
+    collected by a FrameProfiler
+    """
+    
+    # Rows shown, as (profiler name, label)
+    ROWS = (
+        ("frame", "frame"),
+        ("busy", "busy"),
+        ("events", "events"),
+        ("update", "update"),
+        ("draw", "draw"),
+        ("draw.inventory_panel", "  inventory"),
+        ("draw.repair_panel", "  repair"),
+        ("draw.status_panel", "  status"),
+        ("overlay", "overlay"),
+        ("flip", "flip")
+    )
+    
+    # Left edge of each column, relative to the panel
+    COLUMNS = (8, 100, 165, 230, 295)
+    
+    def __init__(self, profiler, config, refresh_interval=250):
+        """
+        Initialize the overlay
+        
+        Args:
+            profiler (FrameProfiler): Source of the timings
+            config (Config): Game configuration
+            refresh_interval (int): Milliseconds between text refreshes
+        """
+        self.profiler = profiler
+        self.config = config
+        self.refresh_interval = refresh_interval
+        self.visible = False
+        
+        self.font = config.FONT_SMALL
+        self.line_height = self.font.get_linesize()
+        self.lines = []
+        self.last_refresh = 0
+        
+        # Translucent backing panel, sized for the header and all rows
+        self.rect = pygame.Rect(config.SCREEN_WIDTH - 350, 100, 340, self.line_height * (len(self.ROWS) + 1) + 10)
+        self.background = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.background.fill((0, 0, 0, 170))
+    
+    def toggle(self):
+        """Show or hide the overlay; statistics are only collected while shown"""
+        self.visible = not self.visible
+        self.profiler.set_enabled(self.visible)
+        self.last_refresh = 0
+    
+    def refresh(self):
+        """Re-render the text cells from the current statistics"""
+        header = ["ms", "p50", "p95", "p99"]
+        if self.profiler.recording:
+            header.append("REC")
+        rows = [header]
+        for name, label in self.ROWS:
+            rows.append([label] + [f"{value:.2f}" for value in self.profiler.percentiles(name)])
+        
+        # The default font is proportional, so every cell is placed in its own column
+        color = self.config.TEXT_COLOR
+        self.lines = [
+            [(self.font.render(cell, True, color), self.COLUMNS[column]) for column, cell in enumerate(row)]
+            for row in rows
+        ]
+    
+    def draw(self, surface):
+        """
+        Draw the overlay if it is visible
+        
+        Args:
+            surface: Pygame surface to draw on
+        """
+        if not self.visible:
+            return
+        
+        # Text only changes a few times per second
+        now = pygame.time.get_ticks()
+        if not self.lines or now - self.last_refresh >= self.refresh_interval:
+            self.refresh()
+            self.last_refresh = now
+        
+        surface.blit(self.background, self.rect)
+        y = self.rect.y + 5
+        for line in self.lines:
+            for text, x in line:
+                surface.blit(text, (self.rect.x + x, y))
+            y += self.line_height
\ No newline at end of file
@@ -35,6 +35,18 @@ class InventoryPanel:
             y = self.rect.y + 60 + row * (slot_height + 30)
             
             self.slots.append(pygame.Rect(x, y, slot_width, slot_height))
+        
+        # Resource names are wider than a slot; the next slot in the row covers
+        # the overflow, so names are cut where that slot starts
+        self.name_widths = []
+        for i, slot_rect in enumerate(self.slots):
+            if i % slots_per_row < slots_per_row - 1 and i + 1 < len(self.slots):
+                self.name_widths.append(self.slots[i + 1].x - (slot_rect.x + 5))
+            else:
+                self.name_widths.append(None)
+        
+        # Inventory contents at the last dirty check
+        self.drawn_state = None
     
     def update(self):
         """Update inventory panel"""
@@ -44,6 +56,16 @@ class InventoryPanel:
         """
         Draw the inventory panel
         
+        Args:
+            surface: Pygame surface to draw on
+        """
+        self.draw_static(surface)
+        self.draw_dynamic(surface)
+    
+    def draw_static(self, surface):
+        """
+        Draw the panel background, title and empty slots
+        
         Args:
             surface: Pygame surface to draw on
         """
@@ -52,16 +74,31 @@ class InventoryPanel:
         pygame.draw.rect(surface, self.config.UI_BORDER_COLOR, self.rect, 2)
         
         # Draw title
-        font = self.config.FONT_MEDIUM
-        title = font.render("INVENTARIO", True, self.config.TEXT_COLOR)
+        text_cache = self.config.TEXT_CACHE
+        title = text_cache.render(self.config.FONT_MEDIUM, "INVENTARIO", self.config.TEXT_COLOR)
         surface.blit(title, (self.rect.x + 10, self.rect.y + 10))
         
         # Draw inventory slots
-        for i, slot_rect in enumerate(self.slots):
+        for slot_rect in self.slots:
             # Draw slot background
             pygame.draw.rect(surface, (30, 25, 20), slot_rect)
             pygame.draw.rect(surface, self.config.UI_BORDER_COLOR, slot_rect, 2)
-            
+    
+    def draw_dynamic(self, surface):
+        """
+        Draw the resources in the filled slots
+        
+        Args:
+            surface: Pygame surface to draw on
+        """
+        text_cache = self.config.TEXT_CACHE
+        
+        # Icons and names are collected per layer and submitted with blits;
+        # counter bars go on top, as they overlap the names
+        icon_blits = []
+        name_blits = []
+        bars = []
+        for i, slot_rect in enumerate(self.slots):
             # Draw resource if slot is filled
             if i < len(self.resource_manager.inventory):
                 resource = self.resource_manager.inventory[i]
@@ -75,7 +112,7 @@ class InventoryPanel:
                     # Center the image in the slot
                     image_x = slot_rect.x + (slot_rect.width - resource_image.get_width()) // 2
                     image_y = slot_rect.y + 10
-                    surface.blit(resource_image, (image_x, image_y))
+                    icon_blits.append((resource_image, (image_x, image_y)))
                 else:
                     # Fallback to colored rectangle if image not available
                     pygame.draw.rect(surface, color, pygame.Rect(
@@ -87,8 +124,11 @@ class InventoryPanel:
                 
                 # Draw resource name
                 name = self.config.RESOURCE_TYPES[resource.type]["name"]
-                name_text = self.config.FONT_SMALL.render(name, True, self.config.TEXT_COLOR)
-                surface.blit(name_text, (slot_rect.x + 5, slot_rect.y + slot_rect.height - 20))
+                name_text = text_cache.render(self.config.FONT_SMALL, name, self.config.TEXT_COLOR)
+                name_area = name_text.get_rect()
+                if self.name_widths[i] is not None:
+                    name_area.width = min(name_area.width, self.name_widths[i])
+                name_blits.append((name_text, (slot_rect.x + 5, slot_rect.y + slot_rect.height - 20), name_area))
                 
                 # Draw counter bar
                 counter_width = int((slot_rect.width - 20) * (resource.counter / 255))
@@ -99,12 +139,30 @@ class InventoryPanel:
                 else:
                     bar_color = self.config.COUNTER_HIGH_COLOR
                 
-                pygame.draw.rect(surface, bar_color, pygame.Rect(
+                bars.append((bar_color, pygame.Rect(
                     slot_rect.x + 10,
                     slot_rect.y + slot_rect.height - 5,
                     counter_width,
                     3
-                ))
+                )))
+        
+        surface.blits(icon_blits, False)
+        surface.blits(name_blits, False)
+        for bar_color, bar_rect in bars:
+            pygame.draw.rect(surface, bar_color, bar_rect)
+    
+    def get_dirty_rects(self):
+        """
+        Get the regions that changed since the last call
+        
+        Returns:
+            list: The panel rectangle if any slot's type or counter changed
+        """
+        state = tuple((resource.type, resource.counter) for resource in self.resource_manager.inventory)
+        if state == self.drawn_state:
+            return []
+        self.drawn_state = state
+        return [self.rect]
     
     def handle_click(self, pos):
         """
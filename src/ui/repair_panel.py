@@ -18,6 +18,8 @@ class RepairPanel:
         self.rect = rect
         self.config = config
         self.game = None  # Will be set when update is called
+        self.weapons = []
+        self.selected_weapon = None
         
         # Calculate weapon positions
         self.weapon_rects = []
@@ -39,6 +41,9 @@ class RepairPanel:
             self.rect.width - 100,
             40
         )
+        
+        # Weapon slots and selection at the last dirty check
+        self.drawn_state = None
     
     def update(self, weapons, selected_weapon, game=None):
         """
@@ -66,11 +71,13 @@ class RepairPanel:
         pygame.draw.rect(surface, self.config.UI_BORDER_COLOR, self.rect, 2)
         
         # Draw title
-        font = self.config.FONT_MEDIUM
-        title = font.render("ESTACIÓN DE REPARACIÓN", True, self.config.TEXT_COLOR)
+        text_cache = self.config.TEXT_CACHE
+        title = text_cache.render(self.config.FONT_MEDIUM, "ESTACIÓN DE REPARACIÓN", self.config.TEXT_COLOR)
         surface.blit(title, (self.rect.x + 10, self.rect.y + 10))
         
-        # Draw weapons
+        # Draw weapons; row backgrounds first, then every image and text of
+        # the rows in one blits call (rows do not overlap)
+        row_blits = []
         for i, weapon_rect in enumerate(self.weapon_rects):
             if i < len(self.weapons):
                 weapon = self.weapons[i]
@@ -90,37 +97,64 @@ class RepairPanel:
                     if weapon_image:
                         image_x = weapon_rect.x + 10
                         image_y = weapon_rect.y + 10
-                        surface.blit(weapon_image, (image_x, image_y))
+                        row_blits.append((weapon_image, (image_x, image_y)))
                 
                 # Draw weapon name
-                name_text = self.config.FONT_MEDIUM.render(weapon.name, True, self.config.TEXT_COLOR)
-                surface.blit(name_text, (weapon_rect.x + 100, weapon_rect.y + 10))
+                name_text = text_cache.render(self.config.FONT_MEDIUM, weapon.name, self.config.TEXT_COLOR)
+                row_blits.append((name_text, (weapon_rect.x + 100, weapon_rect.y + 10)))
                 
                 # Draw requirements
                 y_offset = 40
                 for resource_type, amount in weapon.requirements.items():
-                    req_text = self.config.FONT_SMALL.render(
+                    req_text = text_cache.render(
+                        self.config.FONT_SMALL,
                         f"{self.config.RESOURCE_TYPES[resource_type]['name']}: {amount}",
-                        True,
                         self.config.RESOURCE_TYPES[resource_type]['color']
                     )
-                    surface.blit(req_text, (weapon_rect.x + 150, weapon_rect.y + y_offset))
+                    row_blits.append((req_text, (weapon_rect.x + 150, weapon_rect.y + y_offset)))
                     y_offset += 20
                 
                 # Draw repaired status if applicable
                 if weapon.repaired:
-                    status_text = self.config.FONT_SMALL.render("REPARADA", True, (0, 200, 0))
-                    surface.blit(status_text, (weapon_rect.x + weapon_rect.width - 100, weapon_rect.y + 10))
+                    status_text = text_cache.render(self.config.FONT_SMALL, "REPARADA", (0, 200, 0))
+                    row_blits.append((status_text, (weapon_rect.x + weapon_rect.width - 100, weapon_rect.y + 10)))
+        surface.blits(row_blits, False)
         
         # Draw repair button
         button_color = (100, 150, 100) if self.selected_weapon and not self.selected_weapon.repaired else (80, 80, 80)
         pygame.draw.rect(surface, button_color, self.repair_button_rect)
         pygame.draw.rect(surface, self.config.UI_BORDER_COLOR, self.repair_button_rect, 2)
         
-        button_text = self.config.FONT_MEDIUM.render("REPARAR", True, self.config.TEXT_COLOR)
+        button_text = text_cache.render(self.config.FONT_MEDIUM, "REPARAR", self.config.TEXT_COLOR)
         text_rect = button_text.get_rect(center=self.repair_button_rect.center)
         surface.blit(button_text, text_rect)
     
+    def get_state(self):
+        """
+        Describe everything the panel shows
+        
+        Returns:
+            tuple: Type, state, repaired flag and selection of each weapon, and
+                whether the repair button is active
+        """
+        return (
+            tuple((weapon.type, weapon.state, weapon.repaired, weapon is self.selected_weapon) for weapon in self.weapons),
+            bool(self.selected_weapon and not self.selected_weapon.repaired)
+        )
+    
+    def get_dirty_rects(self):
+        """
+        Get the regions that changed since the last call
+        
+        Returns:
+            list: The panel rectangle if a weapon, its state or the selection changed
+        """
+        state = self.get_state()
+        if state == self.drawn_state:
+            return []
+        self.drawn_state = state
+        return [self.rect]
+    
     def handle_click(self, pos):
         """
         Handle mouse click on repair panel
@@ -38,13 +38,20 @@ class StatusPanel:
             button_height
         )
         
-        # Aging timer display
+        # Aging timer display (wide enough for the text-only fallback)
         self.timer_rect = pygame.Rect(
             self.rect.x + 800,
             self.rect.y + 5,
-            100,
+            140,
             button_height
         )
+        
+        # What was on screen at the last dirty check
+        self.drawn_state = None
+        self.drawn_timer = None
+        
+        # Areas covered by draw_static, for redrawing them from a cached layer
+        self.static_rects = [self.rect]
     
     def update(self):
         """Update status panel"""
@@ -54,6 +61,17 @@ class StatusPanel:
         """
         Draw the status panel
         
+        Args:
+            surface: Pygame surface to draw on
+        """
+        self.draw_static(surface)
+        self.draw_dynamic(surface)
+    
+    def draw_static(self, surface):
+        """
+        Draw the parts of the panel that never change: background, labels,
+        clock icon and navigation buttons
+        
         Args:
             surface: Pygame surface to draw on
         """
@@ -61,10 +79,42 @@ class StatusPanel:
         pygame.draw.rect(surface, (40, 35, 30), self.rect)
         pygame.draw.rect(surface, self.config.UI_BORDER_COLOR, self.rect, 2)
         
-        # Draw health
-        health_text = self.config.FONT_SMALL.render(f"Salud: ", True, self.config.TEXT_COLOR)
+        text_cache = self.config.TEXT_CACHE
+        font = self.config.FONT_SMALL
+        
+        # Draw health label
+        health_text = text_cache.render(font, "Salud: ", self.config.TEXT_COLOR)
         surface.blit(health_text, (self.rect.x + 10, self.rect.y + 10))
         
+        # Draw clock icon if available
+        self.static_rects = [self.rect]
+        clock_icon = self.game.asset_loader.get_image("clock_icon")
+        if clock_icon:
+            self.static_rects.append(surface.blit(clock_icon, (self.rect.x + 800, self.rect.y + 10)))
+        
+        # Draw navigation buttons
+        pygame.draw.rect(surface, (60, 55, 50), self.workshop_button_rect)
+        pygame.draw.rect(surface, self.config.UI_BORDER_COLOR, self.workshop_button_rect, 2)
+        workshop_text = text_cache.render(font, "Taller", self.config.TEXT_COLOR)
+        workshop_text_rect = workshop_text.get_rect(center=self.workshop_button_rect.center)
+        surface.blit(workshop_text, workshop_text_rect)
+        
+        pygame.draw.rect(surface, (60, 55, 50), self.collection_button_rect)
+        pygame.draw.rect(surface, self.config.UI_BORDER_COLOR, self.collection_button_rect, 2)
+        collection_text = text_cache.render(font, "Recolección", self.config.TEXT_COLOR)
+        collection_text_rect = collection_text.get_rect(center=self.collection_button_rect.center)
+        surface.blit(collection_text, collection_text_rect)
+    
+    def draw_dynamic(self, surface):
+        """
+        Draw the health hearts, score and aging countdown
+        
+        Args:
+            surface: Pygame surface to draw on
+        """
+        text_cache = self.config.TEXT_CACHE
+        font = self.config.FONT_SMALL
+        
         # Draw health hearts
         for i in range(self.config.PLAYER_MAX_HEALTH):
             color = (200, 50, 50) if i < self.game.health else (100, 30, 30)
@@ -73,43 +123,50 @@ class StatusPanel:
         # Draw score and weapons repaired
         if self.config.WEAPONS_TO_WIN > 0:
             # Normal mode - show progress towards victory
-            score_text = self.config.FONT_SMALL.render(
-                f"Puntos: {self.game.score} | Armas: {self.game.weapons_repaired}/{self.config.WEAPONS_TO_WIN}", 
-                True, 
+            score_text = text_cache.render(
+                font,
+                f"Puntos: {self.game.score} | Armas: {self.game.weapons_repaired}/{self.config.WEAPONS_TO_WIN}",
                 self.config.TEXT_COLOR
             )
         else:
             # Infinite mode
-            score_text = self.config.FONT_SMALL.render(
-                f"Puntos: {self.game.score} | Armas: {self.game.weapons_repaired} (Modo ∞)", 
-                True, 
+            score_text = text_cache.render(
+                font,
+                f"Puntos: {self.game.score} | Armas: {self.game.weapons_repaired} (Modo ∞)",
                 self.config.TEXT_COLOR
             )
         surface.blit(score_text, (self.rect.x + 180, self.rect.y + 10))
         
         # Draw aging timer
-        # Calculate time until next aging
-        next_aging = (self.config.AGING_INTERVAL - pygame.time.get_ticks() % self.config.AGING_INTERVAL) // 1000
+        next_aging = self.get_timer()
         
-        # Draw clock icon if available
-        clock_icon = self.game.asset_loader.get_image("clock_icon")
-        if clock_icon:
-            surface.blit(clock_icon, (self.rect.x + 800, self.rect.y + 10))
-            timer_text = self.config.FONT_SMALL.render(f"{next_aging}s", True, self.config.TEXT_COLOR)
+        # Next to the clock icon if available
+        if self.game.asset_loader.get_image("clock_icon"):
+            timer_text = text_cache.render(font, f"{next_aging}s", self.config.TEXT_COLOR)
             surface.blit(timer_text, (self.rect.x + 825, self.rect.y + 10))
         else:
-            timer_text = self.config.FONT_SMALL.render(f"Oxidación: {next_aging}s", True, self.config.TEXT_COLOR)
+            timer_text = text_cache.render(font, f"Oxidación: {next_aging}s", self.config.TEXT_COLOR)
             surface.blit(timer_text, (self.rect.x + 800, self.rect.y + 10))
+    
+    def get_timer(self):
+        """Whole seconds until the next aging pass, as the countdown shows them"""
+        return int(self.game.next_aging - self.game.sim_time) // 1000
+    
+    def get_dirty_rects(self):
+        """
+        Get the regions that changed since the last call
         
-        # Draw navigation buttons
-        pygame.draw.rect(surface, (60, 55, 50), self.workshop_button_rect)
-        pygame.draw.rect(surface, self.config.UI_BORDER_COLOR, self.workshop_button_rect, 2)
-        workshop_text = self.config.FONT_SMALL.render("Taller", True, self.config.TEXT_COLOR)
-        workshop_text_rect = workshop_text.get_rect(center=self.workshop_button_rect.center)
-        surface.blit(workshop_text, workshop_text_rect)
-        
-        pygame.draw.rect(surface, (60, 55, 50), self.collection_button_rect)
-        pygame.draw.rect(surface, self.config.UI_BORDER_COLOR, self.collection_button_rect, 2)
-        collection_text = self.config.FONT_SMALL.render("Recolección", True, self.config.TEXT_COLOR)
-        collection_text_rect = collection_text.get_rect(center=self.collection_button_rect.center)
-        surface.blit(collection_text, collection_text_rect)
\ No newline at end of file
+        Returns:
+            list: The panel rectangle if health, score or repairs changed, and
+                the timer rectangle if the countdown changed
+        """
+        rects = []
+        state = (self.game.health, self.game.score, self.game.weapons_repaired)
+        if state != self.drawn_state:
+            self.drawn_state = state
+            rects.append(self.rect)
+        timer = self.get_timer()
+        if timer != self.drawn_timer:
+            self.drawn_timer = timer
+            rects.append(self.timer_rect)
+        return rects
\ No newline at end of file
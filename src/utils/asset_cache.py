@@ -0,0 +1,243 @@
+"""
+Asset Cache module - Persistent cache of decoded images and sounds
+
+Decoding PNGs, scaling them and decoding MP3s dominates startup. The cache
+stores the result of that work as raw pixels (RGBA, already scaled) and raw
+PCM in the mixer's format, in files named after the SHA-1 of the source file
+plus the target size or mixer format. Later launches memory-map those files
+and hand the bytes straight to pygame, so no decoder runs at all.
+
+File layout:
+    image: header "<4sHII" (b"MFUI", version, width, height), then width*height*4 RGBA bytes
+    sound: header "<4sHihh" (b"MFUS", version, frequency, format, channels), then PCM bytes
+A changed source gets a new digest and therefore a new file; stale entries
+are never read again and can be deleted with clear().
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import pygame
+from src.utils.event_log import get_logger
+
+log = get_logger("assets")
+
+CACHE_VERSION = 1
+IMAGE_HEADER = struct.Struct("<4sHII")
+SOUND_HEADER = struct.Struct("<4sHihh")
+IMAGE_MAGIC = b"MFUI"
+SOUND_MAGIC = b"MFUS"
+
+class AssetCache:
+    """Decoded asset cache stored in a directory"""
+    
+    def __init__(self, directory):
+        """
+        Initialize the cache
+        
+        Args:
+            directory (str): Directory holding the cache files, created on first write
+        """
+        self.directory = directory
+        self.digests = {}  # (path, size, mtime) -> SHA-1 of the file
+        self.hits = 0
+        self.misses = 0
+        self.writable = True
+    
+    def source_digest(self, path):
+        """
+        SHA-1 of a source file, computed once per file version
+        
+        Args:
+            path (str): Source file
+            
+        Returns:
+            str: Hex digest
+        """
+        stat = os.stat(path)
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        digest = self.digests.get(key)
+        if digest is None:
+            with open(path, "rb") as file:
+                digest = hashlib.sha1(file.read()).hexdigest()
+            self.digests[key] = digest
+        return digest
+    
+    def load_image(self, path, scale=None):
+        """
+        Load an image converted for the display, and optionally scaled
+        
+        Args:
+            path (str): Source image file
+            scale (tuple, optional): Width and height to scale the image to
+            
+        Returns:
+            pygame.Surface: The image, in the display's alpha format
+        """
+        return self.fetch_image(path, scale, convert=True)
+    
+    def decode_image(self, path, scale=None):
+        """
+        Load an image without converting it for the display
+        
+        Safe to call from worker threads; the caller converts the result on
+        the main thread.
+        
+        Args:
+            path (str): Source image file
+            scale (tuple, optional): Width and height to scale the image to
+            
+        Returns:
+            pygame.Surface: The image, as an independent RGBA surface
+        """
+        return self.fetch_image(path, scale, convert=False)
+    
+    def fetch_image(self, path, scale, convert):
+        """Read an image from the cache, or decode, scale and store it"""
+        size = f"{scale[0]}x{scale[1]}" if scale else "orig"
+        cache_path = self.entry_path(f"{self.source_digest(path)}_{size}.img")
+        
+        image = self.read_image(cache_path, convert)
+        if image is not None:
+            self.hits += 1
+            return image
+        
+        self.misses += 1
+        image = pygame.image.load(path)
+        if scale:
+            image = pygame.transform.scale(image, scale)
+        header = IMAGE_HEADER.pack(IMAGE_MAGIC, CACHE_VERSION, image.get_width(), image.get_height())
+        self.write_entry(cache_path, header, pygame.image.tobytes(image, "RGBA"))
+        return image.convert_alpha() if convert else image
+    
+    def load_sound(self, path):
+        """
+        Load a sound in the mixer's current format
+        
+        Args:
+            path (str): Source sound file
+            
+        Returns:
+            pygame.mixer.Sound: The decoded sound
+        """
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        cache_path = self.entry_path(f"{self.source_digest(path)}_{frequency}_{sample_format}_{channels}.pcm")
+        
+        sound = self.read_sound(cache_path, (frequency, sample_format, channels))
+        if sound is not None:
+            self.hits += 1
+            return sound
+        
+        self.misses += 1
+        sound = pygame.mixer.Sound(path)
+        header = SOUND_HEADER.pack(SOUND_MAGIC, CACHE_VERSION, frequency, sample_format, channels)
+        self.write_entry(cache_path, header, sound.get_raw())
+        return sound
+    
+    def entry_path(self, file_name):
+        """Path of a cache file"""
+        return os.path.join(self.directory, file_name)
+    
+    def read_image(self, cache_path, convert=True):
+        """Map a cached image, or return None if it is missing or invalid"""
+        with self.map_entry(cache_path) as data:
+            if data is None or len(data) < IMAGE_HEADER.size:
+                return None
+            magic, version, width, height = IMAGE_HEADER.unpack_from(data)
+            if magic != IMAGE_MAGIC or version != CACHE_VERSION or len(data) != IMAGE_HEADER.size + width * height * 4:
+                return None
+            
+            # frombuffer reads the mapped pages in place; convert_alpha (or a
+            # plain copy off the main thread) makes the surface the game keeps
+            pixels = memoryview(data)[IMAGE_HEADER.size:]
+            try:
+                mapped = pygame.image.frombuffer(pixels, (width, height), "RGBA")
+                image = mapped.convert_alpha() if convert else mapped.copy()
+                del mapped  # Drop the surface's hold on the mapping before it is released
+                return image
+            finally:
+                pixels.release()
+    
+    def read_sound(self, cache_path, mixer_format):
+        """Map a cached sound, or return None if it is missing or invalid"""
+        with self.map_entry(cache_path) as data:
+            if data is None or len(data) < SOUND_HEADER.size:
+                return None
+            magic, version, *entry_format = SOUND_HEADER.unpack_from(data)
+            if magic != SOUND_MAGIC or version != CACHE_VERSION or tuple(entry_format) != mixer_format:
+                return None
+            
+            samples = memoryview(data)[SOUND_HEADER.size:]
+            try:
+                return pygame.mixer.Sound(buffer=samples)
+            finally:
+                samples.release()
+    
+    def map_entry(self, cache_path):
+        """Context manager yielding a read-only mapping of a cache file, or None"""
+        return MappedFile(cache_path)
+    
+    def write_entry(self, cache_path, header, payload):
+        """
+        Write a cache file atomically; failures only disable further writes
+        
+        Args:
+            cache_path (str): Destination file
+            header (bytes): Packed header
+            payload (bytes): Pixel or sample data
+        """
+        if not self.writable:
+            return
+        temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, "wb") as file:
+                file.write(header)
+                file.write(payload)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            self.writable = False
+            log.warning("asset_cache_unwritable", directory=self.directory, error=str(e))
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def clear(self):
+        """Delete every cache file"""
+        if not os.path.isdir(self.directory):
+            return
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith((".img", ".pcm", ".tmp")):
+                os.remove(os.path.join(self.directory, file_name))
+
+class MappedFile:
+    """Read-only memory mapping of a whole file, closed on exit"""
+    
+    def __init__(self, path):
+        """
+        Initialize the mapping
+        
+        Args:
+            path (str): File to map
+        """
+        self.path = path
+        self.file = None
+        self.mapping = None
+    
+    def __enter__(self):
+        try:
+            self.file = open(self.path, "rb")
+            if os.fstat(self.file.fileno()).st_size == 0:
+                return None
+            self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        return self.mapping
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.mapping is not None:
+            self.mapping.close()
+        if self.file is not None:
+            self.file.close()
+        return False
\ No newline at end of file
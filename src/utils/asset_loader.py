@@ -3,16 +3,41 @@ Asset Loader module - Utility for loading and managing game assets
 """
 
 import os
+import json
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import pygame
+from src.utils.sprite_atlas import ATLAS_FORMAT, file_digest
 
 class AssetLoader:
     """Utility class for loading and managing game assets"""
     
-    def __init__(self):
-        """Initialize the asset loader"""
+    def __init__(self, cache=None, workers=1, variant_budget=4 * 1024 * 1024):
+        """
+        Initialize the asset loader
+        
+        Args:
+            cache (AssetCache, optional): Decoded asset cache images and sounds are loaded through
+            workers (int): Decoding threads used by start_batch; 1 loads batches on the main thread
+            variant_budget (int): Bytes of pixel data kept in transformed image variants
+        """
+        self.cache = cache
+        self.workers = workers
         self.images = {}
         self.sounds = {}
         self.fonts = {}
+        self.atlas_pages = []
+        
+        # Assets that can be loaded and released by name (see load/unload)
+        self.specs = {}          # Name -> ("image", path, scale) or ("sound", path, None)
+        self.atlas_sprites = {}  # Name -> (page index, rect) of sprites served from the atlas
+        self.missing = set()     # Names whose files could not be loaded
+        
+        # Transformed images (see get_variant), least recently used first
+        self.variants = OrderedDict()  # Descriptor -> (source image, variant, size in bytes)
+        self.variant_budget = variant_budget
+        self.variant_bytes = 0
     
     def load_image(self, name, path, scale=None):
         """
@@ -28,10 +53,13 @@ class AssetLoader:
         """
         try:
             if os.path.exists(path):
-                image = pygame.image.load(path).convert_alpha()
-                
-                if scale:
-                    image = pygame.transform.scale(image, scale)
+                if self.cache is not None:
+                    image = self.cache.load_image(path, scale)
+                else:
+                    image = pygame.image.load(path).convert_alpha()
+                    
+                    if scale:
+                        image = pygame.transform.scale(image, scale)
                 
                 self.images[name] = image
                 return True
@@ -42,6 +70,53 @@ class AssetLoader:
             print(f"Error loading image {path}: {e}")
             return False
     
+    def load_atlas(self, manifest_path, verify_sources=True):
+        """
+        Load the pages of an atlas built by src.utils.sprite_atlas
+        
+        The atlas sprites are registered rather than created: load(name)
+        serves each one as a subsurface of its page, so all sprites share the
+        pages' pixel memory and unloading a sprite costs nothing to undo.
+        
+        Args:
+            manifest_path (str): Path to the atlas manifest
+            verify_sources (bool): Skip sprites whose source PNG has changed
+                since the atlas was built
+            
+        Returns:
+            list: Names of the sprites the atlas serves
+        """
+        try:
+            with open(manifest_path, encoding="utf-8") as file:
+                manifest = json.load(file)
+            if manifest.get("format") != ATLAS_FORMAT:
+                print(f"Unsupported atlas format in {manifest_path}")
+                return []
+            
+            atlas_dir = os.path.dirname(manifest_path)
+            pages = [self.load_page(os.path.join(atlas_dir, page)) for page in manifest["pages"]]
+        except (OSError, ValueError, KeyError, pygame.error) as e:
+            print(f"Error loading atlas {manifest_path}: {e}")
+            return []
+        
+        loaded = []
+        for name, sprite in manifest["sprites"].items():
+            if verify_sources:
+                source = os.path.join(atlas_dir, sprite["source"])
+                if not os.path.exists(source) or file_digest(source) != sprite["sha1"]:
+                    continue
+            self.atlas_sprites[name] = (len(self.atlas_pages) + sprite["page"], pygame.Rect(sprite["rect"]))
+            loaded.append(name)
+        
+        self.atlas_pages.extend(pages)
+        return loaded
+    
+    def load_page(self, path):
+        """Load an atlas page, through the cache if there is one"""
+        if self.cache is not None:
+            return self.cache.load_image(path)
+        return pygame.image.load(path).convert_alpha()
+    
     def load_sound(self, name, path):
         """
         Load a sound asset
@@ -55,7 +130,10 @@ class AssetLoader:
         """
         try:
             if os.path.exists(path):
-                sound = pygame.mixer.Sound(path)
+                if self.cache is not None:
+                    sound = self.cache.load_sound(path)
+                else:
+                    sound = pygame.mixer.Sound(path)
                 self.sounds[name] = sound
                 return True
             else:
@@ -65,6 +143,164 @@ class AssetLoader:
             print(f"Error loading sound {path}: {e}")
             return False
     
+    def register_image(self, name, path, scale=None):
+        """
+        Declare an image that load(name) will read, without reading it yet
+        
+        Args:
+            name (str): Reference name for the image
+            path (str): File path to the image
+            scale (tuple, optional): Width and height to scale the image to
+        """
+        self.specs[name] = ("image", path, scale)
+    
+    def register_sound(self, name, path):
+        """
+        Declare a sound that load(name) will read, without reading it yet
+        
+        Args:
+            name (str): Reference name for the sound
+            path (str): File path to the sound
+        """
+        self.specs[name] = ("sound", path, None)
+    
+    def is_registered(self, name):
+        """Whether load(name) knows where to find an asset"""
+        return name in self.specs or name in self.atlas_sprites
+    
+    def is_loaded(self, name):
+        """Whether an asset is currently in memory"""
+        return name in self.images or name in self.sounds
+    
+    def load(self, name):
+        """
+        Load a registered asset if it is not in memory yet
+        
+        Atlas sprites take precedence over their registered image file. An
+        asset whose file fails to load is remembered and not retried.
+        
+        Args:
+            name (str): Name of the asset
+            
+        Returns:
+            bool: Whether the asset is loaded
+        """
+        if self.is_loaded(name):
+            return True
+        if name in self.missing:
+            return False
+        
+        if name in self.atlas_sprites:
+            page, rect = self.atlas_sprites[name]
+            self.images[name] = self.atlas_pages[page].subsurface(rect)
+            return True
+        
+        spec = self.specs.get(name)
+        if spec is None:
+            print(f"Unknown asset: {name}")
+            loaded = False
+        elif spec[0] == "image":
+            loaded = self.load_image(name, spec[1], spec[2])
+        else:
+            loaded = self.load_sound(name, spec[1])
+        
+        if not loaded:
+            self.missing.add(name)
+        return loaded
+    
+    def start_batch(self, names):
+        """
+        Start loading several registered assets at once
+        
+        Args:
+            names (iterable): Names of the assets
+            
+        Returns:
+            AssetBatch: The batch; poll() or wait() it to completion
+        """
+        return AssetBatch(self, names, self.workers)
+    
+    def load_batch(self, names):
+        """
+        Load several registered assets, decoding them in parallel
+        
+        Args:
+            names (iterable): Names of the assets
+        """
+        self.start_batch(names).wait()
+    
+    def decode(self, name):
+        """
+        Decode a registered image or sound file, on a worker thread
+        
+        Images are decoded and scaled but not converted for the display;
+        finish_decode does that on the main thread.
+        
+        Args:
+            name (str): Name of the asset
+            
+        Returns:
+            pygame.Surface or pygame.mixer.Sound: The decoded asset
+        """
+        kind, path, scale = self.specs[name]
+        if kind == "sound":
+            return self.cache.load_sound(path) if self.cache is not None else pygame.mixer.Sound(path)
+        if self.cache is not None:
+            return self.cache.decode_image(path, scale)
+        image = pygame.image.load(path)
+        if scale:
+            image = pygame.transform.scale(image, scale)
+        return image
+    
+    def finish_decode(self, name, future):
+        """
+        Store the result of a decode() that ran on a worker thread
+        
+        Args:
+            name (str): Name of the asset
+            future (Future): Finished decode() call
+            
+        Returns:
+            bool: Whether the asset was loaded
+        """
+        kind, path, scale = self.specs[name]
+        try:
+            asset = future.result()
+        except (OSError, pygame.error) as e:
+            if not os.path.exists(path):
+                print(f"{kind.capitalize()} file not found: {path}")
+            else:
+                print(f"Error loading {kind} {path}: {e}")
+            self.missing.add(name)
+            return False
+        
+        if kind == "image":
+            self.images[name] = asset.convert_alpha()
+        else:
+            self.sounds[name] = asset
+        return True
+    
+    def unload(self, name):
+        """
+        Release a loaded asset; it can be loaded again by name later
+        
+        Args:
+            name (str): Name of the asset
+        """
+        self.images.pop(name, None)
+        self.sounds.pop(name, None)
+        for descriptor in [descriptor for descriptor in self.variants if descriptor[0] == name]:
+            self.drop_variant(descriptor)
+    
+    def loaded_assets(self):
+        """
+        Get the names of the registered assets that are in memory
+        
+        Returns:
+            list: Asset names
+        """
+        return [name for name in (*self.images, *self.sounds) if self.is_registered(name)]
+    
     def load_font(self, name, path, size):
         """
         Load a font asset
@@ -103,6 +339,61 @@ class AssetLoader:
         """
         return self.images.get(name)
     
+    def get_variant(self, name, flip_x=False, flip_y=False, angle=0, scale=None, tint=None):
+        """
+        Get a transformed version of a loaded image, building it on first use
+        
+        The transforms are applied in the order scale, rotate, flip, tint.
+        Variants are kept until their pixel data would exceed variant_budget,
+        least recently used first, and are rebuilt if the source image was
+        reloaded. Like the images, variants are shared and must not be drawn on.
+        
+        Args:
+            name (str): Name of the source image
+            flip_x (bool): Mirror horizontally
+            flip_y (bool): Mirror vertically
+            angle (float): Counterclockwise rotation in degrees
+            scale (tuple, optional): Width and height to scale to
+            tint (tuple, optional): RGB color the pixels are multiplied by
+            
+        Returns:
+            pygame.Surface: The variant, or None if the image is not loaded
+        """
+        image = self.images.get(name)
+        if image is None or not (flip_x or flip_y or angle % 360 or scale or tint):
+            return image
+        
+        descriptor = (name, flip_x, flip_y, angle % 360, scale, tint)
+        entry = self.variants.get(descriptor)
+        if entry is not None and entry[0] is image:
+            self.variants.move_to_end(descriptor)
+            return entry[1]
+        
+        variant = image
+        if scale:
+            variant = pygame.transform.scale(variant, scale)
+        if angle % 360:
+            variant = pygame.transform.rotate(variant, angle)
+        if flip_x or flip_y:
+            variant = pygame.transform.flip(variant, flip_x, flip_y)
+        if tint:
+            variant = variant.copy()
+            variant.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+        
+        # Store it, then evict the oldest variants over the budget (never the new one)
+        if entry is not None:
+            self.drop_variant(descriptor)
+        size = variant.get_width() * variant.get_height() * variant.get_bytesize()
+        self.variants[descriptor] = (image, variant, size)
+        self.variant_bytes += size
+        while self.variant_bytes > self.variant_budget and len(self.variants) > 1:
+            self.drop_variant(next(iter(self.variants)))
+        return variant
+    
+    def drop_variant(self, descriptor):
+        """Remove a variant from the cache"""
+        self.variant_bytes -= self.variants.pop(descriptor)[2]
+    
     def get_sound(self, name):
         """
         Get a loaded sound by name
@@ -125,4 +416,88 @@ class AssetLoader:
         Returns:
             pygame.font.Font: The requested font, or None if not found
         """
-        return self.fonts.get(name)
\ No newline at end of file
+        return self.fonts.get(name)
+
+class AssetBatch:
+    """
+    Registered assets being loaded together
+    
+    Image and sound files are decoded (and images scaled) on a thread pool,
+    where pygame releases the GIL, so decodes run across cores. Finished
+    images still have to be converted for the display on the main thread,
+    which poll() does. Atlas sprites, and every asset when the batch has a
+    single worker (the web build has no threads), are loaded by poll() itself.
+    """
+    
+    def __init__(self, loader, names, workers):
+        """
+        Initialize the batch and submit its decodes
+        
+        Args:
+            loader (AssetLoader): Loader the assets are registered with
+            names (iterable): Names of the assets
+            workers (int): Decoding threads; 1 loads everything in poll()
+        """
+        self.loader = loader
+        names = [name for name in dict.fromkeys(names) if not loader.is_loaded(name) and name not in loader.missing]
+        self.total = len(names)
+        self.completed = 0
+        
+        # Files to decode go to the pool; anything else is loaded in poll()
+        self.executor = None
+        self.futures = []
+        self.pending = names
+        decodable = [name for name in names if name in loader.specs and name not in loader.atlas_sprites]
+        if workers > 1 and decodable:
+            self.executor = ThreadPoolExecutor(min(workers, len(decodable)), thread_name_prefix="asset-decode")
+            self.futures = [(name, self.executor.submit(loader.decode, name)) for name in decodable]
+            decoded = set(decodable)
+            self.pending = [name for name in names if name not in decoded]
+    
+    @property
+    def progress(self):
+        """Fraction of the batch that is loaded, from 0.0 to 1.0"""
+        return self.completed / self.total if self.total else 1.0
+    
+    @property
+    def done(self):
+        """Whether every asset of the batch has been loaded or has failed"""
+        return self.completed == self.total
+    
+    def poll(self, deadline=None):
+        """
+        Store finished decodes and load assets that are not decoded on the pool
+        
+        Never waits for a worker. Assets loaded on the main thread are loaded
+        one at a time until the deadline passes, at least one per call.
+        
+        Args:
+            deadline (float, optional): time.perf_counter() value to stop at
+            
+        Returns:
+            bool: Whether the batch is done
+        """
+        while self.pending:
+            self.loader.load(self.pending.pop(0))
+            self.completed += 1
+            if self.executor is None and (deadline is None or time.perf_counter() >= deadline):
+                break
+        
+        running = []
+        for name, future in self.futures:
+            if future.done():
+                self.loader.finish_decode(name, future)
+                self.completed += 1
+            else:
+                running.append((name, future))
+        self.futures = running
+        
+        if self.done and self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        return self.done
+    
+    def wait(self):
+        """Load the whole batch, blocking until the last decode is stored"""
+        while not self.poll(float("inf")):
+            wait([future for _, future in self.futures], return_when=FIRST_COMPLETED)
\ No newline at end of file
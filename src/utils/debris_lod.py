@@ -0,0 +1,55 @@
+"""
+Debris LOD module - Optional level of detail for piled-up storm debris
+
+Off by default (Config.DEBRIS_CULLING): skipping debris makes sprites pop in
+and out as they cross grid cells, so it is a trade of picture for frame time
+on machines that cannot draw every entity, not part of the pool's contract.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # The web build has no NumPy
+    np = None
+
+def topmost_debris(pool, cell_size, alpha=1.0):
+    """
+    Get the slots worth drawing when debris piles up
+    
+    Non-collectible entities whose top-left corners fall in the same cell of
+    a cell_size grid mostly cover each other, so only the one drawn last in
+    each cell is kept (groups are drawn in type code order, slot order
+    within a group). The number drawn is then bounded by the number of cells
+    on screen. Collectible entities are always kept.
+    
+    Args:
+        pool (FallingEntityPool): Pool holding the entities
+        cell_size (int): Side of the grid cells in pixels
+        alpha (float): Fraction of the last step to show, see FallingEntityPool.positions()
+    
+    Returns:
+        list or numpy.ndarray: Kept slots in ascending order, for FallingEntityPool.positions_by_type()
+    """
+    n = pool.count
+    xs, ys = pool.interpolate(alpha)
+    if pool.numpy:
+        collectible = pool.collectible[:n]
+        debris = np.flatnonzero(~collectible)
+        debris = debris[np.argsort(pool.types[debris], kind="stable")]
+        cells = (ys[debris] // cell_size).astype(np.int64) * 65536 + xs[debris] // cell_size
+        
+        # First occurrence in reverse order is the last one drawn in the cell
+        _, last = np.unique(cells[::-1], return_index=True)
+        kept = np.concatenate((np.flatnonzero(collectible), debris[len(debris) - 1 - last]))
+        kept.sort()
+        return kept
+    
+    top = {}
+    kept = []
+    for index in sorted(range(n), key=pool.types.__getitem__):
+        if pool.collectible[index]:
+            kept.append(index)
+        else:
+            top[(ys[index] // cell_size, xs[index] // cell_size)] = index
+    kept.extend(top.values())
+    kept.sort()
+    return kept
\ No newline at end of file
@@ -0,0 +1,293 @@
+"""
+Event Log module - Level-gated structured event log kept in a ring buffer
+
+Records are (sequence, time in ms, subsystem, level, event, fields) tuples
+stored in a fixed-size buffer that overwrites its oldest entries, so logging
+never grows memory or writes to stdout (which is slow under pygbag, where it
+ends up in the browser console). The buffer is written out as JSON lines on
+demand with dump().
+
+Each subsystem gets a Logger from get_logger(). A call below the logger's
+level returns after one integer comparison; hot paths that would build
+expensive fields first check the logger's debug_enabled/info_enabled flags.
+"""
+
+import json
+import time
+
+# Levels
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: "debug", INFO: "info", WARNING: "warning", ERROR: "error", OFF: "off"}
+LEVELS = {name: level for level, name in LEVEL_NAMES.items()}
+
+def parse_level(level):
+    """
+    Convert a level name or number to a level number
+    
+    Args:
+        level (str or int): Level name ("debug", "info", ...) or number
+        
+    Returns:
+        int: Level number
+    """
+    if isinstance(level, int):
+        return level
+    try:
+        return LEVELS[level.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown log level: {level}") from None
+
+def parse_levels(text):
+    """
+    Parse per-subsystem levels written as 'default=warning,mfu=debug'
+    
+    Args:
+        text (str): Comma-separated subsystem=level pairs
+        
+    Returns:
+        dict: Subsystem -> level name
+    """
+    levels = {}
+    for pair in text.split(","):
+        if pair.strip():
+            subsystem, _, level = pair.partition("=")
+            levels[subsystem.strip()] = level.strip()
+    return levels
+
+class Logger:
+    """Entry point of one subsystem into an EventLog"""
+    
+    def __init__(self, log, subsystem, level):
+        """
+        Initialize a logger
+        
+        Args:
+            log (EventLog): Log that stores the records
+            subsystem (str): Subsystem name stored with every record
+            level (int): Minimum level that is recorded
+        """
+        self.log = log
+        self.subsystem = subsystem
+        self.set_level(level)
+    
+    def set_level(self, level):
+        """
+        Change the minimum recorded level
+        
+        Args:
+            level (int): Minimum level that is recorded
+        """
+        self.level = level
+        self.debug_enabled = level <= DEBUG
+        self.info_enabled = level <= INFO
+    
+    def debug(self, event, **fields):
+        """Record a debug event"""
+        if self.level <= DEBUG:
+            self.log.record(self.subsystem, DEBUG, event, fields)
+    
+    def info(self, event, **fields):
+        """Record an info event"""
+        if self.level <= INFO:
+            self.log.record(self.subsystem, INFO, event, fields)
+    
+    def warning(self, event, **fields):
+        """Record a warning event"""
+        if self.level <= WARNING:
+            self.log.record(self.subsystem, WARNING, event, fields)
+    
+    def error(self, event, **fields):
+        """Record an error event"""
+        if self.level <= ERROR:
+            self.log.record(self.subsystem, ERROR, event, fields)
+
+class EventLog:
+    """Fixed-capacity ring buffer of structured events"""
+    
+    def __init__(self, capacity=2048, default_level=INFO, echo=False):
+        """
+        Initialize the event log
+        
+        Args:
+            capacity (int): Number of records kept; older records are overwritten
+            default_level (int): Level of subsystems without an explicit level
+            echo (bool): Also print every stored record to stdout
+        """
+        self.loggers = {}
+        self.levels = {}
+        self.default_level = default_level
+        self.echo = echo
+        self.start_time = time.perf_counter()
+        self.resize(capacity)
+    
+    def resize(self, capacity):
+        """
+        Set the capacity of the ring buffer, discarding stored records
+        
+        Args:
+            capacity (int): Number of records kept
+        """
+        if capacity <= 0:
+            raise ValueError(f"Event log capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.buffer = [None] * capacity
+        self.next_index = 0
+        self.sequence = 0
+    
+    def get_logger(self, subsystem):
+        """
+        Get the logger of a subsystem, creating it on first use
+        
+        Args:
+            subsystem (str): Subsystem name
+            
+        Returns:
+            Logger: Logger of the subsystem
+        """
+        logger = self.loggers.get(subsystem)
+        if logger is None:
+            logger = Logger(self, subsystem, self.levels.get(subsystem, self.default_level))
+            self.loggers[subsystem] = logger
+        return logger
+    
+    def set_level(self, subsystem, level):
+        """
+        Set the level of one subsystem, or of all defaults with "default"
+        
+        Args:
+            subsystem (str): Subsystem name, or "default"
+            level (str or int): Level name or number
+        """
+        level = parse_level(level)
+        if subsystem == "default":
+            self.default_level = level
+            for name, logger in self.loggers.items():
+                if name not in self.levels:
+                    logger.set_level(level)
+            return
+        
+        self.levels[subsystem] = level
+        if subsystem in self.loggers:
+            self.loggers[subsystem].set_level(level)
+    
+    def configure(self, levels=None, capacity=None, echo=None):
+        """
+        Apply settings, typically from Config
+        
+        Args:
+            levels (dict, optional): Subsystem (or "default") -> level
+            capacity (int, optional): New ring buffer capacity
+            echo (bool, optional): Whether records are also printed
+        """
+        if capacity is not None and capacity != self.capacity:
+            self.resize(capacity)
+        if echo is not None:
+            self.echo = echo
+        # Apply the default first so explicit subsystem levels win
+        levels = dict(levels or {})
+        if "default" in levels:
+            self.set_level("default", levels.pop("default"))
+        for subsystem, level in levels.items():
+            self.set_level(subsystem, level)
+    
+    def record(self, subsystem, level, event, fields):
+        """
+        Store a record, overwriting the oldest one if the buffer is full
+        
+        Args:
+            subsystem (str): Subsystem name
+            level (int): Level of the event
+            event (str): Event name
+            fields (dict): Event data; values should be JSON-serializable
+        """
+        entry = (
+            self.sequence,
+            (time.perf_counter() - self.start_time) * 1000.0,
+            subsystem,
+            level,
+            event,
+            fields
+        )
+        self.buffer[self.next_index] = entry
+        self.next_index = (self.next_index + 1) % self.capacity
+        self.sequence += 1
+        if self.echo:
+            print(self.format_record(entry))
+    
+    def records(self):
+        """
+        Get the stored records, oldest first
+        
+        Returns:
+            list: Record tuples
+        """
+        if self.sequence < self.capacity:
+            return self.buffer[:self.next_index]
+        return self.buffer[self.next_index:] + self.buffer[:self.next_index]
+    
+    def __len__(self):
+        return min(self.sequence, self.capacity)
+    
+    def clear(self):
+        """Discard all stored records"""
+        self.resize(self.capacity)
+    
+    def format_record(self, entry):
+        """
+        Format a record as one human-readable line
+        
+        Args:
+            entry (tuple): Record tuple
+            
+        Returns:
+            str: Formatted line
+        """
+        sequence, timestamp, subsystem, level, event, fields = entry
+        details = " ".join(f"{key}={value}" for key, value in fields.items())
+        return f"[{timestamp:10.1f}] {LEVEL_NAMES.get(level, level):<7} {subsystem}: {event} {details}".rstrip()
+    
+    def dump(self, path_or_file):
+        """
+        Write the stored records as JSON lines
+        
+        Args:
+            path_or_file (str or file): Destination path, or an open text file
+            
+        Returns:
+            int: Number of records written
+        """
+        if isinstance(path_or_file, str):
+            with open(path_or_file, "w", encoding="utf-8") as file:
+                return self.dump(file)
+        
+        entries = self.records()
+        for sequence, timestamp, subsystem, level, event, fields in entries:
+            path_or_file.write(json.dumps({
+                "seq": sequence,
+                "t_ms": round(timestamp, 3),
+                "subsystem": subsystem,
+                "level": LEVEL_NAMES.get(level, level),
+                "event": event,
+                "fields": fields
+            }, default=str) + "\n")
+        return len(entries)
+
+# Process-wide log used by all subsystems
+event_log = EventLog()
+
+def get_logger(subsystem):
+    """
+    Get a subsystem logger of the process-wide event log
+    
+    Args:
+        subsystem (str): Subsystem name
+        
+    Returns:
+        Logger: Logger of the subsystem
+    """
+    return event_log.get_logger(subsystem)
\ No newline at end of file
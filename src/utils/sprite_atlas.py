@@ -0,0 +1,174 @@
+"""
+Sprite Atlas module - Offline packing of the game's sprites into atlas pages
+
+Every sprite the game draws at a fixed size is loaded, scaled exactly as
+AssetLoader.load_image would scale it and packed into one or more PNG pages
+with a JSON manifest next to them. AssetLoader.load_atlas then serves the
+sprites as subsurfaces of the pages. Rebuild after changing a sprite:
+    python -m src.utils.sprite_atlas
+
+Manifest format:
+    {
+      "format": 1,
+      "pages": ["sprites_0.png", ...],
+      "sprites": {
+        "<name>": {"page": 0, "rect": [x, y, w, h], "source": "../images/...", "sha1": "..."}
+      }
+    }
+Sources are relative to the manifest's directory; a sprite whose source no
+longer matches its sha1 is ignored by the loader and loaded from the PNG.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pygame
+
+ATLAS_FORMAT = 1
+
+def sprite_specs(config):
+    """
+    List the sprites the game draws at a fixed size
+    
+    Args:
+        config (Config): Game configuration
+        
+    Returns:
+        list: (name, path, size) tuples, as passed to AssetLoader.load_image
+    """
+    specs = [("character", config.CHARACTER_IMAGE, (80, 120))]
+    
+    # Celebration frames
+    for i in range(1, 6):
+        specs.append((f"celebration_{i}", f"{config.IMAGES_DIR}/Character/celebracion_{i}.png", (80, 120)))
+    
+    # Resources
+    for resource_type, path in config.RESOURCE_IMAGES.items():
+        specs.append((f"resource_{resource_type}", path, (40, 40)))
+    
+    # Weapons in all states
+    for state, weapons in config.WEAPON_IMAGES.items():
+        for weapon_type, path in weapons.items():
+            specs.append((f"weapon_{weapon_type}_{state}", path, (80, 60)))
+    
+    # UI
+    specs.append(("clock_icon", config.CLOCK_ICON, (20, 20)))
+    return specs
+
+def file_digest(path):
+    """SHA-1 hex digest of a file's contents"""
+    with open(path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+def pack_shelves(sizes, page_size, padding=1):
+    """
+    Place rectangles on square pages, row by row (shelf packing)
+    
+    Rectangles are placed tallest first, left to right; a new shelf starts
+    when a row is full and a new page when a page is.
+    
+    Args:
+        sizes (list): (width, height) of each rectangle
+        page_size (int): Width and height of a page
+        padding (int): Empty pixels kept between rectangles
+        
+    Returns:
+        list: (page, x, y) of each rectangle, in input order
+    """
+    placements = [None] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0], i))
+    
+    page = 0
+    x = y = shelf_height = 0
+    for i in order:
+        width, height = sizes[i]
+        if width > page_size or height > page_size:
+            raise ValueError(f"Sprite of size {width}x{height} does not fit a {page_size}px atlas page")
+        if x + width > page_size:
+            # Start a new shelf
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        if y + height > page_size:
+            # Start a new page
+            page += 1
+            x = y = shelf_height = 0
+        placements[i] = (page, x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return placements
+
+def build_atlas(specs, output_dir, page_size=512, padding=1, name="sprites"):
+    """
+    Build atlas pages and their manifest
+    
+    Args:
+        specs (list): (name, path, size) tuples from sprite_specs
+        output_dir (str): Directory for the pages and the manifest
+        page_size (int): Width and height of each page
+        padding (int): Empty pixels between sprites
+        name (str): Base name of the page and manifest files
+        
+    Returns:
+        dict: The manifest that was written
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Load and scale like AssetLoader.load_image; missing sources are skipped
+    sprites = []
+    for sprite_name, path, size in specs:
+        if not os.path.exists(path):
+            print(f"Skipping missing sprite {sprite_name}: {path}")
+            continue
+        image = pygame.image.load(path).convert_alpha()
+        if size:
+            image = pygame.transform.scale(image, size)
+        sprites.append((sprite_name, path, image))
+    
+    placements = pack_shelves([image.get_size() for _, _, image in sprites], page_size, padding)
+    page_count = max((page for page, _, _ in placements), default=-1) + 1
+    pages = [pygame.Surface((page_size, page_size), pygame.SRCALPHA) for _ in range(page_count)]
+    
+    manifest = {"format": ATLAS_FORMAT, "pages": [], "sprites": {}}
+    for (sprite_name, path, image), (page, x, y) in zip(sprites, placements):
+        pages[page].blit(image, (x, y))
+        manifest["sprites"][sprite_name] = {
+            "page": page,
+            "rect": [x, y, image.get_width(), image.get_height()],
+            "source": os.path.relpath(path, output_dir).replace(os.sep, "/"),
+            "sha1": file_digest(path)
+        }
+    
+    for index, page_surface in enumerate(pages):
+        page_file = f"{name}_{index}.png"
+        pygame.image.save(page_surface, os.path.join(output_dir, page_file))
+        manifest["pages"].append(page_file)
+    
+    with open(os.path.join(output_dir, f"{name}.json"), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True, ensure_ascii=False)
+        file.write("\n")
+    return manifest
+
+def main():
+    """Build the sprite atlas from the command line"""
+    from src.core.config import Config
+    
+    parser = argparse.ArgumentParser(description="Pack the game's sprites into atlas pages")
+    parser.add_argument("--output", help="output directory (default: Config.ATLAS_DIR)")
+    parser.add_argument("--page-size", type=int, default=512, help="width and height of each page")
+    parser.add_argument("--padding", type=int, default=1, help="empty pixels between sprites")
+    args = parser.parse_args()
+    
+    # convert_alpha() needs a display; a hidden dummy one is enough
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    
+    config = Config()
+    output_dir = args.output or config.ATLAS_DIR
+    manifest = build_atlas(sprite_specs(config), output_dir, args.page_size, args.padding)
+    print(f"Packed {len(manifest['sprites'])} sprites into {len(manifest['pages'])} page(s) in {output_dir}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+Static Layer module - Cached composition of a scene's unchanging layers
+"""
+
+import pygame
+
+class StaticLayer:
+    """
+    Off-screen surface holding pre-composed static layers
+    
+    The owner describes what the static layers depend on with a key (for
+    example screen size and weapon states). The surface is rebuilt only when
+    the key changes or invalidate() is called; otherwise get() returns the
+    cached composition, which is drawn with a single blit.
+    """
+    
+    def __init__(self):
+        """Initialize an empty layer"""
+        self.surface = None
+        self.key = None
+        self.rebuilds = 0
+    
+    def get(self, key, size, build):
+        """
+        Get the composed layer, rebuilding it if its key changed
+        
+        Args:
+            key: Hashable description of everything the static layers show
+            size (tuple): Size of the layer surface
+            build (callable): Draws the static layers onto the surface it is given
+            
+        Returns:
+            pygame.Surface: The composed layer
+        """
+        key = (tuple(size), key)
+        if self.surface is None or key != self.key:
+            if self.surface is None or self.surface.get_size() != tuple(size):
+                self.surface = pygame.Surface(size)
+                if pygame.display.get_surface() is not None:
+                    self.surface = self.surface.convert()
+            self.surface.fill((0, 0, 0))
+            build(self.surface)
+            self.key = key
+            self.rebuilds += 1
+        return self.surface
+    
+    def invalidate(self):
+        """Force a rebuild on the next get()"""
+        self.key = None
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Text Cache module - Bounded LRU cache of rendered text surfaces
+"""
+
+from collections import OrderedDict
+
+class TextCache:
+    """
+    Caches the surfaces produced by Font.render
+    
+    Entries are keyed by (font, text, color, antialias, background), so a
+    string drawn every frame is rasterized once and then costs a dictionary
+    lookup. The least recently used entry is dropped once the cache holds
+    `capacity` surfaces, which keeps changing text such as timers bounded.
+    
+    Cached surfaces are shared between callers and must not be drawn on.
+    """
+    
+    def __init__(self, capacity=256):
+        """
+        Initialize the cache
+        
+        Args:
+            capacity (int): Maximum number of cached surfaces
+        """
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, font, text, color, antialias=True, background=None):
+        """
+        Render text, reusing a cached surface when possible
+        
+        Args:
+            font (pygame.font.Font): Font to render with
+            text (str): Text to render
+            color (tuple): Text color
+            antialias (bool): Whether to antialias the glyphs
+            background (tuple, optional): Background color
+            
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        key = (font, text, tuple(color), antialias, background)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+    
+    def __len__(self):
+        return len(self.surfaces)
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+Aging and heap tests - Property checks over random operation sequences
+
+Lazy aging must leave every inventory exactly as eager aging would, and the
+MFU heap must always name the same victim as the linear scan it replaced.
+"""
+
+import random
+import pytest
+from src.core.mfu_algorithm import MFUAlgorithm
+from src.core.replacement_policies import POLICIES
+from src.core.resource_manager import ResourceManager
+
+RESOURCE_TYPES = ("nut", "circuit", "cell", "core")
+SEEDS = range(20)
+
+def random_operations(seed, length=400):
+    """
+    Generate a random sequence of inventory operations
+    
+    Args:
+        seed (int): Seed of the sequence
+        length (int): Number of operations
+    
+    Returns:
+        list: (operation, argument) tuples, with operation one of "add",
+            "use", "consume" and "age"
+    """
+    rng = random.Random(seed)
+    operations = []
+    for _ in range(length):
+        roll = rng.random()
+        if roll < 0.45:
+            operations.append(("add", rng.choice(RESOURCE_TYPES)))
+        elif roll < 0.75:
+            operations.append(("use", (rng.choice(RESOURCE_TYPES), rng.randint(1, 3))))
+        elif roll < 0.9:
+            requirements = {
+                resource_type: rng.randint(1, 2)
+                for resource_type in rng.sample(RESOURCE_TYPES, rng.randint(1, 3))
+            }
+            operations.append(("consume", requirements))
+        else:
+            operations.append(("age", None))
+    return operations
+
+def apply_operation(manager, operation, argument):
+    """
+    Apply one generated operation to a manager
+    
+    Returns:
+        tuple: What the operation reported, with replaced resources reduced to (type, counter)
+    """
+    if operation == "add":
+        success, replaced, damage = manager.add_resource(argument)
+        if replaced is not None:
+            replaced = (replaced.type, replaced.counter)
+        return success, replaced, damage
+    if operation == "use":
+        return manager.use_resource(*argument)
+    if operation == "consume":
+        return manager.consume_resources(argument)
+    manager.apply_aging()
+    return None
+
+def snapshot(manager):
+    """Get the (type, counter) pairs of an inventory, in slot order"""
+    return [(resource.type, resource.counter) for resource in manager.inventory]
+
+@pytest.mark.parametrize("policy", sorted(POLICIES))
+@pytest.mark.parametrize("seed", SEEDS)
+def test_lazy_aging_matches_eager_aging(policy, seed):
+    """Lazy and eager managers report and store the same thing after every operation"""
+    eager = ResourceManager(inventory_size=6, policy=policy)
+    lazy = ResourceManager(inventory_size=6, policy=policy, lazy_aging=True)
+    
+    for step, (operation, argument) in enumerate(random_operations(seed)):
+        eager_result = apply_operation(eager, operation, argument)
+        lazy_result = apply_operation(lazy, operation, argument)
+        assert lazy_result == eager_result, f"step {step}: {operation} {argument}"
+        assert snapshot(lazy) == snapshot(eager), f"step {step}: {operation} {argument}"
+
+@pytest.mark.parametrize("lazy_aging", [False, True])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_heap_victim_matches_linear_scan(lazy_aging, seed):
+    """The heap names the slot the linear MFU scan picks before every eviction"""
+    manager = ResourceManager(inventory_size=6, lazy_aging=lazy_aging)
+    scan = MFUAlgorithm()
+    evictions = 0
+    
+    for step, (operation, argument) in enumerate(random_operations(seed)):
+        if operation == "add" and len(manager.inventory) == manager.inventory_size:
+            expected = scan.get_replacement_index(manager.inventory)
+            expected_resource = manager.inventory[expected]
+            assert manager.get_victim_index(argument) == expected, f"step {step}"
+            _, replaced, _ = manager.add_resource(argument)
+            assert replaced is expected_resource, f"step {step}"
+            evictions += 1
+            continue
+        apply_operation(manager, operation, argument)
+    
+    assert evictions > 0
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_heap_victim_matches_linear_scan_for_aging_lfu(seed):
+    """The min-heap of aging LFU names the first slot with the lowest counter"""
+    manager = ResourceManager(inventory_size=6, policy="aging_lfu")
+    
+    for step, (operation, argument) in enumerate(random_operations(seed)):
+        if operation == "add" and len(manager.inventory) == manager.inventory_size:
+            counters = [resource.counter for resource in manager.inventory]
+            assert manager.get_victim_index(argument) == counters.index(min(counters)), f"step {step}"
+        apply_operation(manager, operation, argument)
\ No newline at end of file
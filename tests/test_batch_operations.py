@@ -0,0 +1,94 @@
+"""
+Batch operation tests - add_resources and use_resources against single-item loops
+"""
+
+import random
+import pytest
+from src.core.compact_resource_manager import CompactResourceManager
+from src.core.replacement_policies import POLICIES
+from src.core.resource_manager import ResourceManager
+
+RESOURCE_TYPES = ("nut", "circuit", "cell", "core")
+
+# (label, factory) of every manager the batch methods must agree on
+MANAGERS = [
+    (f"objects-{policy}-{'lazy' if lazy_aging else 'eager'}",
+     lambda size, policy=policy, lazy_aging=lazy_aging: ResourceManager(size, lazy_aging=lazy_aging, policy=policy))
+    for policy in sorted(POLICIES)
+    for lazy_aging in (False, True)
+] + [("compact", lambda size: CompactResourceManager(size))]
+
+def add_one_by_one(manager, resource_types):
+    """
+    Add resources with add_resource and report them the way add_resources does
+    
+    Returns:
+        tuple: (replaced_slots, replaced_counters, toxic_damage) as lists and an int
+    """
+    replaced_slots = []
+    replaced_counters = []
+    toxic_damage = 0
+    for resource_type in resource_types:
+        # The compact victim is stateless; object slots change identity when replaced
+        compact_victim = manager.get_victim_index() if isinstance(manager, CompactResourceManager) else None
+        before = list(manager.inventory)
+        _, replaced, damage = manager.add_resource(resource_type)
+        toxic_damage += damage
+        if replaced is None:
+            replaced_slots.append(-1)
+            replaced_counters.append(-1)
+            continue
+        
+        if compact_victim is not None:
+            replaced_slots.append(compact_victim)
+        else:
+            replaced_slots.append(next(index for index, resource in enumerate(before) if resource is replaced))
+        replaced_counters.append(replaced.counter)
+    return replaced_slots, replaced_counters, toxic_damage
+
+def snapshot(manager):
+    """Get the (type, counter) pairs of an inventory, in slot order"""
+    return [(resource.type, resource.counter) for resource in manager.inventory]
+
+@pytest.mark.parametrize("size", [1, 6, 17])
+@pytest.mark.parametrize("label,factory", MANAGERS, ids=[label for label, _ in MANAGERS])
+@pytest.mark.parametrize("seed", range(6))
+def test_batches_match_single_item_loops(label, factory, size, seed):
+    """Interleaved add and use batches report and store what the single-item calls would"""
+    batched = factory(size)
+    single = factory(size)
+    rng = random.Random(seed)
+    
+    for step in range(150):
+        roll = rng.random()
+        if roll < 0.45:
+            resource_types = [rng.choice(RESOURCE_TYPES) for _ in range(rng.randint(0, 2 * size + 3))]
+            slots, counters, damage = batched.add_resources(resource_types)
+            expected = add_one_by_one(single, resource_types)
+            assert (list(slots), list(counters), damage) == expected, f"step {step}"
+        elif roll < 0.9:
+            requirements = {
+                resource_type: rng.randint(1, 3)
+                for resource_type in rng.sample(RESOURCE_TYPES, rng.randint(1, 4))
+            }
+            results = batched.use_resources(requirements)
+            expected = [
+                single.use_resource(resource_type, amount)
+                for resource_type, amount in requirements.items()
+            ]
+            assert list(results) == expected, f"step {step}"
+        else:
+            batched.apply_aging()
+            single.apply_aging()
+        assert snapshot(batched) == snapshot(single), f"step {step}"
+
+@pytest.mark.parametrize("label,factory", MANAGERS, ids=[label for label, _ in MANAGERS])
+def test_add_resources_accepts_iterators(label, factory):
+    """add_resources takes any iterable, including a one-shot generator"""
+    batched = factory(4)
+    single = factory(4)
+    resource_types = [RESOURCE_TYPES[i % 4] for i in range(10)]
+    
+    batched.add_resources(resource_type for resource_type in resource_types)
+    add_one_by_one(single, resource_types)
+    assert snapshot(batched) == snapshot(single)
\ No newline at end of file
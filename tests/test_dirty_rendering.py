@@ -0,0 +1,87 @@
+"""
+Dirty rendering tests - Skipped and partial draws against full redraws
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+from src.benchmarks.cases import create_game
+
+@pytest.fixture(scope="module")
+def game():
+    """A silent game with a display surface"""
+    game = create_game()
+    yield game
+    game.shutdown()
+
+def present(game, shadow):
+    """
+    Run one frame the way the main loop does, presenting into a shadow surface
+    
+    Returns:
+        bool: Whether the scene was drawn
+    """
+    scene_manager = game.scene_manager
+    drawn = scene_manager.draw(game.screen)
+    rects = scene_manager.take_dirty_rects()
+    if rects is None:
+        shadow.blit(game.screen, (0, 0))
+    else:
+        for rect in rects:
+            shadow.blit(game.screen, rect, rect)
+    return drawn
+
+def full_redraw(game):
+    """Draw the active scene from scratch onto a new surface"""
+    surface = pygame.Surface(game.screen.get_size())
+    game.scene_manager.active_scene.draw(surface)
+    return pygame.image.tobytes(surface, "RGB")
+
+def test_presented_frames_match_full_redraws(game):
+    """Whether a frame is skipped, partly presented or presented whole, the window shows the full redraw"""
+    scene_manager = game.scene_manager
+    shadow = pygame.Surface(game.screen.get_size())
+    skipped = 0
+    
+    for scene_id in ("workshop", "collection", "workshop"):
+        scene_manager.set_active_scene(scene_id)
+        scene = scene_manager.active_scene
+        for frame in range(60):
+            if scene_id == "workshop":
+                if frame == 10:
+                    game.apply_aging()
+                if frame == 20:
+                    scene.selected_weapon = scene.available_weapons[0]
+                if frame == 40:
+                    game.health -= 1
+            else:
+                if frame < 30 and frame % 5 == 0:
+                    scene.spawn_resource()
+                scene.moving_left = 15 <= frame < 25
+            if frame % 3 == 0:
+                scene_manager.update()
+            
+            if not present(game, shadow):
+                skipped += 1
+            expected = full_redraw(game)
+            assert pygame.image.tobytes(game.screen, "RGB") == expected, f"{scene_id} frame {frame}"
+            assert pygame.image.tobytes(shadow, "RGB") == expected, f"{scene_id} frame {frame}"
+    
+    assert skipped > 0
+
+def test_static_frame_is_not_drawn(game):
+    """Once a frame has been presented, the same picture is not drawn again"""
+    scene_manager = game.scene_manager
+    scene_manager.set_active_scene("workshop")
+    shadow = pygame.Surface(game.screen.get_size())
+    
+    assert present(game, shadow)
+    assert not present(game, shadow)
+    
+    # Invalidating (window exposed, overlay toggled) forces the next draw
+    scene_manager.invalidate()
+    assert present(game, shadow)
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Falling pool tests - Grouped positions and debris culling, NumPy against the plain loop
+"""
+
+import random
+import pytest
+from src.entities.falling_pool import FallingEntityPool
+from src.utils.debris_lod import topmost_debris
+
+pytest.importorskip("numpy")
+
+TYPE_NAMES = ["nut", "circuit", "cell", "core"]
+
+def make_pools(seed, count=2000):
+    """
+    Fill a NumPy pool and a plain pool with the same random entities
+    
+    Returns:
+        tuple: (numpy_pool, loop_pool)
+    """
+    rng = random.Random(seed)
+    numpy_pool = FallingEntityPool(TYPE_NAMES)
+    loop_pool = FallingEntityPool(TYPE_NAMES, use_numpy=False)
+    for _ in range(count):
+        args = (rng.choice(TYPE_NAMES), rng.randint(0, 900), rng.randint(-40, 600))
+        options = {"vx": rng.randint(-2, 2), "vy": rng.randint(3, 8), "collectible": rng.random() < 0.1}
+        numpy_pool.spawn(*args, **options)
+        loop_pool.spawn(*args, **options)
+    return numpy_pool, loop_pool
+
+@pytest.mark.parametrize("seed", range(4))
+def test_grouped_positions_match_slot_order(seed):
+    """Every entity is in its type's group, offset, in slot order; both storages agree"""
+    numpy_pool, loop_pool = make_pools(seed)
+    offsets = [(1, 2), (3, 4), (0, 0), (5, 6)]
+    
+    expected = [[] for _ in TYPE_NAMES]
+    for code, x, y in loop_pool.positions(0.5):
+        dx, dy = offsets[code]
+        expected[code].append((x + dx, y + dy))
+    assert loop_pool.positions_by_type(0.5, offsets=offsets) == expected
+    assert numpy_pool.positions_by_type(0.5, offsets=offsets) == expected
+
+@pytest.mark.parametrize("seed", range(4))
+def test_culling_keeps_collectibles_and_the_topmost_debris(seed):
+    """One debris entity per cell, the last one drawn, and every collectible entity"""
+    numpy_pool, loop_pool = make_pools(seed)
+    cell_size = 40
+    kept = topmost_debris(loop_pool, cell_size, 0.5)
+    assert topmost_debris(numpy_pool, cell_size, 0.5).tolist() == kept
+    
+    # Groups are drawn in type code order, slots in order within a group
+    xs, ys = loop_pool.interpolate(0.5)
+    top = {}
+    for index in sorted(range(loop_pool.count), key=lambda index: (loop_pool.types[index], index)):
+        if not loop_pool.collectible[index]:
+            top[(xs[index] // cell_size, ys[index] // cell_size)] = index
+    collectible = [index for index in range(loop_pool.count) if loop_pool.collectible[index]]
+    assert kept == sorted(collectible + list(top.values()))
\ No newline at end of file
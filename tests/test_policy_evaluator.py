@@ -0,0 +1,106 @@
+"""
+Policy evaluator tests - Offline optima against an exhaustive search
+"""
+
+import random
+import pytest
+from src.core.compact_resource_manager import CompactResourceManager
+from src.core.config import Config
+from src.core.operation_log import OperationLog
+from src.simulation.policy_evaluator import (
+    compare_policies, generate_session, optimal_missed_repairs, optimal_toxic_damage
+)
+
+SESSION_TYPES = [("nut",), ("nut", "circuit"), ("nut", "circuit", "cell")]
+
+def make_session(seed, resource_types, length=60):
+    """
+    Generate a short session of few adds and many small repairs, so
+    counters climb past the toxic threshold between evictions
+    
+    Returns:
+        list: Operations in OperationLog format
+    """
+    rng = random.Random(seed)
+    log = OperationLog()
+    for _ in range(length):
+        roll = rng.random()
+        if roll < 0.1:
+            log.record_add(rng.choice(resource_types))
+        elif roll < 0.9:
+            log.record_consume({rng.choice(resource_types): rng.randint(1, 2)})
+        elif roll < 0.95:
+            log.record_use(rng.choice(resource_types), 1)
+        else:
+            log.record_aging()
+    return log.operations
+
+def exhaustive_optima(operations, inventory_size):
+    """
+    Try every victim at every eviction
+    
+    Returns:
+        tuple: (least toxic damage, fewest missed repairs)
+    """
+    manager = CompactResourceManager(inventory_size)
+    best = [float("inf"), float("inf")]
+    
+    def explore(position, state, toxic_damage, missed_repairs):
+        if position == len(operations):
+            best[0] = min(best[0], toxic_damage)
+            best[1] = min(best[1], missed_repairs)
+            return
+        
+        operation = operations[position]
+        manager.set_state(state)
+        if operation[0] == OperationLog.ADD and len(state) // 2 == inventory_size:
+            for index in range(inventory_size):
+                manager.set_state(state)
+                damage = manager.counters[index] > manager.toxic_threshold
+                manager.types[index] = manager.get_type_code(operation[1])
+                manager.counters[index] = 0
+                explore(position + 1, manager.get_state(), toxic_damage + damage, missed_repairs)
+            return
+        
+        if operation[0] == OperationLog.ADD:
+            manager.add_resource(operation[1])
+        elif operation[0] == OperationLog.USE:
+            manager.use_resource(operation[1], operation[2])
+        elif operation[0] == OperationLog.CONSUME:
+            missed_repairs += not manager.consume_resources(operation[1])
+        else:
+            manager.apply_aging()
+        explore(position + 1, manager.get_state(), toxic_damage, missed_repairs)
+    
+    explore(0, b"", 0, 0)
+    return tuple(best)
+
+@pytest.mark.parametrize("resource_types", SESSION_TYPES)
+@pytest.mark.parametrize("seed", range(8))
+def test_optima_match_exhaustive_search(seed, resource_types):
+    """Both dynamic programs find the same optima as trying every victim"""
+    operations = make_session(seed, resource_types)
+    toxic_damage, missed_repairs = exhaustive_optima(operations, 2)
+    assert optimal_toxic_damage(operations, 2) == toxic_damage
+    assert optimal_missed_repairs(operations, 2) == missed_repairs
+    
+    # An upper bound that is already optimal leaves the result unchanged
+    assert optimal_toxic_damage(operations, 2, upper_bound=toxic_damage) == toxic_damage
+    assert optimal_missed_repairs(operations, 2, upper_bound=missed_repairs) == missed_repairs
+
+def test_some_sessions_force_toxic_damage():
+    """Even the optimum takes damage on some of the sessions above, so the toxic search is exercised"""
+    assert any(exhaustive_optima(make_session(seed, ("nut",)), 2)[0] > 0 for seed in range(8))
+
+def test_no_policy_beats_the_optima():
+    """Every gap to the optimum is non-negative"""
+    operations = generate_session(Config(), 1500, seed=3)
+    rows = compare_policies(operations, 3)
+    for row in rows:
+        assert row["toxic_damage_over_opt"] >= 0
+        assert row["missed_repairs_over_opt"] >= 0
+
+def test_toxic_search_gives_up_past_its_limit():
+    """A search that runs out of expansions reports an unknown optimum instead of a guess"""
+    operations = make_session(0, SESSION_TYPES[-1], length=200)
+    assert optimal_toxic_damage(operations, 4, max_expansions=100) is None
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Replacement policy tests - Bookkeeping of the stateful policies
+"""
+
+import random
+from collections import Counter
+import pytest
+from src.core.resource_manager import ResourceManager
+
+RESOURCE_TYPES = ("nut", "circuit", "cell", "core")
+
+@pytest.mark.parametrize("seed", range(10))
+def test_arc_ghost_hits_consume_the_ghost(seed):
+    """A ghost hit removes one ghost of the type, so the ghost lists and counts stay in step"""
+    manager = ResourceManager(inventory_size=6, policy="arc")
+    policy = manager.policy
+    rng = random.Random(seed)
+    targets = set()
+    
+    for _ in range(5000):
+        resource_type = rng.choice(RESOURCE_TYPES)
+        roll = rng.random()
+        if roll < 0.5:
+            full = len(manager.inventory) == manager.inventory_size
+            recent_hit = policy.recent_ghost_counts[resource_type] > 0
+            frequent_hit = policy.frequent_ghost_counts[resource_type] > 0
+            recent_ghosts = len(policy.recent_ghosts)
+            frequent_ghosts = len(policy.frequent_ghosts)
+            manager.add_resource(resource_type)
+            if full and (recent_hit or frequent_hit):
+                # One ghost consumed, at most one new ghost remembered
+                assert len(policy.recent_ghosts) + len(policy.frequent_ghosts) <= recent_ghosts + frequent_ghosts
+        elif roll < 0.9:
+            manager.use_resource(resource_type, 1)
+        else:
+            manager.apply_aging()
+        
+        assert +policy.recent_ghost_counts == Counter(policy.recent_ghosts)
+        assert +policy.frequent_ghost_counts == Counter(policy.frequent_ghosts)
+        assert len(policy.recent_ghosts) <= policy.capacity
+        assert len(policy.frequent_ghosts) <= policy.capacity
+        targets.add(policy.target)
+    
+    # The target keeps adapting instead of settling at one end
+    assert len(targets) > 2
\ No newline at end of file
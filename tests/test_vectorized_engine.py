@@ -0,0 +1,31 @@
+"""
+Vectorized engine tests - The NumPy engine against HeadlessGame, game by game
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.core.config import Config
+from src.simulation.headless_game import simulation_params
+from src.simulation.vectorized_engine import verify
+
+GAMES = 200
+STEPS = 600
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_verify_finds_no_mismatches(seed):
+    """Every game of the vectorized run ends exactly as its HeadlessGame does"""
+    params = simulation_params(Config())
+    assert verify(params, GAMES, STEPS, seed) == []
+
+@pytest.mark.parametrize("overrides", [
+    # Low thresholds, so that games take toxic damage
+    {"inventory_size": 4, "toxic_threshold": 8},
+    {"inventory_size": 3, "toxic_threshold": 4, "weapons_to_win": 50},
+    {"inventory_size": 8, "aging_interval": 1500, "catch_rate": 0.95}
+])
+def test_verify_finds_no_mismatches_with_other_balance(overrides):
+    """The engine follows the balance parameters, not just the defaults"""
+    params = simulation_params(Config(), **overrides)
+    assert verify(params, GAMES, STEPS, seed=7) == []
\ No newline at end of file